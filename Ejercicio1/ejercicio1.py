@@ -3,30 +3,10 @@ import numpy as np
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from main import simulate_planes, print_summary, minutos_a_hora
-# para mostrar barras de progreso
-from tqdm import tqdm as tqdm_ext
+from main import simulate_planes, print_summary, minutos_a_hora, descomponer_atrasos, TIEMPO_BASE_100NM
 
-# función que calcula el tiempo total de espera de un avión en estado 'rejoin'
-def get_plane_wait_time(plane):
-    # calcula el tiempo total en rejoin (espera)
-    if not hasattr(plane, 'positions') or not hasattr(plane, 'status'):
-        return 0
-    wait_time = 0
-    if hasattr(plane, 'rejoin_start_time') and hasattr(plane, 'landed_time'):
-        # si el avión fue a rejoin y luego aterrizó
-        wait_time = plane.landed_time - plane.rejoin_start_time
-    return max(wait_time, 0)
-
-# función que calcula el tiempo ideal de vuelo desde 100 millas náuticas (mn) hasta 0 mn, 
-# asumiendo que el avión vuela a la velocidad máxima permitida
-def get_ideal_flight_time():
-    # tiempo ideal desde 100 mn a 0 mn a velocidad máxima (500 nudos)
-    dist = 100
-    speed = 500
-    return dist / (speed / 60.0)  # minutos
-
-if __name__ == "__main__":
+# funcion principal: una simulacion de ejemplo y Monte Carlo de desvios
+def main():
     # simulación Monte Carlo básica - solo estadísticas
     print("Simulación Monte Carlo de aproximación de aeronaves")
     print("=" * 60)
@@ -50,6 +30,8 @@ if __name__ == "__main__":
     aterrizajes = []
     totales = []  # lista para almacenar el total de aviones por simulación
     aterrizajes_totales = []  # lista para almacenar el total de aviones aterrizados por simulación
+    # para mostrar barras de progreso
+    from tqdm import tqdm as tqdm_ext
     simulate_planes.use_tqdm = False
     for i in tqdm_ext(range(N), desc="Monte Carlo", unit="sim"):
         planes_mc, _ = simulate_planes(lambda_prob=lambda_prob_mc, total_minutes=total_minutes)
@@ -74,18 +56,14 @@ if __name__ == "__main__":
     print(f"Error estándar del porcentaje de desvíos: {100 * error_std:.2f}%")
     
     # después del resumen estadístico en el main
-    # calcular tiempos de espera y extra
-    wait_times = []
-    extra_times = []
-    ideal_time = get_ideal_flight_time()
-    for p in planes:
-        if p.status == 'landed':
-            appear = p.appear_time
-            landed = p.landed_time
-            total_time = landed - appear
-            wait = get_plane_wait_time(p)
-            wait_times.append(wait)
-            extra_times.append(total_time - ideal_time)
-    if wait_times:
-        print(f"\nPromedio tiempo de espera (rejoin): {np.mean(wait_times):.2f} min")
-        print(f"Promedio tiempo extra respecto al vuelo ideal: {np.mean(extra_times):.2f} min")
\ No newline at end of file
+    # descomposición de los atrasos contra el tiempo base desde 100 mn
+    atrasos = descomponer_atrasos(planes)
+    aterrizo = ~np.isnan(atrasos['atraso'])
+    if aterrizo.any():
+        print(f"\nTiempo base desde 100 mn: {TIEMPO_BASE_100NM:.1f} min")
+        print(f"Promedio tiempo de espera (rejoin): {atrasos['holding'][aterrizo].mean():.2f} min")
+        print(f"Promedio tiempo extra respecto al vuelo ideal: {atrasos['atraso'][aterrizo].mean():.2f} min")
+        print(f"  por congestión: {atrasos['congestion'][aterrizo].mean():.2f} min")
+
+if __name__ == "__main__":
+    main()
@@ -1,5 +1,4 @@
 # simulador interactivo del arribo de aviones a AEP
-import pygame
 import sys
 import random
 import numpy as np
@@ -11,12 +10,8 @@ from main import Plane, knots_to_nm_per_min, eta_minutes, MIN_SEPARATION_MIN, BU
 import math
 import os
 
-pygame.init()
-
 # Screen dimensions
 WIDTH, HEIGHT = 1200, 800
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Simulación de Tráfico Aéreo - ACN TP1")
 
 # Colors
 WHITE = (255, 255, 255)
@@ -30,28 +25,45 @@ GRAY = (128, 128, 128)
 ORANGE = (255, 165, 0)
 PURPLE = (128, 0, 128)
 
-# Fonts
-font_small = pygame.font.Font(None, 24)
-font_medium = pygame.font.Font(None, 32)
-font_large = pygame.font.Font(None, 48)
+# pygame y los recursos graficos (ventana, fuentes, imagen) se inicializan recien al ejecutar el simulador,
+# para que importar este modulo no abra una ventana
+pygame = None
+screen = None
+font_small = font_medium = font_large = None
+plane_image = None
+USE_IMAGE = False
+
+def _inicializar_pygame():
+    global pygame, screen, font_small, font_medium, font_large, plane_image, USE_IMAGE
+    import pygame as _pygame
+    pygame = _pygame
+    pygame.init()
+
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Simulación de Tráfico Aéreo - ACN TP1")
+
+    # Fonts
+    font_small = pygame.font.Font(None, 24)
+    font_medium = pygame.font.Font(None, 32)
+    font_large = pygame.font.Font(None, 48)
 
-# Cargar imagen del avión
-try:
-    # Obtener el directorio donde está este script
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    image_path = os.path.join(script_dir, "descarga.jpeg")
-    
-    plane_image = pygame.image.load(image_path)
-    # Redimensionar la imagen a un tamaño intermedio que funcione bien
-    plane_image = pygame.transform.scale(plane_image, (100, 60))
-    # Hacer el fondo transparente (opcional)
-    plane_image = plane_image.convert_alpha()
-    USE_IMAGE = True
-    print("✈️ Imagen del avión cargada correctamente")
-except Exception as e:
-    USE_IMAGE = False
-    print(f"⚠️ No se pudo cargar la imagen del avión: {e}")
-    print("Usando gráficos vectoriales como respaldo")
+    # Cargar imagen del avión
+    try:
+        # Obtener el directorio donde está este script
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        image_path = os.path.join(script_dir, "descarga.jpeg")
+
+        plane_image = pygame.image.load(image_path)
+        # Redimensionar la imagen a un tamaño intermedio que funcione bien
+        plane_image = pygame.transform.scale(plane_image, (100, 60))
+        # Hacer el fondo transparente (opcional)
+        plane_image = plane_image.convert_alpha()
+        USE_IMAGE = True
+        print("✈️ Imagen del avión cargada correctamente")
+    except Exception as e:
+        USE_IMAGE = False
+        print(f"⚠️ No se pudo cargar la imagen del avión: {e}")
+        print("Usando gráficos vectoriales como respaldo")
 
 # Airport layout
 AIRPORT_X = WIDTH - 150
@@ -432,59 +444,65 @@ class VisualSimulation:
             text = font_small.render(control, True, color)
             screen.blit(text, (20, controls_y + i * 20))
 
-# Inicializar simulación
-sim = VisualSimulation()
-clock = pygame.time.Clock()
+# funcion principal: abre la ventana y corre el loop del simulador interactivo
+def main():
+    _inicializar_pygame()
+    # Inicializar simulación
+    sim = VisualSimulation()
+    clock = pygame.time.Clock()
+
+    # Game loop principal
+    running = True
+    while running:
+        dt = clock.tick(60) / 1000.0  # Delta time en segundos
 
-# Game loop principal
-running = True
-while running:
-    dt = clock.tick(60) / 1000.0  # Delta time en segundos
-    
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-        elif event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE:
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
                 running = False
-            elif event.key == pygame.K_SPACE:
-                if not sim.simulation_running:
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    running = False
+                elif event.key == pygame.K_SPACE:
+                    if not sim.simulation_running:
+                        sim.start_simulation()
+                    else:
+                        sim.paused = not sim.paused
+                elif event.key == pygame.K_r:
                     sim.start_simulation()
-                else:
-                    sim.paused = not sim.paused
-            elif event.key == pygame.K_r:
-                sim.start_simulation()
-            elif event.key == pygame.K_UP or event.key == pygame.K_PLUS or event.key == pygame.K_KP_PLUS:
-                sim.time_speed = min(20, sim.time_speed + 1)
-            elif event.key == pygame.K_DOWN or event.key == pygame.K_MINUS or event.key == pygame.K_KP_MINUS:
-                sim.time_speed = max(0.1, sim.time_speed - 1)
-            elif event.key == pygame.K_l:
-                # Cambiar lambda entre 0.1, 0.15, 0.2, 0.25
-                lambdas = [0.1, 0.15, 0.2, 0.25]
-                current_idx = lambdas.index(sim.lambda_prob) if sim.lambda_prob in lambdas else 0
-                sim.lambda_prob = lambdas[(current_idx + 1) % len(lambdas)]
-    
-    # Actualizar simulación
-    sim.update_simulation(dt)
-    
-    # Dibujar todo
-    screen.fill(BLUE)
-    
-    sim.draw_airport()
-    sim.draw_planes()
-    sim.draw_info_panel()
-    sim.draw_controls()
-    
-    # Mostrar velocidad de simulación
-    speed_text = font_small.render(f"Velocidad: {sim.time_speed:.1f}x", True, WHITE)
-    screen.blit(speed_text, (WIDTH - 150, 20))
-    
-    # Mostrar progreso
-    progress = (sim.current_time / sim.total_minutes) * 100
-    progress_text = font_small.render(f"Progreso: {progress:.1f}%", True, WHITE)
-    screen.blit(progress_text, (WIDTH - 150, 45))
-    
-    pygame.display.flip()
+                elif event.key == pygame.K_UP or event.key == pygame.K_PLUS or event.key == pygame.K_KP_PLUS:
+                    sim.time_speed = min(20, sim.time_speed + 1)
+                elif event.key == pygame.K_DOWN or event.key == pygame.K_MINUS or event.key == pygame.K_KP_MINUS:
+                    sim.time_speed = max(0.1, sim.time_speed - 1)
+                elif event.key == pygame.K_l:
+                    # Cambiar lambda entre 0.1, 0.15, 0.2, 0.25
+                    lambdas = [0.1, 0.15, 0.2, 0.25]
+                    current_idx = lambdas.index(sim.lambda_prob) if sim.lambda_prob in lambdas else 0
+                    sim.lambda_prob = lambdas[(current_idx + 1) % len(lambdas)]
+
+        # Actualizar simulación
+        sim.update_simulation(dt)
+
+        # Dibujar todo
+        screen.fill(BLUE)
+
+        sim.draw_airport()
+        sim.draw_planes()
+        sim.draw_info_panel()
+        sim.draw_controls()
+
+        # Mostrar velocidad de simulación
+        speed_text = font_small.render(f"Velocidad: {sim.time_speed:.1f}x", True, WHITE)
+        screen.blit(speed_text, (WIDTH - 150, 20))
+
+        # Mostrar progreso
+        progress = (sim.current_time / sim.total_minutes) * 100
+        progress_text = font_small.render(f"Progreso: {progress:.1f}%", True, WHITE)
+        screen.blit(progress_text, (WIDTH - 150, 45))
+
+        pygame.display.flip()
+
+    pygame.quit()
+    sys.exit()
 
-pygame.quit()
-sys.exit()
\ No newline at end of file
+if __name__ == "__main__":
+    main()
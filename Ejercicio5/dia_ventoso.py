@@ -1,144 +1,35 @@
-# extensión del simulador original (main.py), agregando interrupciones de aterrizaje (1/10) por viento 
+# día ventoso: el simulador de main.py con interrupciones de aterrizaje (1/10) por viento (main.ModeloGoAround)
 import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from main import Plane, MIN_SEPARATION_MIN, REJOIN_GAP_MIN, BUFFER_MIN, knots_to_nm_per_min, eta_minutes, simulate_planes
+from main import ModeloGoAround, simulate_planes
 import numpy as np
 import random
-import matplotlib.pyplot as plt
+from cache_resultados import memoizar
+import barrido_lambda
 
-# clase PlaneVentoso que hereda de Plane y agrega lógica de interrupciones
-class PlaneVentoso(Plane):
-    def __init__(self, id, appear_time):
-        super().__init__(id, appear_time)
-        self.interrupciones = 0
-        self.en_interrupcion = False
-        
-    def intentar_aterrizaje(self):
-        #10% probabilidad de interrupción
-        if random.random() < 0.1:
-            self.interrupciones += 1
-            return False
-        return True
+# probabilidad de interrupcion de un aterrizaje por viento
+PROB_INTERRUPCION = 0.1
+# distancia (mn) desde la que vuelve a buscar un gap un avion con el aterrizaje interrumpido
+DIST_REINGRESO = 20.0
 
-# funcion que simula un día ventoso con interrupciones
-def simulate_dia_ventoso(lambda_prob=0.2, total_minutes=1080):
-    # simulación día ventoso usando lógica de main.py + interrupciones
-    planes = []
-    queue = []
-    rejoining = []
-    next_id = 1
-    landed_count = 0
-    montevideo_count = 0
-    interrupciones_count = 0
-    
-    for t in range(total_minutes):
-        # aparición
-        if random.random() < lambda_prob:
-            plane = PlaneVentoso(next_id, t)
-            planes.append(plane)
-            queue.append(plane)
-            next_id += 1
-        
-        # procesar approaching (igual que main.py)
-        to_remove = []
-        for i, plane in enumerate(queue[:]):
-            if plane.status == 'approaching':
-                if i > 0:
-                    prev = queue[i-1]
-                    prev_time_to_land = t + eta_minutes(prev.dist, prev.speed) if prev.status != 'landed' else prev.landed_time
-                    curr_time_to_land = t + eta_minutes(plane.dist, plane.speed)
-                    nueva_speed = max(plane.get_min_speed(), prev.speed - 20)
-                    curr_time_to_land_nueva = t + eta_minutes(plane.dist, nueva_speed)
-                    
-                    if (curr_time_to_land - prev_time_to_land) < MIN_SEPARATION_MIN:
-                        required_speed = prev.speed - 20
-                        if required_speed < plane.get_min_speed() or (curr_time_to_land_nueva - prev_time_to_land) < BUFFER_MIN:
-                            # debe bajar por debajo del mínimo O no logra buffer, va a rejoin
-                            plane.status = 'rejoin'
-                            plane.rejoin_start_time = t
-                            plane.rejoin_dist = plane.dist
-                            rejoining.append(plane)
-                            to_remove.append(plane)
-                            continue
-                        else:
-                            plane.speed = nueva_speed
-                    else:
-                        plane.speed = plane.get_max_speed()
-                else:
-                    # primer avión, no tiene anterior
-                    plane.speed = plane.get_max_speed()
-        
-        # remover aviones marcados fuera del bucle principal
-        for plane in to_remove:
-            if plane in queue:
-                queue.remove(plane)
-        
-        # procesar rejoining (igual que main.py)
-        for plane in rejoining[:]:
-            # Vuela hacia atrás a 200 nudos
-            plane.dist += knots_to_nm_per_min(200)
-            
-            # si sale de las 100mn sin encontrar gap, se va a Montevideo
-            if plane.dist > 100.0:
-                plane.status = 'montevideo'
-                plane.montevideo_time = t
-                rejoining.remove(plane)
-                montevideo_count += 1
-                continue
-            
-            # buscar gap de 10 minutos en la cola
-            for j in range(1, len(queue)):
-                prev2 = queue[j-1]
-                curr2 = queue[j]
-                prev2_time = t + eta_minutes(prev2.dist, prev2.speed) if prev2.status != 'landed' else prev2.landed_time
-                curr2_time = t + eta_minutes(curr2.dist, curr2.speed) if curr2.status != 'landed' else curr2.landed_time
-                
-                if (curr2_time - prev2_time) >= REJOIN_GAP_MIN:
-                    # encontró gap, puede reingresar
-                    plane.status = 'approaching'
-                    plane.dist = plane.rejoin_dist
-                    queue.insert(j, plane)
-                    rejoining.remove(plane)
-                    break
-        
-        # actualizar posiciones y aterrizajes
-        to_remove_landed = []
-        for plane in queue[:]:
-            if plane.status == 'approaching':
-                plane.update_position(1)
-                
-                # aterrizaje con interrupciones (SOLO para día ventoso)
-                if plane.dist <= 0:
-                    if plane.intentar_aterrizaje():
-                        plane.status = 'landed'
-                        plane.landed_time = t
-                        to_remove_landed.append(plane)
-                        landed_count += 1
-                    else:
-                        # interrupción -> rejoin
-                        plane.status = 'rejoin'
-                        plane.rejoin_start_time = t
-                        plane.rejoin_dist = 20.0
-                        plane.dist = 20.0
-                        plane.en_interrupcion = True
-                        rejoining.append(plane)
-                        to_remove_landed.append(plane)
-                        interrupciones_count += 1
-                
-                elif plane.status == 'landed':
-                    to_remove_landed.append(plane)
-                    landed_count += 1
-        
-        for plane in to_remove_landed:
-            if plane in queue:
-                queue.remove(plane)
-    
+# funcion que simula un día ventoso con interrupciones (motor de main.py con un ModeloGoAround)
+# arribos: lista opcional de (minuto, speed_u) ya sorteados, igual que en simulate_planes
+# prob_interrupcion: probabilidad, nivel de viento o tramos por hora (ver ModeloGoAround)
+# con prob_interrupcion = 0 el resultado es el mismo que simulate_planes con la misma semilla
+def simulate_dia_ventoso(lambda_prob=0.2, total_minutes=1080, arribos=None, prob_interrupcion=PROB_INTERRUPCION,
+                         dist_reingreso=DIST_REINGRESO, max_intentos=None):
+    goaround = ModeloGoAround(prob_interrupcion, dist_reingreso, max_intentos)
+    planes, _ = simulate_planes(lambda_prob, total_minutes, arribos=arribos, goaround=goaround)
+    landed_count = sum(1 for p in planes if p.status == 'landed')
+    montevideo_count = sum(1 for p in planes if p.status == 'montevideo')
+    interrupciones_count = sum(p.interrupciones for p in planes)
     return planes, landed_count, montevideo_count, interrupciones_count
 
 # funcion para graficar comparacion normal vs ventoso
 def grafico_comparacion(lambdas_test=[0.1, 0.15, 0.2, 0.25, 0.3]):
     """Gráfico de líneas comparando normal vs ventoso"""
+    import matplotlib.pyplot as plt
     print("📊 Generando gráfico...")
     
     normal_desvios = []
@@ -171,12 +62,55 @@ def grafico_comparacion(lambdas_test=[0.1, 0.15, 0.2, 0.25, 0.3]):
     
     return normal_desvios, ventoso_desvios
 
-# funcion para graficar comparacion normal vs ventoso con Monte Carlo
-def grafico_comparacion_montecarlo(lambdas_test=[0.1, 0.15, 0.2, 0.25, 0.3], N=100):
-    """Gráfico de líneas comparando normal vs ventoso, con Monte Carlo y barras de error."""
-    print("\nMonte Carlo Día Ventoso vs Normal")
-    import matplotlib.pyplot as plt
+# funcion que corre el Monte Carlo normal vs ventoso para cada lambda (media y error estandar de % desvios)
+def montecarlo_normal_vs_ventoso(lambdas_test, N=100, seed=None, cache=None, modo='independiente'):
+    """
+    Devuelve un dict con 'normal_desvios', 'normal_err', 'ventoso_desvios' y 'ventoso_err' (listas por lambda).
+    Si se pasa una semilla, el resultado se guarda en el cache en disco.
+    Con modo='thinning' todas las lambdas (y ambos escenarios) comparten los arribos de cada réplica.
+    """
+    params = {'lambdas': list(lambdas_test), 'total_minutes': 1080, 'n_mc': N, 'seed': seed}
+    if modo == 'thinning':
+        params['modo'] = modo
+        calcular = lambda: _montecarlo_normal_vs_ventoso_thinning(lambdas_test, N, seed)
+    elif modo == 'independiente':
+        calcular = lambda: _montecarlo_normal_vs_ventoso(lambdas_test, N, seed)
+    else:
+        raise ValueError(f"Modo de barrido desconocido: {modo}")
+    return memoizar('dia_ventoso.montecarlo_normal_vs_ventoso', params, calcular,
+                    archivos=(__file__, barrido_lambda.__file__), cache=cache)
+
+# funcion que calcula el % de desvios de una replica (nan si no aparecio ningun avion)
+def _pct_desvios_normal(res):
+    planes, _ = res
+    if not planes:
+        return (np.nan,)
+    return (len([p for p in planes if p.status == 'montevideo']) / len(planes) * 100,)
+
+def _pct_desvios_ventoso(res):
+    planes, _, montevideo_count, _ = res
+    if not planes:
+        return (np.nan,)
+    return (montevideo_count / len(planes) * 100,)
+
+def _montecarlo_normal_vs_ventoso_thinning(lambdas_test, N, seed):
+    if seed is not None:
+        random.seed(seed)  # los uniformes de las interrupciones se siembran desde random
+    normal = barrido_lambda.barrido_lambdas(lambdas_test, 1080, N, _pct_desvios_normal, simulate_planes, seed=seed)
+    # misma semilla: el día ventoso ve exactamente los mismos arribos que el normal
+    ventoso = barrido_lambda.barrido_lambdas(lambdas_test, 1080, N, _pct_desvios_ventoso, simulate_dia_ventoso, seed=seed)
+    res = {'normal_desvios': [], 'normal_err': [], 'ventoso_desvios': [], 'ventoso_err': []}
+    for lam in lambdas_test:
+        for nombre, filas in (('normal', normal[lam][:, 0]), ('ventoso', ventoso[lam][:, 0])):
+            filas = filas[~np.isnan(filas)]
+            res[f'{nombre}_desvios'].append(float(np.mean(filas)))
+            res[f'{nombre}_err'].append(float(np.std(filas) / np.sqrt(N)))
+    return res
+
+def _montecarlo_normal_vs_ventoso(lambdas_test, N, seed):
     from tqdm import tqdm
+    if seed is not None:
+        random.seed(seed)
     normal_desvios = []
     normal_err = []
     ventoso_desvios = []
@@ -200,6 +134,21 @@ def grafico_comparacion_montecarlo(lambdas_test=[0.1, 0.15, 0.2, 0.25, 0.3], N=1
         normal_err.append(np.std(desvios_normal) / np.sqrt(N))
         ventoso_desvios.append(np.mean(desvios_ventoso))
         ventoso_err.append(np.std(desvios_ventoso) / np.sqrt(N))
+    return {
+        'normal_desvios': [float(x) for x in normal_desvios],
+        'normal_err': [float(x) for x in normal_err],
+        'ventoso_desvios': [float(x) for x in ventoso_desvios],
+        'ventoso_err': [float(x) for x in ventoso_err],
+    }
+
+# funcion para graficar comparacion normal vs ventoso con Monte Carlo
+def grafico_comparacion_montecarlo(lambdas_test=[0.1, 0.15, 0.2, 0.25, 0.3], N=100, seed=None, cache=None, modo='independiente'):
+    """Gráfico de líneas comparando normal vs ventoso, con Monte Carlo y barras de error."""
+    print("\nMonte Carlo Día Ventoso vs Normal")
+    import matplotlib.pyplot as plt
+    res = montecarlo_normal_vs_ventoso(lambdas_test, N, seed=seed, cache=cache, modo=modo)
+    normal_desvios, normal_err = res['normal_desvios'], res['normal_err']
+    ventoso_desvios, ventoso_err = res['ventoso_desvios'], res['ventoso_err']
     # Gráfico de líneas con barras de error
     plt.figure(figsize=(10, 6))
     plt.errorbar(lambdas_test, normal_desvios, yerr=normal_err, fmt='bo-', linewidth=2, markersize=8, label='Normal', capsize=5)
@@ -217,7 +166,41 @@ def grafico_comparacion_montecarlo(lambdas_test=[0.1, 0.15, 0.2, 0.25, 0.3], N=1
         print(f"λ={lam:.2f} | Normal: {normal_desvios[i]:.2f}% ± {normal_err[i]:.2f} | Ventoso: {ventoso_desvios[i]:.2f}% ± {ventoso_err[i]:.2f}")
     return normal_desvios, normal_err, ventoso_desvios, ventoso_err
 
-if __name__ == "__main__":
+# funcion que barre severidades de viento con numeros aleatorios comunes: en cada replica todas las
+# severidades ven los mismos arribos y los mismos uniformes de interrupcion (ver main.ModeloGoAround)
+def barrido_viento(probs=(0.0, 0.05, 0.1, 0.2, 0.35), lambda_prob=0.2, total_minutes=1080, n_mc=100, seed=None,
+                   dist_reingreso=DIST_REINGRESO, max_intentos=None, cache=None):
+    """
+    Returns:
+        dict de arrays (severidades x réplicas): 'probs', 'desvios' (% de desvíos sobre aviones que terminaron),
+        'interrupciones' (go-arounds por avión) y 'demora_goaround' (minutos perdidos por go-around por avión aterrizado)
+    """
+    probs = [float(p) for p in probs]
+    params = {'probs': probs, 'lambda_prob': lambda_prob, 'total_minutes': total_minutes, 'n_mc': n_mc, 'seed': seed,
+              'dist_reingreso': dist_reingreso, 'max_intentos': max_intentos}
+    calcular = lambda: _barrido_viento(probs, lambda_prob, total_minutes, n_mc, seed, dist_reingreso, max_intentos)
+    return memoizar('dia_ventoso.barrido_viento', params, calcular, archivos=(__file__,), cache=cache)
+
+def _barrido_viento(probs, lambda_prob, total_minutes, n_mc, seed, dist_reingreso, max_intentos):
+    from main import descomponer_atrasos
+    if seed is not None:
+        random.seed(seed)
+    res = {nombre: np.zeros((len(probs), n_mc)) for nombre in ('desvios', 'interrupciones', 'demora_goaround')}
+    for rep in range(n_mc):
+        arribos = [(t, random.random()) for t in range(total_minutes) if random.random() < lambda_prob]
+        estado = random.getstate()
+        for i, prob in enumerate(probs):
+            random.setstate(estado)
+            planes, landed, montevideo, interrupciones = simulate_dia_ventoso(
+                lambda_prob, total_minutes, arribos, prob, dist_reingreso, max_intentos)
+            res['desvios'][i, rep] = 100 * montevideo / max(landed + montevideo, 1)
+            res['interrupciones'][i, rep] = interrupciones / max(len(planes), 1)
+            res['demora_goaround'][i, rep] = np.nanmean(descomponer_atrasos(planes)['goaround']) if landed else 0.0
+    res['probs'] = np.array(probs)
+    return res
+
+# funcion principal: comparacion rapida y grafico Monte Carlo normal vs ventoso
+def main():
     print("🌪️ DÍA VENTOSO SIMPLIFICADO")
     print("="*30)
     
@@ -228,5 +211,14 @@ if __name__ == "__main__":
         mont_normal = len([p for p in planes_normal if p.status == 'montevideo'])
         print(f"λ={lam}: Normal {mont_normal}, Ventoso {mont_ventoso}")
     
-    # Gráfico Monte Carlo
-    grafico_comparacion_montecarlo()
+    # Grilla de severidades de viento con números aleatorios comunes
+    res = barrido_viento(lambda_prob=0.2, n_mc=100, seed=42)
+    for i, prob in enumerate(res['probs']):
+        print(f"p={prob:.2f}: desvíos {res['desvios'][i].mean():.1f}%, go-arounds por avión {res['interrupciones'][i].mean():.3f}, "
+              f"demora por go-around {res['demora_goaround'][i].mean():.2f} min")
+
+    # Gráfico Monte Carlo (con semilla fija para poder regraficar desde el cache)
+    grafico_comparacion_montecarlo(seed=42)
+
+if __name__ == "__main__":
+    main()
@@ -1,35 +1,16 @@
 # simulador interactivo del arribo de aviones a AEP en un dia de viento
-import pygame
 import sys
 import random
 import numpy as np
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from main import Plane, knots_to_nm_per_min, eta_minutes, MIN_SEPARATION_MIN, BUFFER_MIN, REJOIN_GAP_MIN
-from tqdm import tqdm
+from main import Simulacion, ModeloGoAround
+from dia_ventoso import PROB_INTERRUPCION, DIST_REINGRESO
 import math
 import os
 
-# clase PlaneVentoso con lógica de interrupción
-class PlaneVentoso(Plane):
-    def __init__(self, id, appear_time):
-        super().__init__(id, appear_time)
-        self.interrupciones = 0
-        self.en_interrupcion = False  # Para marcarlo en amarillo
-        
-    def intentar_aterrizaje(self):
-        """10% probabilidad de interrupción"""
-        if random.random() < 0.1:  # 1/10 chance
-            self.interrupciones += 1
-            return False  # Interrupción
-        return True  # Aterrizaje exitoso
-
-pygame.init()
-
 # Screen dimensions
 WIDTH, HEIGHT = 1200, 800
-screen = pygame.display.set_mode((WIDTH, HEIGHT))
-pygame.display.set_caption("Simulación de Tráfico Aéreo - DÍA VENTOSO - ACN TP1")
 
 # Colors
 WHITE = (255, 255, 255)
@@ -43,28 +24,45 @@ GRAY = (128, 128, 128)
 ORANGE = (255, 165, 0)
 PURPLE = (128, 0, 128)
 
-# Fonts
-font_small = pygame.font.Font(None, 24)
-font_medium = pygame.font.Font(None, 32)
-font_large = pygame.font.Font(None, 48)
+# pygame y los recursos graficos (ventana, fuentes, imagen) se inicializan recien al ejecutar el simulador,
+# para que importar este modulo no abra una ventana
+pygame = None
+screen = None
+font_small = font_medium = font_large = None
+plane_image = None
+USE_IMAGE = False
+
+def _inicializar_pygame():
+    global pygame, screen, font_small, font_medium, font_large, plane_image, USE_IMAGE
+    import pygame as _pygame
+    pygame = _pygame
+    pygame.init()
 
-# Cargar imagen del avión
-try:
-    # Obtener el directorio donde está este script
-    script_dir = os.path.dirname(os.path.abspath(__file__))
-    image_path = os.path.join(script_dir, "descarga.jpeg")
-    
-    plane_image = pygame.image.load(image_path)
-    # Redimensionar la imagen a un tamaño intermedio que funcione bien
-    plane_image = pygame.transform.scale(plane_image, (40, 25))
-    # Hacer el fondo transparente (opcional)
-    plane_image = plane_image.convert_alpha()
-    USE_IMAGE = True
-    print("✈️ Imagen del avión cargada correctamente")
-except Exception as e:
-    USE_IMAGE = False
-    print(f"⚠️ No se pudo cargar la imagen del avión: {e}")
-    print("Usando gráficos vectoriales como respaldo")
+    screen = pygame.display.set_mode((WIDTH, HEIGHT))
+    pygame.display.set_caption("Simulación de Tráfico Aéreo - DÍA VENTOSO - ACN TP1")
+
+    # Fonts
+    font_small = pygame.font.Font(None, 24)
+    font_medium = pygame.font.Font(None, 32)
+    font_large = pygame.font.Font(None, 48)
+
+    # Cargar imagen del avión
+    try:
+        # Obtener el directorio donde está este script
+        script_dir = os.path.dirname(os.path.abspath(__file__))
+        image_path = os.path.join(script_dir, "descarga.jpeg")
+
+        plane_image = pygame.image.load(image_path)
+        # Redimensionar la imagen a un tamaño intermedio que funcione bien
+        plane_image = pygame.transform.scale(plane_image, (40, 25))
+        # Hacer el fondo transparente (opcional)
+        plane_image = plane_image.convert_alpha()
+        USE_IMAGE = True
+        print("✈️ Imagen del avión cargada correctamente")
+    except Exception as e:
+        USE_IMAGE = False
+        print(f"⚠️ No se pudo cargar la imagen del avión: {e}")
+        print("Usando gráficos vectoriales como respaldo")
 
 # Airport layout
 AIRPORT_X = WIDTH - 150
@@ -115,6 +113,9 @@ class VisualSimulationVentoso:
         # Resetear semillas
         random.seed(42)
         np.random.seed(42)
+        self.sim = Simulacion(self.lambda_prob, self.total_minutes,
+                              goaround=ModeloGoAround(PROB_INTERRUPCION, DIST_REINGRESO))
+        self._sincronizar()
         
     def update_simulation(self, dt):
         """Actualiza la simulación combinando lógica de main.py + día ventoso"""
@@ -134,126 +135,22 @@ class VisualSimulationVentoso:
             self.simulation_running = False
             return
         
-        # === LÓGICA COMBINADA: main.py + día ventoso ===
-        
-        # 1. Aparición de nuevos aviones
-        if random.random() < self.lambda_prob:
-            plane = PlaneVentoso(self.next_id, t)
-            # Chequeo de separación temporal con el anterior en la cola
-            if self.queue:
-                prev_plane = self.queue[-1]
-                if (plane.appear_time - prev_plane.appear_time) < MIN_SEPARATION_MIN:
-                    plane.speed = max(plane.get_min_speed(), prev_plane.speed - 20)
-            
-            self.all_planes.append(plane)
-            self.queue.append(plane)
-            self.next_id += 1
-            self.total_spawned += 1
-            
-        # 2. Procesar aviones en estado 'approaching' (LÓGICA DE main.py)
-        to_remove = []
-        for i, plane in enumerate(self.queue[:]):
-            if plane.status == 'approaching':
-                if i > 0:
-                    prev = self.queue[i-1]
-                    prev_time_to_land = t + eta_minutes(prev.dist, prev.speed) if prev.status != 'landed' else prev.landed_time
-                    curr_time_to_land = t + eta_minutes(plane.dist, plane.speed)
-                    nueva_speed = max(plane.get_min_speed(), prev.speed - 20)
-                    curr_time_to_land_nueva = t + eta_minutes(plane.dist, nueva_speed)
-                    
-                    if (curr_time_to_land - prev_time_to_land) < MIN_SEPARATION_MIN:
-                        required_speed = prev.speed - 20
-                        if required_speed < plane.get_min_speed() or (curr_time_to_land_nueva - prev_time_to_land) < BUFFER_MIN:
-                            # Debe bajar por debajo del mínimo O no logra buffer, va a rejoin
-                            plane.status = 'rejoin'
-                            plane.rejoin_start_time = t
-                            plane.rejoin_dist = plane.dist
-                            self.rejoining.append(plane)
-                            to_remove.append(plane)
-                            continue
-                        else:
-                            plane.speed = nueva_speed
-                    else:
-                        plane.speed = plane.get_max_speed()
-                else:
-                    # Primer avión, no tiene anterior
-                    plane.speed = plane.get_max_speed()
-        
-        # Remover aviones marcados para rejoin
-        for plane in to_remove:
-            if plane in self.queue:
-                self.queue.remove(plane)
-        
-        # 3. Procesar aviones en rejoining (LÓGICA DE main.py)
-        for plane in self.rejoining[:]:
-            # Vuela hacia atrás a 200 nudos
-            plane.dist += knots_to_nm_per_min(200)
-            plane.positions.append((plane.positions[-1][0] + 1, plane.dist))
-            
-            # Si sale de las 100nm sin encontrar gap, se va a Montevideo
-            if plane.dist > 100.0:
-                plane.status = 'montevideo'
-                plane.montevideo_time = t
-                self.rejoining.remove(plane)
-                self.montevideo_count += 1
-                continue
-            
-            # Buscar gap de 10 minutos en la cola
-            gap_found = False
-            for j in range(1, len(self.queue)):
-                prev2 = self.queue[j-1]
-                curr2 = self.queue[j]
-                prev2_time = t + eta_minutes(prev2.dist, prev2.speed) if prev2.status != 'landed' else prev2.landed_time
-                curr2_time = t + eta_minutes(curr2.dist, curr2.speed) if curr2.status != 'landed' else curr2.landed_time
-                
-                if (curr2_time - prev2_time) >= REJOIN_GAP_MIN:
-                    # Encontró gap, puede reingresar
-                    plane.status = 'approaching'
-                    plane.dist = plane.rejoin_dist
-                    plane.positions.append((plane.positions[-1][0], plane.dist))
-                    self.queue.insert(j, plane)
-                    self.rejoining.remove(plane)
-                    gap_found = True
-                    break
-        
-        # 4. Actualizar posición y aterrizajes (LÓGICA COMBINADA)
-        to_remove_landed = []
-        for plane in self.queue[:]:
-            if plane.status == 'approaching':
-                plane.update_position(1)
-                
-                # Cuando llega a la pista (dist <= 0)
-                if plane.dist <= 0:
-                    # DÍA VENTOSO: Probabilidad de interrupción (1/10)
-                    if plane.intentar_aterrizaje():  # 90% éxito
-                        # ATERRIZAJE EXITOSO
-                        plane.status = 'landed'
-                        plane.landed_time = t
-                        plane.en_interrupcion = False
-                        to_remove_landed.append(plane)
-                        self.landed_count += 1
-                    else:  # 10% interrupción
-                        # INTERRUPCIÓN - va a rejoin (como main.py)
-                        plane.status = 'rejoin'
-                        plane.rejoin_start_time = t
-                        plane.rejoin_dist = 20.0  # Empieza el rejoin desde 20nm
-                        plane.dist = 20.0
-                        plane.en_interrupcion = True  # Marcarlo amarillo
-                        plane.speed = plane.get_min_speed() * 0.5  # Velocidad reducida
-                        self.rejoining.append(plane)
-                        to_remove_landed.append(plane)
-                        self.interrupciones_count += 1
-                        
-                        # CONGESTIÓN ADICIONAL (del día ventoso)
-                        for other in self.queue:
-                            if other != plane and other.status == 'approaching':
-                                # Reducir velocidad a otros aviones
-                                other.speed = max(other.get_min_speed() * 0.6, 80)
-        
-        for plane in to_remove_landed:
-            if plane in self.queue:
-                self.queue.remove(plane)
-        
+        # === motor de main.py con go-around (ver dia_ventoso.py) ===
+        while self.sim.t < t:
+            self.sim.paso()
+        self._sincronizar()
+
+    # copia el estado del motor en los atributos que usa el dibujo
+    def _sincronizar(self):
+        sim = self.sim
+        self.queue = [p for queue in sim.colas for p in queue]
+        self.rejoining = sim.rejoining
+        self.all_planes = sim.planes
+        self.next_id = sim.next_id
+        self.total_spawned = len(sim.planes)
+        self.landed_count = sum(1 for p in sim.planes if p.status == 'landed')
+        self.montevideo_count = len(sim.desviados)
+        self.interrupciones_count = sum(p.interrupciones for p in sim.planes)
         # Actualizar lista de aviones visibles (approaching + rejoining)
         self.planes = [p for p in self.queue if p.status == 'approaching'] + self.rejoining
             
@@ -514,59 +411,65 @@ class VisualSimulationVentoso:
             text = font_small.render(control, True, color)
             screen.blit(text, (20, controls_y + i * 18))
 
-# Inicializar simulación
-sim = VisualSimulationVentoso()
-clock = pygame.time.Clock()
+# funcion principal: abre la ventana y corre el loop del simulador interactivo
+def main():
+    _inicializar_pygame()
+    # Inicializar simulación
+    sim = VisualSimulationVentoso()
+    clock = pygame.time.Clock()
 
-# Game loop principal
-running = True
-while running:
-    dt = clock.tick(60) / 1000.0  # Delta time en segundos
-    
-    for event in pygame.event.get():
-        if event.type == pygame.QUIT:
-            running = False
-        elif event.type == pygame.KEYDOWN:
-            if event.key == pygame.K_ESCAPE:
+    # Game loop principal
+    running = True
+    while running:
+        dt = clock.tick(60) / 1000.0  # Delta time en segundos
+
+        for event in pygame.event.get():
+            if event.type == pygame.QUIT:
                 running = False
-            elif event.key == pygame.K_SPACE:
-                if not sim.simulation_running:
+            elif event.type == pygame.KEYDOWN:
+                if event.key == pygame.K_ESCAPE:
+                    running = False
+                elif event.key == pygame.K_SPACE:
+                    if not sim.simulation_running:
+                        sim.start_simulation()
+                    else:
+                        sim.paused = not sim.paused
+                elif event.key == pygame.K_r:
                     sim.start_simulation()
-                else:
-                    sim.paused = not sim.paused
-            elif event.key == pygame.K_r:
-                sim.start_simulation()
-            elif event.key == pygame.K_UP or event.key == pygame.K_PLUS or event.key == pygame.K_KP_PLUS:
-                sim.time_speed = min(20, sim.time_speed + 1)
-            elif event.key == pygame.K_DOWN or event.key == pygame.K_MINUS or event.key == pygame.K_KP_MINUS:
-                sim.time_speed = max(0.1, sim.time_speed - 1)
-            elif event.key == pygame.K_l:
-                # Cambiar lambda entre 0.1, 0.15, 0.2, 0.25
-                lambdas = [0.1, 0.15, 0.2, 0.25]
-                current_idx = lambdas.index(sim.lambda_prob) if sim.lambda_prob in lambdas else 0
-                sim.lambda_prob = lambdas[(current_idx + 1) % len(lambdas)]
-    
-    # Actualizar simulación
-    sim.update_simulation(dt)
-    
-    # Dibujar todo
-    screen.fill(BLUE)
-    
-    sim.draw_airport()
-    sim.draw_planes()
-    sim.draw_info_panel()
-    sim.draw_controls()
-    
-    # Mostrar velocidad de simulación
-    speed_text = font_small.render(f"Velocidad: {sim.time_speed:.1f}x", True, WHITE)
-    screen.blit(speed_text, (WIDTH - 150, 20))
-    
-    # Mostrar progreso
-    progress = (sim.current_time / sim.total_minutes) * 100
-    progress_text = font_small.render(f"Progreso: {progress:.1f}%", True, WHITE)
-    screen.blit(progress_text, (WIDTH - 150, 45))
-    
-    pygame.display.flip()
+                elif event.key == pygame.K_UP or event.key == pygame.K_PLUS or event.key == pygame.K_KP_PLUS:
+                    sim.time_speed = min(20, sim.time_speed + 1)
+                elif event.key == pygame.K_DOWN or event.key == pygame.K_MINUS or event.key == pygame.K_KP_MINUS:
+                    sim.time_speed = max(0.1, sim.time_speed - 1)
+                elif event.key == pygame.K_l:
+                    # Cambiar lambda entre 0.1, 0.15, 0.2, 0.25
+                    lambdas = [0.1, 0.15, 0.2, 0.25]
+                    current_idx = lambdas.index(sim.lambda_prob) if sim.lambda_prob in lambdas else 0
+                    sim.lambda_prob = lambdas[(current_idx + 1) % len(lambdas)]
+
+        # Actualizar simulación
+        sim.update_simulation(dt)
+
+        # Dibujar todo
+        screen.fill(BLUE)
+
+        sim.draw_airport()
+        sim.draw_planes()
+        sim.draw_info_panel()
+        sim.draw_controls()
+
+        # Mostrar velocidad de simulación
+        speed_text = font_small.render(f"Velocidad: {sim.time_speed:.1f}x", True, WHITE)
+        screen.blit(speed_text, (WIDTH - 150, 20))
+
+        # Mostrar progreso
+        progress = (sim.current_time / sim.total_minutes) * 100
+        progress_text = font_small.render(f"Progreso: {progress:.1f}%", True, WHITE)
+        screen.blit(progress_text, (WIDTH - 150, 45))
+
+        pygame.display.flip()
+
+    pygame.quit()
+    sys.exit()
 
-pygame.quit()
-sys.exit()
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,17 @@
+# invariantes del dia ventoso de dia_ventoso.py
+import random
+from dia_ventoso import simulate_dia_ventoso, barrido_viento
+from main import simulate_planes
+
+def test_prob_cero_es_el_dia_normal():
+    random.seed(9)
+    normal, _ = simulate_planes(0.2, 600)
+    random.seed(9)
+    ventoso, landed, montevideo, interrupciones = simulate_dia_ventoso(0.2, 600, prob_interrupcion=0.0)
+    assert [(p.id, p.status, p.landed_time) for p in normal] == [(p.id, p.status, p.landed_time) for p in ventoso]
+    assert interrupciones == 0
+
+def test_barrido_viento_usa_numeros_aleatorios_comunes():
+    res = barrido_viento(probs=(0.0, 0.1, 0.3), total_minutes=600, n_mc=3, seed=4, cache=False)
+    assert (res['interrupciones'][0] == 0).all()
+    assert (res['interrupciones'][1] <= res['interrupciones'][2]).all()
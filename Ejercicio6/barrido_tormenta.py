@@ -0,0 +1,155 @@
+# barrido del impacto de la tormenta segun su horario y duracion (mapa de calor inicio x duracion).
+# Correr simulate_storm_closure para cada (storm_start, storm_duration) por separado repite todo el
+# tramo previo a la tormenta, que es identico en todos los escenarios. Aca, en cada replica:
+# - se simula un dia sin tormenta y en cada inicio s se bifurca el estado (SimulacionTormenta.bifurcar)
+#   junto con el estado de random;
+# - la rama cerrada avanza de duracion en duracion (la tormenta de 60 minutos empieza igual que la de 30)
+#   y en cada duracion se bifurca otra vez para simular el resto del dia con el aeropuerto abierto.
+# Todos los escenarios de una replica usan los mismos numeros aleatorios (la cantidad de numeros que
+# se consumen por minuto no depende del estado), asi el incremento de desvios contra el dia sin
+# tormenta se estima con mucha menos varianza. Por la misma razon, cuando despues de la tormenta
+# los aviones en vuelo de una rama vuelven a ser exactamente los del dia sin tormenta, el resto del
+# dia es identico y no hace falta simularlo: se completa con los conteos del dia sin tormenta.
+import random
+import numpy as np
+import sys
+import os
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+from main import minutos_a_hora
+from cache_resultados import memoizar
+from ejercicio6 import SimulacionTormenta
+import ejercicio6
+
+# funcion que calcula la proporcion de desvios (sobre aviones que terminaron) de una simulacion, sumando los
+# aterrizajes y desvios del resto del dia si no se simulo hasta el final
+def _metricas(sim, aterrizados=0, desviados=0):
+    landed, montevideo = sim.landed_count + aterrizados, sim.montevideo_count + desviados
+    total = landed + montevideo
+    return (montevideo / total if total > 0 else 0.0), sim.desvios_cierre
+
+# firma del estado dinamico de una simulacion: aviones en vuelo con su distancia, velocidad y estado
+def _firma(sim):
+    return (tuple((p.id, p.dist, p.speed, p.status) for p in sim.queue),
+            tuple((p.id, p.dist, p.rejoin_dist) for p in sim.rejoining))
+
+# funcion que barre inicios y duraciones de tormenta compartiendo los prefijos comunes
+def barrido_tormentas(lambda_prob=0.2, total_minutes=1080, inicios=None, duraciones=(15, 30, 45, 60), n_mc=50,
+                      seed=None, accion='desvio', cache=None):
+    """
+    Estima el porcentaje de desvíos para cada combinación de inicio y duración de la tormenta.
+
+    Args:
+        inicios: minutos de inicio a evaluar (por defecto, cada 30 minutos)
+        duraciones: duraciones de la tormenta en minutos
+        n_mc: réplicas Monte Carlo
+        seed: semilla (con semilla el resultado se guarda en el cache)
+        accion: 'desvio' o 'holding' para los aviones que llegan con la pista cerrada (ver main.ProgramaCierres)
+
+    Returns:
+        dict de arrays: 'inicios', 'duraciones', 'desvios' y 'desvios_std' (inicios x duraciones),
+        'incremento' (desvíos menos los del mismo día sin tormenta, promedio por réplica),
+        'afectados' (aviones desviados durante el cierre), 'base' (desvíos sin tormenta, por réplica),
+        'minutos_simulados' y 'minutos_ingenuo' (costo contra correr cada escenario por separado)
+    """
+    if inicios is None:
+        inicios = range(0, total_minutes, 30)
+    inicios = sorted(int(s) for s in inicios)
+    duraciones = sorted(int(d) for d in duraciones)
+    params = {'lambda_prob': lambda_prob, 'total_minutes': total_minutes, 'inicios': inicios,
+              'duraciones': duraciones, 'n_mc': n_mc, 'seed': seed, 'accion': accion}
+    calcular = lambda: _barrido_tormentas(lambda_prob, total_minutes, inicios, duraciones, n_mc, seed, accion)
+    return memoizar('barrido_tormenta.barrido_tormentas', params, calcular,
+                    archivos=(__file__, ejercicio6.__file__), cache=cache)
+
+def _barrido_tormentas(lambda_prob, total_minutes, inicios, duraciones, n_mc, seed, accion):
+    if seed is not None:
+        random.seed(seed)
+    S, D = len(inicios), len(duraciones)
+    inicios_set = set(inicios)
+    desvios = np.zeros((n_mc, S, D))
+    afectados = np.zeros((n_mc, S, D))
+    base = np.zeros(n_mc)
+    minutos = 0
+    for rep in range(n_mc):
+        # dia sin tormenta (la tormenta empieza despues del final): se guarda la firma y los conteos de
+        # cada minuto y una bifurcacion (con el estado de random) en cada inicio
+        dia = SimulacionTormenta(lambda_prob, total_minutes, storm_start=total_minutes, storm_duration=0, accion=accion)
+        firmas, aterrizados, desviados = [], [], []
+        bifurcaciones = {}
+        for t in range(total_minutes + 1):
+            if t in inicios_set:
+                bifurcaciones[t] = (dia.bifurcar(), random.getstate())
+            firmas.append(_firma(dia))
+            aterrizados.append(dia.landed_count)
+            desviados.append(dia.montevideo_count)
+            if t < total_minutes:
+                dia.paso()
+        minutos += total_minutes
+        base[rep] = _metricas(dia)[0]
+        estado_final = random.getstate()
+        for i, s in enumerate(inicios):
+            cerrada, estado_inicio = bifurcaciones[s]
+            random.setstate(estado_inicio)
+            for k, d in enumerate(duraciones):
+                cerrada.programar_tormenta(s, d)
+                fin = min(s + d, total_minutes)
+                minutos += max(fin - cerrada.t, 0)
+                cerrada.correr(fin)
+                estado_fin = random.getstate()
+                resto = cerrada.bifurcar()
+                # aeropuerto abierto hasta que el estado coincide con el del dia sin tormenta
+                while resto.t < total_minutes and _firma(resto) != firmas[resto.t]:
+                    resto.paso()
+                    minutos += 1
+                t = resto.t
+                desvios[rep, i, k], afectados[rep, i, k] = _metricas(resto, aterrizados[-1] - aterrizados[t],
+                                                                     desviados[-1] - desviados[t])
+                random.setstate(estado_fin)
+        random.setstate(estado_final)
+    ddof = 1 if n_mc > 1 else 0
+    return {
+        'inicios': np.array(inicios),
+        'duraciones': np.array(duraciones),
+        'desvios': desvios.mean(axis=0),
+        'desvios_std': desvios.std(axis=0, ddof=ddof),
+        'incremento': (desvios - base[:, None, None]).mean(axis=0),
+        'afectados': afectados.mean(axis=0),
+        'base': base,
+        'minutos_simulados': np.array(minutos),
+        'minutos_ingenuo': np.array(n_mc * S * D * total_minutes),
+    }
+
+# funcion que grafica el mapa de calor del incremento de desvios
+def graficar_mapa(res, archivo=None):
+    import matplotlib.pyplot as plt
+    inicios, duraciones = res['inicios'], res['duraciones']
+    fig, ax = plt.subplots(figsize=(12, 4))
+    im = ax.imshow(100 * res['incremento'].T, aspect='auto', origin='lower', cmap='Reds')
+    paso = max(1, len(inicios) // 12)
+    ax.set_xticks(range(0, len(inicios), paso))
+    ax.set_xticklabels([minutos_a_hora(int(s)) for s in inicios[::paso]])
+    ax.set_yticks(range(len(duraciones)))
+    ax.set_yticklabels([f"{d} min" for d in duraciones])
+    ax.set_xlabel('Inicio de la tormenta')
+    ax.set_ylabel('Duración')
+    ax.set_title('Incremento de desvíos a Montevideo por la tormenta (puntos porcentuales)')
+    fig.colorbar(im, ax=ax)
+    plt.tight_layout()
+    if archivo is not None:
+        plt.savefig(archivo, dpi=150)
+    else:
+        plt.show()
+
+# funcion principal: mapa de calor para lambda = 0.2
+def main():
+    res = barrido_tormentas(lambda_prob=0.2, total_minutes=1080, n_mc=50, seed=42)
+    print(f"Desvíos sin tormenta: {100*res['base'].mean():.1f}%")
+    print(f"Minutos simulados: {int(res['minutos_simulados'])} (ingenuo: {int(res['minutos_ingenuo'])}, "
+          f"{100*res['minutos_simulados']/res['minutos_ingenuo']:.0f}%)")
+    print(f"{'inicio':<8}" + ''.join(f"{int(d):>8}m" for d in res['duraciones']))
+    for i, s in enumerate(res['inicios']):
+        print(f"{minutos_a_hora(int(s)):<8}" + ''.join(f"{100*x:>8.1f}%" for x in res['incremento'][i]))
+    graficar_mapa(res, 'mapa_tormenta.png')
+
+if __name__ == "__main__":
+    main()
@@ -3,138 +3,74 @@ import random
 import numpy as np
 import sys
 import os
-import matplotlib.pyplot as plt
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from tqdm import tqdm as tqdm_ext
-from main import Plane, MIN_SEPARATION_MIN, REJOIN_GAP_MIN, BUFFER_MIN, knots_to_nm_per_min, eta_minutes, simulate_planes, minutos_a_hora
-
-# clase PlaneTormenta que hereda de Plane y agrega atributos para manejar el cierre por tormenta
-class PlaneTormenta(Plane):
-    def __init__(self, id, appear_time):
-        super().__init__(id, appear_time)
-        self.tiempo_espera_cierre = 0
-        self.afectado_por_tormenta = False
-
-# funcion que simula la llegada y aproximacion de aviones a AEP con cierre por tormenta
-def simulate_storm_closure(lambda_prob=0.2, total_minutes=1080, storm_start=None, storm_duration=30):
+from main import Simulacion, ProgramaCierres, simulate_planes, minutos_a_hora
+
+# clase SimulacionTormenta: Simulacion del nucleo (main.Simulacion) con la pista cerrada durante la tormenta
+# (main.ProgramaCierres). Se puede correr hasta un minuto, bifurcar el estado (Simulacion.bifurcar) y seguir
+# cada rama con otra tormenta, que es lo que usa barrido_tormenta.py para compartir el tramo previo a la
+# tormenta entre escenarios.
+# - cierres: ProgramaCierres (o lista de ventanas (inicio, duracion[, capacidad])) para tener varias tormentas o
+#   reducciones parciales de capacidad; si se pasa, storm_start y storm_duration no se usan
+# - accion: 'desvio' (el avion que llega a 10 mn con la pista cerrada se va a Montevideo) o 'holding'
+class SimulacionTormenta(Simulacion):
+    def __init__(self, lambda_prob=0.2, total_minutes=1080, storm_start=0, storm_duration=30, cierres=None,
+                 accion='desvio'):
+        super().__init__(lambda_prob, total_minutes)
+        self.accion = accion
+        if cierres is None:
+            self.programar_tormenta(storm_start, storm_duration)
+        else:
+            if not isinstance(cierres, ProgramaCierres):
+                cierres = ProgramaCierres(cierres, accion=accion)
+            self.cambiar(cierres=cierres)
+            self.storm_start, self.storm_end = self.cierres.inicio(), self.cierres.fin()
+
+    # cambia la tormenta de la simulacion por un unico cierre total (solo tiene sentido si todavia no empezo)
+    def programar_tormenta(self, storm_start, storm_duration):
+        self.storm_start = storm_start
+        self.storm_end = storm_start + storm_duration
+        self.cambiar(cierres=ProgramaCierres([(storm_start, storm_duration)], accion=self.accion))
+
+    # conteos: los aviones que no estan en vuelo ni desviados aterrizaron
+    @property
+    def landed_count(self):
+        en_vuelo = sum(len(queue) for queue in self.colas) + len(self.rejoining)
+        return len(self.planes) - len(self.desviados) - en_vuelo
+
+    @property
+    def montevideo_count(self):
+        return len(self.desviados)
+
+    # resultado en el formato de simulate_storm_closure
+    def resultado(self):
+        return (self.planes, self.landed_count, self.montevideo_count, self.desvios_cierre,
+                self.espera_cierre, self.max_cola_cierre, self.storm_start, self.storm_end)
+
+# funcion que simula la llegada y aproximacion de aviones a AEP con cierre por tormenta.
+# Devuelve (planes, aterrizados, desviados, desviados por el cierre, minutos-avion de espera durante el cierre,
+# cola maxima durante el cierre, inicio, fin)
+def simulate_storm_closure(lambda_prob=0.2, total_minutes=1080, storm_start=None, storm_duration=30, cierres=None,
+                           accion='desvio'):
     # si no se especifica storm_start, elegir inicio random para la tormenta
-    if storm_start is None:
+    if cierres is None and storm_start is None:
         storm_start = random.randint(0, total_minutes - storm_duration)
-
-    storm_end = storm_start + storm_duration
-
-    planes = []
-    queue = []
-    rejoining = []
-    next_id = 1
-    landed_count = 0
-    montevideo_count = 0
-
-    planes_afectados = 0
-    tiempo_espera_total = 0
-    max_cola_durante_cierre = 0
-
-    for t in range(total_minutes):
-        # aparición de aviones
-        if random.random() < lambda_prob:
-            plane = PlaneTormenta(next_id, t)
-            planes.append(plane)
-            queue.append(plane)
-            next_id += 1
-
-        aeropuerto_cerrado = storm_start <= t < storm_end
-
-        if aeropuerto_cerrado:
-            max_cola_durante_cierre = max(max_cola_durante_cierre, len(queue))
-            to_remove = []
-            for plane in queue[:]:
-                if plane.status == 'approaching':
-                    plane.update_position(1)
-                    if plane.dist <= 10:
-                        if aeropuerto_cerrado:
-                            plane.status = 'montevideo'
-                            plane.montevideo_time = t
-                            to_remove.append(plane)
-                            montevideo_count += 1
-                            planes_afectados += 1
-                        else:
-                            plane.dist = 0
-                            plane.status = 'landed'
-                            plane.landed_time = t
-                            landed_count += 1
-                            to_remove.append(plane)
-            for plane in to_remove:
-                if plane in queue:
-                    queue.remove(plane)
-        else:
-            to_remove = []
-            for i, plane in enumerate(queue[:]):
-                if plane.status == 'approaching':
-                    if i > 0:
-                        prev = queue[i-1]
-                        prev_time_to_land = t + eta_minutes(prev.dist, prev.speed) if prev.status != 'landed' else prev.landed_time
-                        curr_time_to_land = t + eta_minutes(plane.dist, plane.speed)
-                        nueva_speed = max(plane.get_min_speed(), prev.speed - 20)
-                        curr_time_to_land_nueva = t + eta_minutes(plane.dist, nueva_speed)
-                        if (curr_time_to_land - prev_time_to_land) < MIN_SEPARATION_MIN:
-                            required_speed = prev.speed - 20
-                            if required_speed < plane.get_min_speed() or (curr_time_to_land_nueva - prev_time_to_land) < BUFFER_MIN:
-                                plane.status = 'rejoin'
-                                plane.rejoin_start_time = t
-                                plane.rejoin_dist = plane.dist
-                                rejoining.append(plane)
-                                to_remove.append(plane)
-                                continue
-                            else:
-                                plane.speed = nueva_speed
-                        else:
-                            plane.speed = plane.get_max_speed()
-                    else:
-                        plane.speed = plane.get_max_speed()
-            for plane in to_remove:
-                if plane in queue:
-                    queue.remove(plane)
-
-            for plane in rejoining[:]:
-                plane.dist += knots_to_nm_per_min(200)
-                if plane.dist > 100.0:
-                    plane.status = 'montevideo'
-                    plane.montevideo_time = t
-                    rejoining.remove(plane)
-                    montevideo_count += 1
-                    continue
-                for j in range(1, len(queue)):
-                    prev2 = queue[j-1]
-                    curr2 = queue[j]
-                    prev2_time = t + eta_minutes(prev2.dist, prev2.speed) if prev2.status != 'landed' else prev2.landed_time
-                    curr2_time = t + eta_minutes(curr2.dist, curr2.speed) if curr2.status != 'landed' else curr2.landed_time
-                    if (curr2_time - prev2_time) >= REJOIN_GAP_MIN:
-                        plane.status = 'approaching'
-                        plane.dist = plane.rejoin_dist
-                        queue.insert(j, plane)
-                        rejoining.remove(plane)
-                        break
-
-            to_remove_landed = []
-            for plane in queue[:]:
-                if plane.status == 'approaching':
-                    plane.update_position(1)
-                    if plane.dist <= 0:
-                        plane.status = 'landed'
-                        plane.landed_time = t
-                        to_remove_landed.append(plane)
-                        landed_count += 1
-                    elif plane.status == 'landed':
-                        to_remove_landed.append(plane)
-                        landed_count += 1
-            for plane in to_remove_landed:
-                if plane in queue:
-                    queue.remove(plane)
-
-    return (planes, landed_count, montevideo_count, planes_afectados, 
-        tiempo_espera_total, max_cola_durante_cierre, storm_start, storm_end)
-
-if __name__ == "__main__":
+    sim = SimulacionTormenta(lambda_prob, total_minutes, storm_start, storm_duration, cierres, accion)
+    return sim.correr().resultado()
+
+# funcion que sortea una temporada de tormentas para un dia: cantidad Poisson con media tormentas_por_dia,
+# inicios uniformes y duraciones exponenciales (al menos 5 minutos). Usa su propio generador, asi no
+# cambia los arribos del dia
+def programa_estacional(tormentas_por_dia=3, duracion_media=30, total_minutes=1080, capacidad=0.0, accion='desvio',
+                        seed=None):
+    rng = np.random.default_rng(seed)
+    n = rng.poisson(tormentas_por_dia)
+    inicios = np.sort(rng.integers(0, total_minutes, n))
+    duraciones = np.maximum(5, np.round(rng.exponential(duracion_media, n))).astype(int)
+    return ProgramaCierres([(int(s), int(d), capacidad) for s, d in zip(inicios, duraciones)], accion=accion)
+
+# funcion principal: Monte Carlo comparativo dia normal vs dia con tormenta
+def main():
     print("Simulación Monte Carlo comparativa: Día Normal vs Día con Tormenta")
     print("=" * 70)
 
@@ -153,6 +89,8 @@ if __name__ == "__main__":
     import random
     storm_start_fixed = random.randint(0, total_minutes - 30)
 
+    from tqdm import tqdm as tqdm_ext
+
     # Día normal
     desvios_normal, aterrizajes_normal, totales_normal = [], [], []
     simulate_planes.use_tqdm = False
@@ -199,3 +137,17 @@ if __name__ == "__main__":
     print("\n Impacto promedio de la tormenta:")
     print(f"   Incremento de desvíos: {diff:.1f} puntos porcentuales")
 
+    # Temporada de tormentas: varios cierres por dia, desviando o esperando en holding
+    print("\n Temporada de tormentas (3 por día en promedio, 30 min de media):")
+    for accion in ('desvio', 'holding'):
+        desvios, esperas = [], []
+        for k in range(200):
+            cierres = programa_estacional(3, 30, total_minutes, accion=accion, seed=k)
+            _, landed, montevideo, _, tiempo_espera, _, _, _ = simulate_storm_closure(
+                lambda_prob_mc, total_minutes, cierres=cierres)
+            desvios.append(montevideo / max(landed + montevideo, 1))
+            esperas.append(tiempo_espera)
+        print(f"   {accion:<8} desvíos {100 * np.mean(desvios):.1f}%, espera {np.mean(esperas):.0f} minutos-avión por día")
+
+if __name__ == "__main__":
+    main()
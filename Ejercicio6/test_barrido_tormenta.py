@@ -0,0 +1,24 @@
+# invariantes de barrido_tormenta.py: compartir prefijos da lo mismo que correr cada tormenta por separado
+import random
+import numpy as np
+import pytest
+from barrido_tormenta import barrido_tormentas
+from ejercicio6 import simulate_storm_closure
+
+@pytest.mark.parametrize('accion', ['desvio', 'holding'])
+def test_barrido_es_igual_a_correr_cada_tormenta(accion):
+    inicios, duraciones, n_mc, T = [60, 150], [15, 45], 3, 300
+    res = barrido_tormentas(0.3, T, inicios, duraciones, n_mc=n_mc, seed=8, accion=accion, cache=False)
+    random.seed(8)
+    desvios = np.zeros((n_mc, len(inicios), len(duraciones)))
+    for rep in range(n_mc):
+        estado = random.getstate()
+        for i, s in enumerate(inicios):
+            for k, d in enumerate(duraciones):
+                random.setstate(estado)
+                _, landed, montevideo, *_ = simulate_storm_closure(0.3, T, storm_start=s, storm_duration=d,
+                                                                   accion=accion)
+                desvios[rep, i, k] = montevideo / max(landed + montevideo, 1)
+        random.setstate(estado)
+        simulate_storm_closure(0.3, T, storm_start=T, storm_duration=0, accion=accion)
+    assert np.allclose(res['desvios'], desvios.mean(axis=0))
@@ -0,0 +1,165 @@
+# agregacion Monte Carlo en memoria constante para los analisis de los notebooks (Ejercicio1/graficos.ipynb).
+# En lugar de guardar las listas de Plane de todas las replicas (cada una con su trayectoria completa en
+# positions) y recorrerlas varias veces, cada replica se resume en una sola pasada y se descarta:
+# - conteos de aterrizados, desviados a Montevideo y en vuelo al final
+# - aterrizajes por hora (suma y suma de cuadrados, para media y desvio por replica)
+# - distribucion de atrasos contra el tiempo base desde 100 mn (main.TIEMPO_BASE_100NM): como appear_time y
+#   landed_time son minutos enteros, el atraso de cada avion es (landed_time - appear_time) - base y alcanza
+#   con contar cuantos aviones tardaron cada cantidad entera de minutos (histograma exacto)
+# - suma de los componentes del atraso (congestion, holding, go-around, cierre; ver main.descomponer_atrasos)
+# La memoria que usa el agregador depende solo de la cantidad de horas y del rango de tiempos de vuelo.
+import random
+import numpy as np
+from main import TIEMPO_BASE_100NM, simulate_planes, descomponer_atrasos
+from histogramas import histograma_horas
+
+# clase AgregadorMC que acumula las metricas de muchas replicas sin guardar los aviones
+class AgregadorMC:
+    def __init__(self, total_minutes=1080):
+        self.total_minutes = total_minutes
+        self.horas = -(-total_minutes // 60)
+        self.base = TIEMPO_BASE_100NM
+        self.n_replicas = 0
+        self.aviones = 0
+        self.aterrizados = 0
+        self.montevideo = 0
+        self.en_vuelo = 0
+        self.en_aproximacion = 0
+        self.aterrizajes_hora = np.zeros(self.horas)
+        self.aterrizajes_hora_sq = np.zeros(self.horas)
+        # duraciones[k]: aviones aterrizados que tardaron k minutos desde que aparecieron
+        self.duraciones = np.zeros(0, dtype=np.int64)
+        self.componentes = {'congestion': 0.0, 'holding': 0.0, 'goaround': 0.0, 'cierre': 0.0}
+
+    # resume una replica (lista de aviones) y la incorpora a los acumulados
+    def agregar(self, planes):
+        landed_times = []
+        duraciones = []
+        aterrizados = montevideo = en_vuelo = en_aproximacion = 0
+        for p in planes:
+            status = p.status
+            if status == 'landed':
+                aterrizados += 1
+                if p.landed_time is not None:
+                    landed_times.append(p.landed_time)
+                    duraciones.append(p.landed_time - p.appear_time)
+            elif status == 'montevideo':
+                montevideo += 1
+            elif status == 'approaching':
+                en_vuelo += 1
+                if p.dist > 0:
+                    en_aproximacion += 1
+        self.n_replicas += 1
+        self.aviones += len(planes)
+        self.aterrizados += aterrizados
+        self.montevideo += montevideo
+        self.en_vuelo += en_vuelo
+        self.en_aproximacion += en_aproximacion
+        por_hora = histograma_horas([landed_times], self.total_minutes)[0]
+        self.aterrizajes_hora += por_hora
+        self.aterrizajes_hora_sq += por_hora.astype(float) ** 2
+        if duraciones:
+            conteo = np.bincount(np.asarray(duraciones, dtype=np.int64))
+            if len(conteo) > len(self.duraciones):
+                self.duraciones = np.pad(self.duraciones, (0, len(conteo) - len(self.duraciones)))
+            self.duraciones[:len(conteo)] += conteo
+        atrasos = descomponer_atrasos(planes)
+        for nombre in self.componentes:
+            self.componentes[nombre] += float(np.nansum(atrasos[nombre]))
+
+    # combina otro agregador (por ejemplo, de otro proceso) con este
+    def combinar(self, otro):
+        for campo in ('n_replicas', 'aviones', 'aterrizados', 'montevideo', 'en_vuelo', 'en_aproximacion'):
+            setattr(self, campo, getattr(self, campo) + getattr(otro, campo))
+        self.aterrizajes_hora += otro.aterrizajes_hora
+        self.aterrizajes_hora_sq += otro.aterrizajes_hora_sq
+        n = max(len(self.duraciones), len(otro.duraciones))
+        self.duraciones = (np.pad(self.duraciones, (0, n - len(self.duraciones)))
+                           + np.pad(otro.duraciones, (0, n - len(otro.duraciones))))
+        for nombre in self.componentes:
+            self.componentes[nombre] += otro.componentes[nombre]
+        return self
+
+    # horas de reloj (6, 7, ..., 23) de cada posicion de los arrays por hora
+    def horas_reloj(self):
+        return np.arange(6, 6 + self.horas)
+
+    # aterrizajes promedio por hora y su desvio entre replicas
+    def aterrizajes_por_hora(self):
+        n = max(self.n_replicas, 1)
+        media = self.aterrizajes_hora / n
+        var = self.aterrizajes_hora_sq / n - media ** 2
+        if self.n_replicas > 1:
+            var *= self.n_replicas / (self.n_replicas - 1)
+        return media, np.sqrt(np.maximum(var, 0))
+
+    # proporcion de los aterrizajes que ocurre en cada hora
+    def proporcion_por_hora(self):
+        total = self.aterrizajes_hora.sum()
+        return self.aterrizajes_hora / total if total > 0 else self.aterrizajes_hora
+
+    # histograma exacto de atrasos: (valores de atraso en minutos, cantidad de aviones con ese atraso)
+    def atrasos(self):
+        k = np.flatnonzero(self.duraciones)
+        return k - self.base, self.duraciones[k]
+
+    # atraso medio y su desvio
+    def atraso_medio(self):
+        valores, conteos = self.atrasos()
+        n = conteos.sum()
+        if n == 0:
+            return 0.0, 0.0
+        media = float((valores * conteos).sum() / n)
+        var = float((conteos * (valores - media) ** 2).sum() / n)
+        return media, var ** 0.5
+
+    # atraso medio por avion aterrizado separado en congestion, holding, go-around y cierre de pista
+    def atraso_por_componente(self):
+        n = max(int(self.duraciones.sum()), 1)
+        return {nombre: total / n for nombre, total in self.componentes.items()}
+
+    # metricas de eficiencia promedio por replica
+    def eficiencia(self):
+        n = max(self.n_replicas, 1)
+        total = max(self.aviones, 1)
+        return {
+            'aviones_promedio': self.aviones / n,
+            'aterrizados_promedio': self.aterrizados / n,
+            'montevideo_promedio': self.montevideo / n,
+            'en_vuelo_promedio': self.en_vuelo / n,
+            'en_aproximacion_promedio': self.en_aproximacion / n,
+            'pct_aterrizados': 100 * self.aterrizados / total,
+            'pct_montevideo': 100 * self.montevideo / total,
+        }
+
+# funcion que corre n_mc simulaciones agregando cada una apenas termina
+def montecarlo_agregado(lambda_prob, total_minutes=1080, n_mc=1000, seed=None, sim_func=simulate_planes):
+    """
+    Corre n_mc réplicas de sim_func y devuelve un AgregadorMC; los aviones de cada réplica
+    se descartan después de agregarlos, así la memoria no crece con n_mc.
+    """
+    if seed is not None:
+        random.seed(seed)
+    agregador = AgregadorMC(total_minutes)
+    for _ in range(n_mc):
+        agregador.agregar(sim_func(lambda_prob, total_minutes)[0])
+    return agregador
+
+# funcion principal: resumen de un Monte Carlo agregado
+def main():
+    import tracemalloc
+    tracemalloc.start()
+    agr = montecarlo_agregado(0.16355, 1080, n_mc=200, seed=42)
+    _, pico = tracemalloc.get_traced_memory()
+    ef = agr.eficiencia()
+    print(f"Réplicas: {agr.n_replicas}, memoria pico: {pico/1024:.0f} KB")
+    print(f"Aviones promedio: {ef['aviones_promedio']:.1f} | aterrizados {ef['pct_aterrizados']:.1f}% | Montevideo {ef['pct_montevideo']:.1f}%")
+    media, desvio = agr.atraso_medio()
+    print(f"Atraso medio contra {agr.base:.2f} min desde 100 mn: {media:.2f} ± {desvio:.2f} min")
+    print('  ' + ' | '.join(f"{nombre}: {x:.2f} min" for nombre, x in agr.atraso_por_componente().items()))
+    prom, _ = agr.aterrizajes_por_hora()
+    for hora, x in zip(agr.horas_reloj(), prom):
+        print(f"  {hora:02d}h: {x:.2f} aterrizajes")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,176 @@
+# animacion rapida de las trayectorias de una simulacion (distancia a AEP de cada avion, minuto a minuto).
+# Las trayectorias se pasan primero a arrays (minuto x avion) y cada cuadro solo actualiza los datos de
+# artistas creados una vez: un scatter (set_offsets + set_array para el color por estado) y el texto
+# del reloj. Con blit=True matplotlib redibuja solo esos artistas sobre el fondo ya dibujado.
+# Se puede mostrar en pantalla / notebook o escribir directo a un archivo .gif (Pillow) o .mp4 (ffmpeg).
+# Al escribir a archivo tampoco se redibuja la figura: se copia el fondo una vez, en cada cuadro se
+# restaura y se dibujan solo los artistas, y el buffer RGBA del canvas va directo al encoder.
+import subprocess
+import numpy as np
+from main import minutos_a_hora
+
+# estados que se dibujan (codigo del array estados)
+OCULTO, APROXIMACION, REJOIN = 0, 1, 2
+CARRILES = 24  # filas verticales en las que se reparten los aviones para que no se superpongan
+
+# funcion que pasa las trayectorias (positions) de los aviones a arrays minuto x avion
+def trayectorias(planes, total_minutes=1080):
+    """
+    Returns:
+        (dist, estados): arrays de forma (total_minutes + 1, len(planes)). dist tiene la distancia a AEP
+        (NaN si el avión no está en vuelo en ese minuto) y estados el código OCULTO/APROXIMACION/REJOIN
+    """
+    n = len(planes)
+    dist = np.full((total_minutes + 1, n), np.nan, dtype=np.float32)
+    for j, p in enumerate(planes):
+        pos = np.asarray(p.positions, dtype=float)
+        minutos = pos[:, 0].astype(np.int64)
+        dentro = (minutos >= 0) & (minutos <= total_minutes)
+        # si hay dos posiciones en el mismo minuto (reingreso desde rejoin) queda la ultima
+        dist[minutos[dentro], j] = pos[dentro, 1]
+        # al aterrizar (distancia 0) el avion deja de dibujarse
+        if p.status == 'landed' and p.landed_time is not None and p.landed_time <= total_minutes:
+            dist[int(p.landed_time), j] = np.nan
+    estados = np.where(np.isnan(dist), OCULTO, APROXIMACION).astype(np.int8)
+    # volando hacia atras: la distancia crecio respecto del minuto anterior
+    crece = np.zeros_like(estados, dtype=bool)
+    crece[1:] = dist[1:] > dist[:-1]
+    estados[crece] = REJOIN
+    return dist, estados
+
+# clase Animacion que arma la figura y los artistas una sola vez y actualiza sus datos en cada cuadro
+class Animacion:
+    def __init__(self, planes, total_minutes=1080, paso=1, figsize=(12, 6)):
+        import matplotlib.pyplot as plt
+        from matplotlib.colors import ListedColormap
+        self.dist, self.estados = trayectorias(planes, total_minutes)
+        self.cuadros = np.arange(0, total_minutes + 1, paso)
+        n = self.dist.shape[1]
+        self.offsets = np.zeros((n, 2))
+        self.offsets[:, 1] = np.array([p.id % CARRILES for p in planes], dtype=float)
+        self.fig, self.ax = plt.subplots(figsize=figsize)
+        ax = self.ax
+        ax.set_xlim(105, -2)
+        ax.set_ylim(-1, CARRILES)
+        ax.set_yticks([])
+        ax.set_xlabel('Distancia a AEP (mn)')
+        for limite in (100, 50, 15, 5):
+            ax.axvline(limite, color='gray', linestyle=':', alpha=0.5)
+        cmap = ListedColormap(['white', 'steelblue', 'indianred'])
+        self.scatter = ax.scatter(self.offsets[:, 0], self.offsets[:, 1], c=np.zeros(n), cmap=cmap, vmin=0, vmax=2,
+                                  s=30, marker='>', animated=True)
+        self.texto = ax.text(0.01, 0.97, '', transform=ax.transAxes, va='top', animated=True)
+        ax.set_title('Aproximación a AEP (azul: en aproximación, rojo: rejoin)')
+        self.fig.tight_layout()
+
+    def _inicio(self):
+        self.scatter.set_offsets(np.empty((0, 2)))
+        self.texto.set_text('')
+        return self.scatter, self.texto
+
+    def _cuadro(self, k):
+        t = self.cuadros[k]
+        self.offsets[:, 0] = self.dist[t]
+        self.scatter.set_offsets(self.offsets)
+        self.scatter.set_array(self.estados[t])
+        en_vuelo = int((self.estados[t] != OCULTO).sum())
+        self.texto.set_text(f"{minutos_a_hora(int(t))}  en vuelo: {en_vuelo}")
+        return self.scatter, self.texto
+
+    # devuelve el FuncAnimation (para mostrar en pantalla o en un notebook)
+    def animacion(self, intervalo_ms=30):
+        from matplotlib.animation import FuncAnimation
+        return FuncAnimation(self.fig, self._cuadro, frames=len(self.cuadros), init_func=self._inicio,
+                             interval=intervalo_ms, blit=True)
+
+    # genera los cuadros como arrays RGBA (alto x ancho x 4) usando blitting sobre el fondo fijo
+    def cuadros_rgba(self, dpi=80):
+        from matplotlib.backends.backend_agg import FigureCanvasAgg
+        self.fig.set_dpi(dpi)
+        canvas = self.fig.canvas
+        if not hasattr(canvas, 'copy_from_bbox') or not hasattr(canvas, 'buffer_rgba'):
+            canvas = FigureCanvasAgg(self.fig)
+        self._inicio()
+        canvas.draw()
+        fondo = canvas.copy_from_bbox(self.fig.bbox)
+        for k in range(len(self.cuadros)):
+            canvas.restore_region(fondo)
+            for artista in self._cuadro(k):
+                self.ax.draw_artist(artista)
+            yield np.asarray(canvas.buffer_rgba())
+
+    # escribe la animacion a un archivo .gif o .mp4
+    def guardar(self, archivo, fps=30, dpi=80):
+        if archivo.lower().endswith('.gif'):
+            self._guardar_gif(archivo, fps, dpi)
+        elif archivo.lower().endswith('.mp4'):
+            self._guardar_mp4(archivo, fps, dpi)
+        else:
+            raise ValueError(f"Formato de animación no soportado: {archivo} (usar .gif o .mp4)")
+
+    def _guardar_gif(self, archivo, fps, dpi):
+        from PIL import Image
+        cuadros = []
+        paleta = None
+        for rgba in self.cuadros_rgba(dpi):
+            imagen = Image.fromarray(rgba[..., :3])
+            if paleta is None:
+                # paleta fija: cuantizar cada cuadro contra ella es mucho mas rapido que una paleta por cuadro.
+                # Se arma con el primer cuadro mas una franja con los colores de los estados (en el primer
+                # cuadro puede no haber ningun avion)
+                colores = (self.scatter.cmap(np.linspace(0, 1, 3))[:, :3] * 255).astype(np.uint8)
+                franja = np.repeat(colores, max(1, rgba.shape[0] // 3 + 1), axis=0)[:rgba.shape[0]]
+                muestra = np.concatenate([rgba[..., :3], np.repeat(franja[:, None, :], 16, axis=1)], axis=1)
+                paleta = Image.fromarray(muestra).quantize(colors=64)
+            cuadros.append(imagen.quantize(palette=paleta, dither=Image.Dither.NONE))
+        # disposal=1 y sin optimize: Pillow no compara cuadro contra cuadro, que es lo mas lento al escribir
+        cuadros[0].save(archivo, save_all=True, append_images=cuadros[1:], duration=1000 / fps, loop=0,
+                        optimize=False, disposal=1)
+
+    def _guardar_mp4(self, archivo, fps, dpi):
+        from matplotlib import rcParams
+        from matplotlib.animation import FFMpegWriter
+        if not FFMpegWriter.isAvailable():
+            raise RuntimeError("Para escribir .mp4 hace falta ffmpeg instalado; usar un archivo .gif")
+        proceso = None
+        try:
+            for rgba in self.cuadros_rgba(dpi):
+                if proceso is None:
+                    alto, ancho = rgba.shape[:2]
+                    proceso = subprocess.Popen(
+                        [rcParams['animation.ffmpeg_path'], '-y', '-loglevel', 'error',
+                         '-f', 'rawvideo', '-pix_fmt', 'rgba', '-s', f'{ancho}x{alto}', '-r', str(fps), '-i', '-',
+                         '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2', '-pix_fmt', 'yuv420p', '-vcodec', 'libx264', archivo],
+                        stdin=subprocess.PIPE)
+                proceso.stdin.write(rgba.tobytes())
+        finally:
+            if proceso is not None:
+                proceso.stdin.close()
+                if proceso.wait() != 0:
+                    raise RuntimeError(f"ffmpeg terminó con código {proceso.returncode} al escribir {archivo}")
+
+# funcion que anima una simulacion: la muestra o, si se pasa archivo, la escribe a .gif/.mp4
+def animar(planes, total_minutes=1080, archivo=None, paso=1, fps=30, dpi=80):
+    anim = Animacion(planes, total_minutes, paso)
+    if archivo is not None:
+        anim.guardar(archivo, fps, dpi)
+        return anim
+    import matplotlib.pyplot as plt
+    anim.funcanimation = anim.animacion()
+    plt.show()
+    return anim
+
+# funcion principal: anima un dia completo con lambda alta y lo guarda como gif
+def main():
+    import random
+    import time
+    from main import simulate_planes
+    random.seed(42)
+    total_minutes = 1080
+    planes, _ = simulate_planes(0.5, total_minutes)
+    t0 = time.perf_counter()
+    animar(planes, total_minutes, archivo='trayectorias.gif', paso=2, fps=30)
+    print(f"{len(planes)} aviones, animación guardada en trayectorias.gif en {time.perf_counter() - t0:.1f} s")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,99 @@
+# barrido en lambda con numeros aleatorios comunes (thinning acoplado).
+# En vez de simular cada lambda de forma independiente, en cada replica se genera un unico
+# "superstream" de arribos con la lambda maxima: para cada minuto t se sortea una marca u_t ~ U(0, 1)
+# y hay arribo con lambda_max si u_t < lambda_max. El stream de una lambda menor se obtiene quedandose
+# con los arribos cuya marca cumple u_t < lambda (thinning): tiene exactamente la misma ley que
+# sortear random.random() < lambda minuto a minuto, pero los arribos de una lambda chica son un
+# subconjunto de los de una lambda grande y cada avion conserva su velocidad inicial.
+# Asi todas las lambdas comparten los numeros aleatorios y las curvas salen suaves y monotonas
+# con muchas menos replicas, y refinar el eje lambda es casi gratis.
+# Para lambda_max > 1 (varios arribos por minuto, ver main.Simulacion) cada minuto tiene ceil(lambda_max)
+# lugares: el lugar j tiene marca j + u_{t,j} y hay arribo si la marca es menor a lambda, asi cada minuto
+# recibe int(lambda) arribos mas uno con probabilidad igual a la parte fraccionaria.
+# Con un perfil (ver perfiles.py) las lambdas del barrido son escalas del perfil: la marca de cada
+# lugar se divide por lambda(t), asi hay arribo con escala s si j + u_{t,j} < s * lambda(t).
+import numpy as np
+from main import simulate_planes
+from checkpoint import guardar_checkpoint, cargar_checkpoint, borrar_checkpoint
+
+# funcion que genera el superstream de arribos para lambda_max
+def generar_superstream(lambda_max, total_minutes, rng, perfil=None):
+    """
+    Sortea los arribos de un día con tasa lambda_max.
+
+    Args:
+        lambda_max: probabilidad de arribo por minuto más grande del barrido
+        total_minutes: duración de la simulación
+        rng: np.random.Generator
+        perfil: PerfilLlegadas opcional; si se pasa, lambda_max es la escala máxima del perfil
+
+    Returns:
+        dict con 'minutos' (minuto de cada arribo), 'marcas' (menores a lambda_max) y 'speed_u' (uniforme de la velocidad inicial)
+    """
+    if perfil is None:
+        lugares = max(1, int(np.ceil(lambda_max)))
+        marcas = rng.random((total_minutes, lugares)) + np.arange(lugares)
+        minutos, lugar = np.nonzero(marcas < lambda_max)
+        marcas = marcas[minutos, lugar]
+    else:
+        intensidad = perfil.vector(total_minutes)
+        lugares = max(1, int(np.ceil(lambda_max * intensidad.max())))
+        marcas = rng.random((total_minutes, lugares)) + np.arange(lugares)
+        minutos, lugar = np.nonzero(marcas < lambda_max * intensidad[:, None])
+        marcas = marcas[minutos, lugar] / intensidad[minutos]
+    return {
+        'minutos': minutos,
+        'marcas': marcas,
+        'speed_u': rng.random(len(minutos)),
+    }
+
+# funcion que obtiene los arribos de una lambda menor por thinning del superstream
+def adelgazar(stream, lambda_prob):
+    """
+    Devuelve la lista de (minuto, speed_u) para lambda_prob, en el formato que aceptan
+    simulate_planes(..., arribos=...) y simulate_dia_ventoso(..., arribos=...).
+    """
+    keep = stream['marcas'] < lambda_prob
+    return list(zip(stream['minutos'][keep].tolist(), stream['speed_u'][keep].tolist()))
+
+# funcion que corre un barrido en lambda compartiendo los numeros aleatorios entre lambdas
+def barrido_lambdas(lambdas_prob, total_minutes, n_mc, metrica, sim_func=simulate_planes, seed=None,
+                    checkpoint=None, checkpoint_cada=50, perfil=None):
+    """
+    Ejecuta n_mc réplicas; en cada una simula todas las lambdas a partir del mismo superstream.
+
+    Args:
+        lambdas_prob: valores de lambda a evaluar
+        total_minutes: duración de cada simulación
+        n_mc: cantidad de réplicas
+        metrica: función que recibe el resultado de sim_func y devuelve una tupla de floats
+        sim_func: simulador que acepta (lambda_prob, total_minutes, arribos=...)
+        seed: semilla del generador (None para no fijarla)
+        checkpoint: archivo opcional de checkpoint para poder reanudar el barrido
+        perfil: PerfilLlegadas opcional; si se pasa, las lambdas son escalas del perfil
+
+    Returns:
+        dict lambda -> np.array de forma (n_mc, k) con las métricas de cada réplica
+    """
+    lambdas_prob = list(lambdas_prob)
+    lambda_max = max(lambdas_prob)
+    params = {'lambdas': lambdas_prob, 'total_minutes': total_minutes, 'n_mc': n_mc, 'seed': seed,
+              'sim_func': getattr(sim_func, '__name__', str(sim_func))}
+    if perfil is not None:
+        params['perfil'] = perfil.como_dict()
+    rng = np.random.default_rng(seed)
+    filas = {lam: [] for lam in lambdas_prob}
+    rep_inicio = 0
+    estado = cargar_checkpoint(checkpoint, params)
+    if estado is not None:
+        filas = estado['filas']
+        rep_inicio = estado['rep']
+        rng.bit_generator.state = estado['rng']
+    for rep in range(rep_inicio, n_mc):
+        stream = generar_superstream(lambda_max, total_minutes, rng, perfil)
+        for lam in lambdas_prob:
+            filas[lam].append(tuple(metrica(sim_func(lam, total_minutes, arribos=adelgazar(stream, lam)))))
+        if checkpoint is not None and (rep + 1) % checkpoint_cada == 0 and rep + 1 < n_mc:
+            guardar_checkpoint(checkpoint, params, {'filas': filas, 'rep': rep + 1, 'rng': rng.bit_generator.state})
+    borrar_checkpoint(checkpoint)
+    return {lam: np.array(filas[lam], dtype=float) for lam in lambdas_prob}
@@ -0,0 +1,149 @@
+# benchmarks de los simuladores: tiempo, memoria pico y throughput (aviones por segundo)
+# para simulate_planes, simulate_storm_closure, simulate_dia_ventoso y cinco_aviones_1hora
+# sobre una matriz lambda x horizonte. Los resultados se guardan en JSON y se comparan contra
+# un baseline guardado; si algun caso es mas lento que el baseline por encima del umbral,
+# el script termina con codigo de salida 1.
+#
+# Uso:
+#   python benchmarks/bench_simuladores.py --guardar-baseline      # genera benchmarks/baseline.json
+#   python benchmarks/bench_simuladores.py                         # compara contra el baseline
+#   python benchmarks/bench_simuladores.py --lambdas 0.1 0.5 --horizontes 1080 --repeticiones 5
+import argparse
+import json
+import os
+import platform
+import random
+import sys
+import time
+import tracemalloc
+from datetime import datetime
+
+_RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(_RAIZ)
+sys.path.append(os.path.join(_RAIZ, 'Ejercicio5'))
+sys.path.append(os.path.join(_RAIZ, 'Ejercicio6'))
+
+BASELINE_DEFAULT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'baseline.json')
+SALIDA_DEFAULT = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'resultados.json')
+
+# casos a medir: nombre -> funcion (lambda_prob, total_minutes) -> cantidad de aviones generados
+def _casos():
+    from main import simulate_planes
+    from ejercicio2y3 import cinco_aviones_1hora
+    from ejercicio6 import simulate_storm_closure
+    from dia_ventoso import simulate_dia_ventoso
+
+    def storm(lam, T):
+        return len(simulate_storm_closure(lam, T, storm_start=T // 2)[0])
+
+    def cinco(lam, T):
+        # solo sortea los minutos de arribo: se usa la cantidad esperada de aviones
+        cinco_aviones_1hora(lam, T)
+        return lam * T
+
+    return {
+        'simulate_planes': lambda lam, T: len(simulate_planes(lam, T)[0]),
+        'simulate_storm_closure': storm,
+        'simulate_dia_ventoso': lambda lam, T: len(simulate_dia_ventoso(lam, T)[0]),
+        'cinco_aviones_1hora': cinco,
+    }
+
+# funcion que mide un caso: mejor tiempo de varias repeticiones y memoria pico (en una corrida aparte)
+def medir(func, lam, T, repeticiones, seed=0):
+    tiempos = []
+    # corrida de calentamiento (imports perezosos, caches del interprete)
+    random.seed(seed)
+    aviones = func(lam, T)
+    for rep in range(repeticiones):
+        random.seed(seed + rep)
+        t0 = time.perf_counter()
+        aviones = func(lam, T)
+        tiempos.append(time.perf_counter() - t0)
+    # tracemalloc hace mas lenta la ejecucion, por eso la memoria se mide en una corrida separada
+    random.seed(seed)
+    tracemalloc.start()
+    func(lam, T)
+    _, pico = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    mejor = min(tiempos)
+    return {
+        'tiempo_s': mejor,
+        'tiempo_medio_s': sum(tiempos) / len(tiempos),
+        'memoria_pico_kb': pico / 1024,
+        'aviones': aviones,
+        'aviones_por_s': aviones / mejor if mejor > 0 else float('inf'),
+    }
+
+def _clave(r):
+    return (r['caso'], r['lambda'], r['horizonte'])
+
+# funcion que compara resultados contra un baseline y devuelve la lista de regresiones
+def comparar(resultados, baseline, umbral):
+    base = {_clave(r): r for r in baseline['resultados']}
+    regresiones = []
+    print(f"\n{'caso':<24}{'λ':>6}{'horiz.':>8}{'base (s)':>11}{'actual (s)':>12}{'ratio':>8}")
+    for r in resultados:
+        b = base.get(_clave(r))
+        if b is None:
+            continue
+        ratio = r['tiempo_s'] / b['tiempo_s'] if b['tiempo_s'] > 0 else float('inf')
+        marca = ''
+        if ratio > 1 + umbral:
+            marca = '  << REGRESIÓN'
+            regresiones.append((r, ratio))
+        elif ratio < 1 / (1 + umbral):
+            marca = '  (más rápido)'
+        print(f"{r['caso']:<24}{r['lambda']:>6}{r['horizonte']:>8}{b['tiempo_s']:>11.4f}{r['tiempo_s']:>12.4f}{ratio:>8.2f}{marca}")
+    return regresiones
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Benchmarks de los simuladores de arribos a AEP")
+    parser.add_argument('--lambdas', type=float, nargs='+', default=[0.05, 0.2, 0.5])
+    parser.add_argument('--horizontes', type=int, nargs='+', default=[360, 1080])
+    parser.add_argument('--casos', nargs='+', default=None, help="subconjunto de casos a medir")
+    parser.add_argument('--repeticiones', type=int, default=5)
+    parser.add_argument('--salida', default=SALIDA_DEFAULT, help="archivo JSON con los resultados")
+    parser.add_argument('--baseline', default=BASELINE_DEFAULT, help="archivo JSON de baseline")
+    parser.add_argument('--guardar-baseline', action='store_true', help="guardar los resultados como nuevo baseline")
+    parser.add_argument('--umbral', type=float, default=0.25, help="regresión si tiempo > baseline * (1 + umbral)")
+    args = parser.parse_args(argv)
+
+    casos = _casos()
+    nombres = args.casos or list(casos)
+    resultados = []
+    for nombre in nombres:
+        for lam in args.lambdas:
+            for T in args.horizontes:
+                r = medir(casos[nombre], lam, T, args.repeticiones)
+                r.update({'caso': nombre, 'lambda': lam, 'horizonte': T})
+                resultados.append(r)
+                print(f"{nombre:<24} λ={lam:<5} T={T:<6} {r['tiempo_s']*1000:9.1f} ms  "
+                      f"{r['memoria_pico_kb']:9.0f} KB  {r['aviones_por_s']:10.0f} aviones/s")
+
+    data = {
+        'meta': {
+            'fecha': datetime.now().isoformat(timespec='seconds'),
+            'python': platform.python_version(),
+            'plataforma': platform.platform(),
+            'repeticiones': args.repeticiones,
+        },
+        'resultados': resultados,
+    }
+    destino = args.baseline if args.guardar_baseline else args.salida
+    with open(destino, 'w', encoding='utf-8') as f:
+        json.dump(data, f, indent=2)
+    print(f"\nResultados guardados en {destino}")
+
+    if args.guardar_baseline or not os.path.exists(args.baseline):
+        return 0
+    with open(args.baseline, 'r', encoding='utf-8') as f:
+        baseline = json.load(f)
+    regresiones = comparar(resultados, baseline, args.umbral)
+    if regresiones:
+        print(f"\n{len(regresiones)} caso(s) más lentos que el baseline por encima del {args.umbral*100:.0f}%")
+        return 1
+    print("\nSin regresiones respecto del baseline")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
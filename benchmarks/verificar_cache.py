@@ -0,0 +1,72 @@
+# verificacion del cache de resultados desde la linea de comandos: corre cada comando dos veces con la misma
+# semilla sobre un directorio de cache temporal (ACN_CACHE_DIR). La primera corrida calcula y guarda, la
+# segunda lee del cache; las dos tienen que terminar sin error e imprimir la misma tabla (sin contar la
+# primera linea, que lleva el tiempo). Si algun comando falla, el script termina con codigo de salida 1.
+#
+# Uso:
+#   python benchmarks/verificar_cache.py
+import io
+import os
+import sys
+import tempfile
+import traceback
+from contextlib import redirect_stdout
+
+_RAIZ = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.append(_RAIZ)
+sys.path.append(os.path.join(_RAIZ, 'Ejercicio5'))
+sys.path.append(os.path.join(_RAIZ, 'Ejercicio6'))
+
+# comandos a verificar: nombre -> (funcion main, argumentos chicos para que corra rapido)
+def _comandos():
+    import evaluar_politicas
+    import sensibilidad
+    return {
+        'evaluar_politicas': (evaluar_politicas.main,
+                              ['--replicas', '3', '--horizonte', '240', '--workers', '1', '--seed', '42']),
+        'sensibilidad morris': (sensibilidad.main,
+                                ['--metodo', 'morris', '--n', '2', '--replicas', '1', '--horizonte', '240',
+                                 '--workers', '1', '--seed', '42']),
+        'sensibilidad sobol': (sensibilidad.main,
+                               ['--metodo', 'sobol', '--n', '4', '--replicas', '1', '--horizonte', '240',
+                                '--workers', '1', '--seed', '42']),
+    }
+
+# funcion que corre main(argv) y devuelve lo que imprime (None si fallo)
+def _correr(main, argv):
+    salida = io.StringIO()
+    try:
+        with redirect_stdout(salida):
+            main(argv)
+    except Exception:
+        traceback.print_exc()
+        return None
+    return salida.getvalue()
+
+# funcion principal
+def main():
+    import cache_resultados
+    fallas = []
+    with tempfile.TemporaryDirectory() as directorio:
+        os.environ['ACN_CACHE_DIR'] = directorio
+        cache_resultados._cache_default = None
+        for nombre, (principal, argv) in _comandos().items():
+            corridas = [_correr(principal, argv) for _ in range(2)]
+            if None in corridas:
+                estado = 'falla en la corrida ' + ('con cache' if corridas[0] is not None else 'sin cache')
+            elif corridas[0].splitlines()[1:] != corridas[1].splitlines()[1:]:
+                estado = 'la corrida con cache imprime otra tabla'
+            else:
+                estado = 'OK'
+            print(f"{nombre:<20} {estado}")
+            if estado != 'OK':
+                fallas.append(nombre)
+    cache_resultados._cache_default = None
+    if fallas:
+        print(f"\n{len(fallas)} comando(s) fallan al leer del cache: {', '.join(fallas)}")
+        return 1
+    print("\nTodos los comandos leen bien del cache")
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,198 @@
+# cache persistente en disco para resultados agregados de simulaciones Monte Carlo.
+# Cada resultado se guarda bajo un hash de (escenario, parametros, semilla, version del codigo),
+# como .npz si es un diccionario de arrays o como .json en cualquier otro caso (los arrays que van dentro
+# del JSON se marcan con su dtype y se reconstruyen al leer, asi un acierto devuelve los mismos tipos que el calculo).
+# El tamaño total del directorio se mantiene acotado desalojando los archivos usados hace mas tiempo (LRU).
+import hashlib
+import json
+import os
+import numpy as np
+
+# directorio y tamaño maximo por defecto del cache
+CACHE_DIR_DEFAULT = os.path.join(os.path.dirname(os.path.abspath(__file__)), '.cache_mc')
+CACHE_MAX_BYTES_DEFAULT = 256 * 1024 * 1024  # 256 MB
+
+# version del formato de los archivos: entra en la clave, asi no se leen resultados guardados con otro formato
+# (antes de marcar los arrays, los JSON los guardaban como listas)
+FORMATO_CACHE = 2
+
+# archivo del simulador base, cuya version entra siempre en la clave
+_MAIN_PY = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'main.py')
+
+# funcion que calcula un hash del codigo fuente de los archivos dados (siempre incluye main.py)
+def version_codigo(*archivos):
+    """
+    Devuelve un hash corto del contenido de main.py y de los archivos indicados.
+    Si el código de la simulación cambia, cambia la versión y el cache viejo deja de usarse.
+    """
+    h = hashlib.sha256()
+    for path in sorted(set((_MAIN_PY,) + tuple(os.path.abspath(a) for a in archivos))):
+        try:
+            with open(path, 'rb') as f:
+                h.update(f.read())
+        except OSError:
+            h.update(path.encode())
+    return h.hexdigest()[:16]
+
+# convierte recursivamente un valor a algo serializable en JSON (dicts con claves no-string, tipos numpy, tuplas);
+# los arrays se guardan como {'__ndarray__': lista, 'dtype': ..., 'shape': ...}
+def _a_json(valor):
+    if isinstance(valor, dict):
+        if all(isinstance(k, str) for k in valor):
+            return {k: _a_json(v) for k, v in valor.items()}
+        return {'__items__': [[_a_json(k), _a_json(v)] for k, v in valor.items()]}
+    if isinstance(valor, (list, tuple)):
+        return [_a_json(v) for v in valor]
+    if isinstance(valor, np.ndarray):
+        return {'__ndarray__': valor.tolist(), 'dtype': valor.dtype.str, 'shape': list(valor.shape)}
+    if isinstance(valor, np.generic):
+        return valor.item()
+    return valor
+
+# inversa de _a_json para los diccionarios con claves no-string y los arrays
+def _desde_json(valor):
+    if isinstance(valor, dict):
+        if set(valor) == {'__ndarray__', 'dtype', 'shape'}:
+            return np.asarray(valor['__ndarray__'], dtype=np.dtype(valor['dtype'])).reshape(valor['shape'])
+        if set(valor) == {'__items__'}:
+            return {_clave_hashable(_desde_json(k)): _desde_json(v) for k, v in valor['__items__']}
+        return {k: _desde_json(v) for k, v in valor.items()}
+    if isinstance(valor, list):
+        return [_desde_json(v) for v in valor]
+    return valor
+
+def _clave_hashable(k):
+    return tuple(k) if isinstance(k, list) else k
+
+# funcion que arma la clave del cache para un escenario y sus parametros
+def clave_cache(escenario, params, archivos=()):
+    """
+    Calcula la clave (hash sha256) de un resultado.
+
+    Args:
+        escenario: nombre del barrido/escenario (ej. 'ejercicio4.montecarlo_desvios')
+        params: diccionario con los parámetros que determinan el resultado (λ, total_minutes, n_mc, seed, ...)
+        archivos: archivos de código adicionales cuya versión afecta el resultado
+    """
+    payload = json.dumps({
+        'escenario': escenario,
+        'params': _a_json(params),
+        'version': version_codigo(*archivos),
+        'formato': FORMATO_CACHE,
+    }, sort_keys=True)
+    return hashlib.sha256(payload.encode()).hexdigest()
+
+# clase CacheResultados que guarda y recupera resultados agregados en disco con desalojo LRU
+class CacheResultados:
+    def __init__(self, directorio=None, max_bytes=CACHE_MAX_BYTES_DEFAULT):
+        self.directorio = directorio or os.environ.get('ACN_CACHE_DIR', CACHE_DIR_DEFAULT)
+        self.max_bytes = max_bytes
+        os.makedirs(self.directorio, exist_ok=True)
+
+    def _path(self, clave, ext):
+        return os.path.join(self.directorio, f"{clave}.{ext}")
+
+    # devuelve el resultado guardado bajo clave, o None si no existe
+    def obtener(self, clave):
+        for ext in ('npz', 'json'):
+            path = self._path(clave, ext)
+            if not os.path.exists(path):
+                continue
+            try:
+                if ext == 'npz':
+                    with np.load(path, allow_pickle=False) as data:
+                        valor = {k: data[k] for k in data.files}
+                else:
+                    with open(path, 'r', encoding='utf-8') as f:
+                        valor = _desde_json(json.load(f))
+            except (OSError, ValueError):
+                # archivo corrupto o truncado: se descarta
+                self._borrar(path)
+                return None
+            # marcar como usado recientemente (LRU por fecha de modificacion)
+            os.utime(path, None)
+            return valor
+        return None
+
+    # guarda un resultado bajo clave (npz si es un dict de arrays, JSON en otro caso)
+    def guardar(self, clave, valor):
+        es_arrays = isinstance(valor, dict) and valor and all(isinstance(v, np.ndarray) for v in valor.values())
+        ext = 'npz' if es_arrays else 'json'
+        path = self._path(clave, ext)
+        tmp = f"{path}.{os.getpid()}.tmp"
+        if es_arrays:
+            with open(tmp, 'wb') as f:
+                np.savez(f, **valor)
+        else:
+            with open(tmp, 'w', encoding='utf-8') as f:
+                json.dump(_a_json(valor), f)
+        # escritura atomica para que otro proceso nunca lea un archivo a medio escribir
+        os.replace(tmp, path)
+        self._desalojar()
+
+    def _borrar(self, path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    # borra los archivos menos usados recientemente hasta quedar por debajo de max_bytes
+    def _desalojar(self):
+        archivos = []
+        total = 0
+        for nombre in os.listdir(self.directorio):
+            if not (nombre.endswith('.npz') or nombre.endswith('.json')):
+                continue
+            path = os.path.join(self.directorio, nombre)
+            try:
+                st = os.stat(path)
+            except OSError:
+                continue
+            archivos.append((st.st_mtime, st.st_size, path))
+            total += st.st_size
+        archivos.sort()
+        for _, size, path in archivos:
+            if total <= self.max_bytes:
+                break
+            self._borrar(path)
+            total -= size
+
+    # borra todo el contenido del cache
+    def limpiar(self):
+        for nombre in os.listdir(self.directorio):
+            self._borrar(os.path.join(self.directorio, nombre))
+
+# cache compartido por los barridos (se crea la primera vez que se usa)
+_cache_default = None
+
+def cache_default():
+    global _cache_default
+    if _cache_default is None:
+        _cache_default = CacheResultados()
+    return _cache_default
+
+# funcion que memoiza en disco el resultado de calcular() para un escenario y sus parametros
+def memoizar(escenario, params, calcular, archivos=(), cache=None):
+    """
+    Devuelve el resultado cacheado para (escenario, params) o lo calcula y lo guarda.
+
+    Solo se cachea si params['seed'] no es None: sin semilla la corrida no es reproducible
+    y no tiene sentido reutilizarla.
+
+    Args:
+        escenario: nombre del escenario/barrido
+        params: parámetros de la corrida, debe incluir 'seed'
+        calcular: función sin argumentos que ejecuta la simulación y devuelve el resultado agregado
+        archivos: archivos de código (además de main.py) de los que depende el resultado
+        cache: CacheResultados a usar (False desactiva el cache, None usa el cache por defecto)
+    """
+    if cache is False or params.get('seed') is None:
+        return calcular()
+    if cache is None:
+        cache = cache_default()
+    clave = clave_cache(escenario, params, archivos)
+    valor = cache.obtener(clave)
+    if valor is None:
+        valor = calcular()
+        cache.guardar(clave, valor)
+    return valor
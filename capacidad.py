@@ -0,0 +1,112 @@
+# busqueda de la capacidad de AEP: la lambda maxima que mantiene la tasa de desvios a Montevideo
+# por debajo de un objetivo. En lugar de barrer una grilla densa de lambdas (como en ejercicio4.py)
+# se hace biseccion secuencial: en cada lambda probada se agregan replicas de a tandas hasta que el
+# intervalo de confianza de la tasa de desvios queda de un lado del objetivo (o se llega a n_max).
+import math
+import random
+from statistics import NormalDist
+from main import simulate_planes
+
+# funcion que calcula la tasa de desvios (montevideo / aviones aparecidos) de una simulacion
+def tasa_desvios(planes):
+    if not planes:
+        return 0.0
+    return len([p for p in planes if p.status == 'montevideo']) / len(planes)
+
+# funcion que prueba una lambda agregando replicas hasta poder decidir de que lado del objetivo esta
+def _probar_lambda(lambda_prob, objetivo, z, total_minutes, n_inicial, n_max, sim_func):
+    tasas = []
+    n_objetivo = n_inicial
+    while True:
+        while len(tasas) < n_objetivo:
+            planes = sim_func(lambda_prob, total_minutes)[0]
+            tasas.append(tasa_desvios(planes))
+        n = len(tasas)
+        media = sum(tasas) / n
+        var = sum((x - media) ** 2 for x in tasas) / (n - 1) if n > 1 else 0.0
+        semi = z * math.sqrt(var / n)
+        if media + semi < objetivo:
+            return 'debajo', media, semi, n
+        if media - semi > objetivo:
+            return 'encima', media, semi, n
+        if n >= n_max:
+            return 'indeciso', media, semi, n
+        # duplicar la cantidad de replicas en la proxima tanda
+        n_objetivo = min(2 * n, n_max)
+
+# funcion que busca la lambda maxima sostenible para una tasa de desvios objetivo
+def find_capacity(target_diversion_rate, confidence=0.95, lambda_min=0.001, lambda_max=1.0, total_minutes=1080,
+                  tol=0.005, n_inicial=8, n_max=256, seed=None, sim_func=simulate_planes, perfil=None):
+    """
+    Busca por bisección la mayor lambda cuya tasa de desvíos esperada no supera target_diversion_rate.
+
+    Args:
+        target_diversion_rate: tasa de desvíos aceptable (proporción entre 0 y 1)
+        confidence: nivel de confianza de cada decisión (y del intervalo devuelto)
+        lambda_min, lambda_max: intervalo inicial de búsqueda
+        total_minutes: duración de cada simulación
+        tol: ancho del intervalo de bisección en el que se corta la búsqueda
+        n_inicial, n_max: réplicas iniciales y máximas por lambda probada
+        seed: semilla de random (None para no fijarla)
+        sim_func: simulador con la firma de simulate_planes
+        perfil: PerfilLlegadas opcional (ver perfiles.py); si se pasa, se busca la escala máxima del perfil
+            y lambda_min, lambda_max y el resultado son escalas en vez de lambdas
+
+    Returns:
+        dict con 'lambda' (estimación), 'intervalo' (lambda_inf, lambda_sup), 'confidence',
+        'simulaciones' (total de simulaciones corridas) y 'probes' (lista de (lambda, media, semiancho, n, decisión))
+    """
+    if not 0 < target_diversion_rate < 1:
+        raise ValueError(f"target_diversion_rate debe estar entre 0 y 1, no {target_diversion_rate}")
+    if seed is not None:
+        random.seed(seed)
+    if perfil is not None:
+        from perfiles import con_perfil
+        sim_func = con_perfil(sim_func, perfil)
+    z = NormalDist().inv_cdf(1 - (1 - confidence) / 2)
+    lo, hi = lambda_min, lambda_max
+    # extremos del intervalo de confianza: mayor lambda claramente por debajo y menor lambda claramente por encima
+    inf_confiable, sup_confiable = lambda_min, None
+    probes = []
+    simulaciones = 0
+    while hi - lo > tol:
+        mid = (lo + hi) / 2
+        decision, media, semi, n = _probar_lambda(mid, target_diversion_rate, z, total_minutes, n_inicial, n_max, sim_func)
+        simulaciones += n
+        probes.append((mid, media, semi, n, decision))
+        if decision == 'debajo':
+            lo = mid
+            inf_confiable = max(inf_confiable, mid)
+        elif decision == 'encima':
+            hi = mid
+            sup_confiable = mid if sup_confiable is None else min(sup_confiable, mid)
+        else:
+            # no se pudo decidir con n_max replicas: la lambda esta dentro del intervalo de confianza
+            if media <= target_diversion_rate:
+                lo = mid
+            else:
+                hi = mid
+    if sup_confiable is None:
+        print(f"[ADVERTENCIA] No se encontró una lambda con desvíos claramente por encima del objetivo en [{lambda_min}, {lambda_max}]")
+        sup_confiable = lambda_max
+    return {
+        'lambda': (lo + hi) / 2,
+        'intervalo': (inf_confiable, sup_confiable),
+        'confidence': confidence,
+        'simulaciones': simulaciones,
+        'probes': probes,
+    }
+
+# funcion principal: ejemplo de busqueda de capacidad
+def main():
+    objetivo = 0.30
+    print(f"Buscando la lambda máxima con desvíos a Montevideo <= {objetivo*100:.0f}%")
+    res = find_capacity(objetivo, confidence=0.95, seed=42)
+    for lam, media, semi, n, decision in res['probes']:
+        print(f"  λ={lam:.4f}: desvíos = {media*100:.2f}% ± {semi*100:.2f}% (n={n}) -> {decision}")
+    inf, sup = res['intervalo']
+    print(f"Capacidad estimada: λ = {res['lambda']:.4f} aviones/min (IC {res['confidence']*100:.0f}%: [{inf:.4f}, {sup:.4f}])")
+    print(f"Simulaciones utilizadas: {res['simulaciones']}")
+
+if __name__ == "__main__":
+    main()
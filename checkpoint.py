@@ -0,0 +1,42 @@
+# checkpoints en disco para barridos Monte Carlo largos.
+# Un checkpoint guarda las estadisticas acumuladas y el estado del generador aleatorio (random.getstate()),
+# de modo que al reanudar desde el ultimo checkpoint el resultado final es identico al de una corrida sin cortes.
+import os
+import pickle
+
+# funcion que guarda el estado de un barrido en path de forma atomica
+def guardar_checkpoint(path, params, estado):
+    """
+    Guarda el estado de un barrido junto con los parámetros que lo generaron.
+
+    Args:
+        path: archivo de checkpoint
+        params: diccionario con los parámetros del barrido (para no reanudar un barrido distinto)
+        estado: diccionario con el estado acumulado (debe ser serializable con pickle)
+    """
+    tmp = f"{path}.{os.getpid()}.tmp"
+    with open(tmp, 'wb') as f:
+        pickle.dump({'params': params, 'estado': estado}, f, protocol=pickle.HIGHEST_PROTOCOL)
+        f.flush()
+        os.fsync(f.fileno())
+    # os.replace es atomico: si la maquina se cae a mitad de la escritura queda el checkpoint anterior
+    os.replace(tmp, path)
+
+# funcion que carga el estado de un barrido, o None si no hay checkpoint valido para estos parametros
+def cargar_checkpoint(path, params):
+    if path is None or not os.path.exists(path):
+        return None
+    try:
+        with open(path, 'rb') as f:
+            data = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError):
+        return None
+    if data.get('params') != params:
+        print(f"[ADVERTENCIA] El checkpoint {path} corresponde a otros parámetros, se ignora")
+        return None
+    return data['estado']
+
+# funcion que borra el checkpoint una vez terminado el barrido
+def borrar_checkpoint(path):
+    if path is not None and os.path.exists(path):
+        os.remove(path)
@@ -28,40 +28,45 @@ def cinco_aviones_1hora(lambda_prob, total_minutes):
     probability = count_target / total_intervals
     return probability
 
-# simulación Monte Carlo básica - solo estadísticas
-print("Simulación Monte Carlo de aproximación de aeronaves")
+# funcion principal: simulacion de un dia (ejercicio 2) y probabilidad de 5 aviones en una hora (ejercicio 3)
+def main():
+    # simulación Monte Carlo básica - solo estadísticas
+    print("Simulación Monte Carlo de aproximación de aeronaves")
 
-# calcular lambda para un arribo por hora 
-lambda_prob = 1 / 60
-# duración de la simulación en minutos
-total_minutes = 1080
+    # calcular lambda para un arribo por hora 
+    lambda_prob = 1 / 60
+    # duración de la simulación en minutos
+    total_minutes = 1080
 
-print(f"Parámetros de simulación:")
-print(f"  Lambda de aparición: {lambda_prob:.4f} aviones/minuto")
-print(f"  Duración: {total_minutes} minutos ({total_minutes/60:.1f} horas)")
-print(f"  Horario: 6:00am a {minutos_a_hora(total_minutes)}")
-print()
+    print(f"Parámetros de simulación:")
+    print(f"  Lambda de aparición: {lambda_prob:.4f} aviones/minuto")
+    print(f"  Duración: {total_minutes} minutos ({total_minutes/60:.1f} horas)")
+    print(f"  Horario: 6:00am a {minutos_a_hora(total_minutes)}")
+    print()
 
-# simulación
-planes, _ = simulate_planes(lambda_prob, total_minutes)
+    # simulación
+    planes, _ = simulate_planes(lambda_prob, total_minutes)
 
-# resumen
-print_summary(planes)
-print()
+    # resumen
+    print_summary(planes)
+    print()
      
-# simulación Monte Carlo básica - solo estadísticas
-print("Simulación Monte Carlo de aproximación de aeronaves")
+    # simulación Monte Carlo básica - solo estadísticas
+    print("Simulación Monte Carlo de aproximación de aeronaves")
 
-# calcular lambda para un arribo por hora 
-lambda_prob = 1 / 60
-# duración de la simulación en minutos
-total_minutes = 100000 * 60  # 100 horas
+    # calcular lambda para un arribo por hora 
+    lambda_prob = 1 / 60
+    # duración de la simulación en minutos
+    total_minutes = 100000 * 60  # 100 horas
 
-print(f"Parámetros de simulación:")
-print(f"  Lambda de aparición: {lambda_prob:.4f} aviones/minuto")
-print(f"  Duración: {total_minutes} minutos ({total_minutes/60:.1f} horas)")
-print()
+    print(f"Parámetros de simulación:")
+    print(f"  Lambda de aparición: {lambda_prob:.4f} aviones/minuto")
+    print(f"  Duración: {total_minutes} minutos ({total_minutes/60:.1f} horas)")
+    print()
 
-# simulación para el ejercicio 3
-prob_5_planes = cinco_aviones_1hora(lambda_prob, total_minutes)
-print(f"Probabilidad estimada de que lleguen 5 aviones en una hora: {prob_5_planes:.6f}")
\ No newline at end of file
+    # simulación para el ejercicio 3
+    prob_5_planes = cinco_aviones_1hora(lambda_prob, total_minutes)
+    print(f"Probabilidad estimada de que lleguen 5 aviones en una hora: {prob_5_planes:.6f}")
+
+if __name__ == "__main__":
+    main()
@@ -1,41 +1,107 @@
 
 # En este archivo ejecutamos simulaciones Monte Carlo para distintos valores de lambda
+import random
 from main import simulate_planes
+from cache_resultados import memoizar
+import barrido_lambda
+from checkpoint import guardar_checkpoint, cargar_checkpoint, borrar_checkpoint
 import numpy as np
-from tqdm import tqdm
 
-def montecarlo_desvios(lambdas_prob, total_minutes, n_mc=30):
+def montecarlo_desvios(lambdas_prob, total_minutes, n_mc=30, seed=None, cache=None, checkpoint=None, checkpoint_cada=50,
+                       modo='independiente', perfil=None):
     """
     Realiza simulaciones Monte Carlo para cada lambda, reportando media y desvío estándar de probabilidad de desvío y congestión.
+    Si se pasa una semilla, el resultado se guarda en el cache en disco y las corridas repetidas no se vuelven a simular.
+    Si se pasa un archivo de checkpoint, cada checkpoint_cada repeticiones se guardan las estadísticas acumuladas y el
+    estado del generador aleatorio; al volver a llamar con los mismos parámetros se reanuda desde ahí con idéntico resultado.
+    Con modo='thinning' todas las lambdas comparten los arribos de cada réplica (ver barrido_lambda.py).
+    Con un perfil de llegadas (ver perfiles.py) cada valor de lambdas_prob es una escala del perfil.
     """
-    resultados = {}
+    params = {'lambdas': list(lambdas_prob), 'total_minutes': total_minutes, 'n_mc': n_mc, 'seed': seed}
+    if perfil is not None:
+        params['perfil'] = perfil.como_dict()
+    if modo == 'thinning':
+        params['modo'] = modo
+        calcular = lambda: _montecarlo_desvios_thinning(lambdas_prob, total_minutes, n_mc, seed, checkpoint, checkpoint_cada, perfil)
+    elif modo == 'independiente':
+        calcular = lambda: _montecarlo_desvios(lambdas_prob, total_minutes, n_mc, seed, checkpoint, checkpoint_cada, perfil)
+    else:
+        raise ValueError(f"Modo de barrido desconocido: {modo}")
+    return memoizar('ejercicio4.montecarlo_desvios', params, calcular,
+                    archivos=(__file__, barrido_lambda.__file__), cache=cache)
+
+# funcion que calcula la probabilidad de desvio y de congestion de una replica
+def metricas_replica(planes):
+    total_planes = len(planes)
+    desviados = [p for p in planes if p.status == 'montevideo']
+    aterrizados = [p for p in planes if p.status == 'landed']
+    # Congestión: al menos un tramo volado más lento que su velocidad máxima (como antes)
+    congestionados = 0
+    for plane in aterrizados:
+        if hasattr(plane, 'positions') and len(plane.positions) > 1:
+            for i in range(len(plane.positions) - 1):
+                t1, d1 = plane.positions[i]
+                t2, d2 = plane.positions[i + 1]
+                if t2 > t1:
+                    speed_actual = abs(d1 - d2) / ((t2 - t1) / 60)
+                    plane.dist = d1
+                    max_speed = plane.get_max_speed()
+                    # tramo que arranca en la pista (aterrizaje interrumpido en día ventoso): no hay rango de velocidad
+                    if max_speed is not None and speed_actual < max_speed * 0.95:
+                        congestionados += 1
+                        break
+    prob_desvio = len(desviados) / total_planes if total_planes > 0 else 0
+    prob_congestion = congestionados / total_planes if total_planes > 0 else 0
+    return prob_desvio, prob_congestion
+
+def _montecarlo_desvios(lambdas_prob, total_minutes, n_mc, seed, checkpoint=None, checkpoint_cada=50, perfil=None):
+    params = {'lambdas': list(lambdas_prob), 'total_minutes': total_minutes, 'n_mc': n_mc, 'seed': seed}
+    sim_func = simulate_planes
+    if perfil is not None:
+        from perfiles import con_perfil
+        params['perfil'] = perfil.como_dict()
+        sim_func = con_perfil(simulate_planes, perfil)
+    estado = cargar_checkpoint(checkpoint, params)
+    if estado is not None:
+        # reanudar: estadísticas acumuladas y generador aleatorio tal como estaban en el checkpoint
+        resultados = estado['resultados']
+        i_inicio, rep_inicio = estado['i_lambda'], estado['rep']
+        prob_desvios, prob_congestiones = estado['prob_desvios'], estado['prob_congestiones']
+        random.setstate(estado['rng'])
+        if i_inicio < len(lambdas_prob):
+            print(f"\nReanudando desde checkpoint: λ={lambdas_prob[i_inicio]}, repetición {rep_inicio}/{n_mc}")
+        else:
+            # checkpoints viejos guardaban tambien el estado despues de la ultima lambda: ya estaba terminado
+            print("\nCheckpoint con todas las λ terminadas")
+    else:
+        if seed is not None:
+            random.seed(seed)
+        resultados = {}
+        i_inicio, rep_inicio = 0, 0
+        prob_desvios, prob_congestiones = [], []
+
+    def guardar(i_lambda, rep):
+        guardar_checkpoint(checkpoint, params, {
+            'resultados': resultados, 'i_lambda': i_lambda, 'rep': rep,
+            'prob_desvios': prob_desvios, 'prob_congestiones': prob_congestiones,
+            'rng': random.getstate(),
+        })
+
+    from tqdm import tqdm
     print(f"\nIniciando simulaciones Monte Carlo para {len(lambdas_prob)} valores de λ, {n_mc} repeticiones cada uno...")
-    for lambda_prob in tqdm(lambdas_prob, desc="Simulando λ valores"):
-        prob_desvios = []
-        prob_congestiones = []
-        for _ in range(n_mc):
-            planes, _ = simulate_planes(lambda_prob, total_minutes)
-            total_planes = len(planes)
-            desviados = [p for p in planes if p.status == 'montevideo']
-            aterrizados = [p for p in planes if p.status == 'landed']
-            # Congestión: al menos un tramo volado más lento que su velocidad máxima (como antes)
-            congestionados = 0
-            for plane in aterrizados:
-                if hasattr(plane, 'positions') and len(plane.positions) > 1:
-                    for i in range(len(plane.positions) - 1):
-                        t1, d1 = plane.positions[i]
-                        t2, d2 = plane.positions[i + 1]
-                        if t2 > t1:
-                            speed_actual = abs(d1 - d2) / ((t2 - t1) / 60)
-                            plane.dist = d1
-                            max_speed = plane.get_max_speed()
-                            if speed_actual < max_speed * 0.95:
-                                congestionados += 1
-                                break
-            prob_desvio = len(desviados) / total_planes if total_planes > 0 else 0
-            prob_congestion = congestionados / total_planes if total_planes > 0 else 0
+    for i_lambda, lambda_prob in enumerate(tqdm(lambdas_prob, desc="Simulando λ valores")):
+        if i_lambda < i_inicio:
+            continue
+        if i_lambda > i_inicio:
+            prob_desvios, prob_congestiones = [], []
+            rep_inicio = 0
+        for rep in range(rep_inicio, n_mc):
+            planes, _ = sim_func(lambda_prob, total_minutes)
+            prob_desvio, prob_congestion = metricas_replica(planes)
             prob_desvios.append(prob_desvio)
             prob_congestiones.append(prob_congestion)
+            if checkpoint is not None and (rep + 1) % checkpoint_cada == 0 and rep + 1 < n_mc:
+                guardar(i_lambda, rep + 1)
         prob_desvio_mean = np.mean(prob_desvios)
         prob_desvio_std = np.std(prob_desvios, ddof=1)
         prob_congestion_mean = np.mean(prob_congestiones)
@@ -47,6 +113,26 @@ def montecarlo_desvios(lambdas_prob, total_minutes, n_mc=30):
             'prob_congestion_std': prob_congestion_std
         }
         print(f"   λ={lambda_prob:.2f}: Prob. desvío = {prob_desvio_mean*100:.2f}% ± {prob_desvio_std*100:.2f}% | Prob. congestión = {prob_congestion_mean*100:.2f}% ± {prob_congestion_std*100:.2f}%")
+        if checkpoint is not None and i_lambda + 1 < len(lambdas_prob):
+            prob_desvios, prob_congestiones = [], []
+            guardar(i_lambda + 1, 0)
+    borrar_checkpoint(checkpoint)
+    return resultados
+
+def _montecarlo_desvios_thinning(lambdas_prob, total_minutes, n_mc, seed, checkpoint=None, checkpoint_cada=50, perfil=None):
+    print(f"\nIniciando barrido con números aleatorios comunes para {len(lambdas_prob)} valores de λ, {n_mc} repeticiones...")
+    filas = barrido_lambda.barrido_lambdas(lambdas_prob, total_minutes, n_mc,
+                                           metrica=lambda res: metricas_replica(res[0]), seed=seed,
+                                           checkpoint=checkpoint, checkpoint_cada=checkpoint_cada, perfil=perfil)
+    resultados = {}
+    for lambda_prob in lambdas_prob:
+        prob_desvios, prob_congestiones = filas[lambda_prob][:, 0], filas[lambda_prob][:, 1]
+        resultados[lambda_prob] = {
+            'prob_desvio': np.mean(prob_desvios),
+            'prob_desvio_std': np.std(prob_desvios, ddof=1),
+            'prob_congestion': np.mean(prob_congestiones),
+            'prob_congestion_std': np.std(prob_congestiones, ddof=1)
+        }
     return resultados
 
 def graficar_desvios_mc(resultados, lambdas_prob):
@@ -101,11 +187,14 @@ def tabla_resumen_mc(resultados, lambdas_prob):
               f"{r['prob_congestion']*100:>7.1f}% ± {r['prob_congestion_std']*100:>5.1f} |")
     print("="*80)
 
-if __name__ == "__main__":
+# funcion principal: barrido Monte Carlo de desvios y congestion en lambda
+def main():
     # parámetros de simulación a probar 
     lambdas_prob = [0.02, 0.1, 0.2, 0.5, 1.0]  
     total_minutes = 1080  # duración de la simulación en minutos 
     n_mc = 30  # cantidad de repeticiones Monte Carlo
+    seed = 42  # semilla fija: permite reutilizar el cache al regraficar
+    checkpoint = 'montecarlo_desvios.ckpt'  # si la corrida se interrumpe, se reanuda desde aquí
     print(" ANÁLISIS DE DESVÍOS Y CONGESTIÓN (Monte Carlo)")
     print("=" * 60)
     print("Analizando el crecimiento  de desvíos y congestión según λ")
@@ -113,7 +202,10 @@ if __name__ == "__main__":
     print(f"Duración de cada simulación: {total_minutes} minutos ({total_minutes/60} horas)")
     print(f"Repeticiones Monte Carlo: {n_mc}")
     print("=" * 60)
-    resultados = montecarlo_desvios(lambdas_prob, total_minutes, n_mc=n_mc)
+    resultados = montecarlo_desvios(lambdas_prob, total_minutes, n_mc=n_mc, seed=seed, checkpoint=checkpoint)
     graficar_desvios_mc(resultados, lambdas_prob)
     graficar_congestion_mc(resultados, lambdas_prob)
     tabla_resumen_mc(resultados, lambdas_prob)
+
+if __name__ == "__main__":
+    main()
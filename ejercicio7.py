@@ -1,6 +1,6 @@
-import matplotlib.pyplot as plt
 import numpy as np
 from main import simulate_planes
+from cache_resultados import memoizar
 
 def montecarlo_planes_ej7(sim_func, lambda_prob, total_minutes, n_mc=1000):
     """
@@ -12,35 +12,36 @@ def montecarlo_planes_ej7(sim_func, lambda_prob, total_minutes, n_mc=1000):
         all_planes.append(planes)
     return all_planes
 
-def comparar_landing_times_mc(lambda_prob=0.15, total_minutes=1080, n_mc=1000):
+# funcion que calcula la cantidad promedio de aterrizajes por hora (6 a 24) de una lista de caminos Monte Carlo
+def cantidad_por_hora(all_planes, total_minutes=1080):
+    from main import tiempos_planes
+    from histogramas import histograma_horas
+    hist = histograma_horas([tiempos_planes(planes)['landed_time'] for planes in all_planes], total_minutes)
+    return hist.mean(axis=0) if len(all_planes) > 0 else hist.sum(axis=0)
+
+# funcion que corre el Monte Carlo de ambas politicas y devuelve los aterrizajes promedio por hora (cacheado si hay semilla)
+def aterrizajes_por_hora_mc(lambda_prob=0.15, total_minutes=1080, n_mc=1000, seed=None, cache=None):
+    params = {'lambda_prob': lambda_prob, 'total_minutes': total_minutes, 'n_mc': n_mc, 'seed': seed}
+
+    def calcular():
+        # Importar aquí para evitar dependencias circulares
+        from main import simulate_planes
+        from histogramas import histogramas_mc
+        # Monte Carlo de ambas políticas: de cada réplica solo se guardan los tiempos de aterrizaje
+        hist_normal = histogramas_mc(lambda_prob, total_minutes, n_mc, seed, simulate_planes)['aterrizajes']
+        hist_holding = histogramas_mc(lambda_prob, total_minutes, n_mc, None, simulate_planes_holding)['aterrizajes']
+        return {'normal': hist_normal.mean(axis=0), 'holding': hist_holding.mean(axis=0)}
+
+    return memoizar('ejercicio7.aterrizajes_por_hora_mc', params, calcular, archivos=(__file__,), cache=cache)
+
+def comparar_landing_times_mc(lambda_prob=0.15, total_minutes=1080, n_mc=1000, seed=None, cache=None):
     """
     Compara la distribución de aterrizajes por hora entre la política normal (main) y la de ejercicio7.
     """
-    # Importar aquí para evitar dependencias circulares
-    from main import simulate_planes
-    try:
-        from ejercicio7 import simulate_planes_holding
-    except ImportError:
-        # Si ya estamos en ejercicio7.py, usar la función local
-        simulate_planes_holding = simulate_planes_holding
-
-    # Monte Carlo para política normal
-    all_planes_normal = montecarlo_planes_ej7(simulate_planes, lambda_prob, total_minutes, n_mc)
-    # Monte Carlo para política holding+fuel
-    all_planes_holding = montecarlo_planes_ej7(simulate_planes_holding, lambda_prob, total_minutes, n_mc)
-
-    def cantidad_por_hora(all_planes):
-        horas_all = []
-        for planes in all_planes:
-            landed = [p for p in planes if p.status == 'landed' and p.landed_time is not None]
-            horas = [6 + (p.landed_time // 60) for p in landed]
-            horas_all.extend(horas)
-        counts, _ = np.histogram(horas_all, bins=range(6, 25))
-        avg_counts = counts / len(all_planes) if len(all_planes) > 0 else counts
-        return avg_counts
-
-    cant_normal = cantidad_por_hora(all_planes_normal)
-    cant_holding = cantidad_por_hora(all_planes_holding)
+    import matplotlib.pyplot as plt
+    res = aterrizajes_por_hora_mc(lambda_prob, total_minutes, n_mc, seed=seed, cache=cache)
+    cant_normal = res['normal']
+    cant_holding = res['holding']
     horas = np.arange(6, 24)
 
     plt.figure(figsize=(12, 6))
@@ -58,11 +59,9 @@ import numpy as np
 import sys
 import os
 import random
-from tqdm import tqdm
-import matplotlib.pyplot as plt
 
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
-from main import APPROACH_RANGES, eta_minutes, knots_to_nm_per_min, print_summary, minutos_a_hora
+from main import APPROACH_RANGES, eta_minutes, knots_to_nm_per_min, print_summary, minutos_a_hora, descomponer_atrasos, TIEMPO_BASE_100NM
 
 # Parámetros de combustible para Boeing 737 (aprox)
 FUEL_CAPACITY_KG = 20_800  # kg (unos 25,000 litros)
@@ -83,6 +82,7 @@ class PlaneWithFuel:
         self.positions = [(appear_time, self.dist)]
         self.waiting = False
         self.wait_time = 0
+        self.demora_holding = 0  # minutos en holding (ver main.descomponer_atrasos)
         self.landed_time = None
         self.montevideo_time = None
         # Inicializar combustible entre 50% y 90% de la capacidad
@@ -176,6 +176,7 @@ def simulate_planes_holding(lambda_prob=0.2, total_minutes=1080):
 
             plane.speed = HOLD_SPEED
             plane.update_position(1, plane.speed)
+            plane.demora_holding += 1
 
             # Si no alcanza combustible → Montevideo
             if not plane.can_reach_montevideo():
@@ -213,25 +214,44 @@ def simulate_planes_holding(lambda_prob=0.2, total_minutes=1080):
 
 
 simulate_planes_holding.use_tqdm = True
-if __name__ == "__main__":
+
+# funcion que corre N simulaciones con holding y devuelve las proporciones de desvios/aterrizajes por camino (cacheado si hay semilla)
+def montecarlo_holding(lambda_prob=0.2, total_minutes=1080, N=1000, seed=None, cache=None):
+    params = {'lambda_prob': lambda_prob, 'total_minutes': total_minutes, 'n_mc': N, 'seed': seed}
+
+    def calcular():
+        from tqdm import tqdm
+        if seed is not None:
+            random.seed(seed)
+        desvios = []
+        aterrizajes = []
+        totales = []
+        for i in tqdm(range(N), desc="Monte Carlo", unit="sim"):
+            planes, _ = simulate_planes_holding(lambda_prob, total_minutes)
+            landed = [p for p in planes if p.status == 'landed']
+            montevideo = [p for p in planes if p.status == 'montevideo']
+            total = len(landed) + len(montevideo)
+            if total > 0:
+                desvios.append(len(montevideo) / total)
+                aterrizajes.append(len(landed) / total)
+                totales.append(total)
+        return {'desvios': np.array(desvios, dtype=float),
+                'aterrizajes': np.array(aterrizajes, dtype=float),
+                'totales': np.array(totales, dtype=float)}
+
+    return memoizar('ejercicio7.montecarlo_holding', params, calcular, archivos=(__file__,), cache=cache)
+
+# funcion principal: Monte Carlo con holding y comparacion de aterrizajes por hora entre politicas
+def main():
     print("Simulación con política de holding y combustible (Ejercicio 7)")
     lambda_prob = 0.2
     total_minutes = 1080
     N = 1000  # cantidad de simulaciones Monte Carlo
-    desvios = []
-    aterrizajes = []
-    totales = []
-
-    for i in tqdm(range(N), desc="Monte Carlo", unit="sim"):
-        planes, _ = simulate_planes_holding(lambda_prob, total_minutes)
-        landed = [p for p in planes if p.status == 'landed']
-        montevideo = [p for p in planes if p.status == 'montevideo']
-        total = len(landed) + len(montevideo)
-        if total > 0:
-            desvios.append(len(montevideo) / total)
-            aterrizajes.append(len(landed) / total)
-            totales.append(total)
-    # Restaurar tqdm si se desea para simulaciones interactivas
+    seed = 42  # semilla fija: permite reutilizar el cache al regraficar
+    mc = montecarlo_holding(lambda_prob, total_minutes, N, seed=seed)
+    desvios, aterrizajes, totales = mc['desvios'], mc['aterrizajes'], mc['totales']
+    # camino de ejemplo para el análisis de tiempos de espera
+    planes, _ = simulate_planes_holding(lambda_prob, total_minutes)
     print(f"\nMonte Carlo ({N} caminos, lambda={lambda_prob}):")
     print(f"Promedio porcentaje desvíos: {100 * np.mean(desvios):.1f}%")
     print(f"Promedio porcentaje aterrizajes: {100 * np.mean(aterrizajes):.1f}%")
@@ -241,44 +261,16 @@ if __name__ == "__main__":
     error_std = np.std(desvios_arr) / np.sqrt(N)
     print(f"Error estándar del porcentaje de desvíos: {100 * error_std:.2f}%")
     
-    def get_plane_wait_time(plane):
-        # Calcula el tiempo total en holding
-        if not hasattr(plane, 'positions') or not hasattr(plane, 'status'):
-            return 0
-        holding_time = 0
-        last_status = None
-        for i in range(1, len(plane.positions)):
-            t0, _ = plane.positions[i-1]
-            t1, _ = plane.positions[i]
-            # Si el avión estuvo en holding en este intervalo
-            if getattr(plane, 'holding_start_time', None) is not None and t0 >= plane.holding_start_time:
-                holding_time += t1 - t0
-        return holding_time
-
-    def get_ideal_flight_time():
-        # Tiempo ideal desde 100 mn a 0 mn a velocidad máxima (500 nudos)
-        dist = 100
-        speed = 500
-        return dist / (speed / 60.0)  # minutos
-
-    # Después del resumen estadístico en el main
-    # Calcular tiempos de espera y extra
-    wait_times = []
-    extra_times = []
-    ideal_time = get_ideal_flight_time()
-    for p in planes:
-        if p.status == 'landed':
-            appear = p.appear_time
-            landed = p.landed_time
-            total_time = landed - appear
-            wait = get_plane_wait_time(p)
-            wait_times.append(wait)
-            extra_times.append(total_time - ideal_time)
-    if wait_times:
-        print(f"\nPromedio tiempo de espera en holding: {np.mean(wait_times):.2f} min")
-        print(f"Promedio tiempo extra respecto al vuelo ideal: {np.mean(extra_times):.2f} min")
-
-# Ejecutar gráfico comparativo automáticamente si se ejecuta este archivo
-if __name__ == "__main__":
+    # Descomposición de los atrasos contra el tiempo base desde 100 mn
+    atrasos = descomponer_atrasos(planes)
+    aterrizo = ~np.isnan(atrasos['atraso'])
+    if aterrizo.any():
+        print(f"\nPromedio tiempo de espera en holding: {atrasos['holding'][aterrizo].mean():.2f} min")
+        print(f"Promedio tiempo extra respecto al vuelo ideal ({TIEMPO_BASE_100NM:.1f} min): {atrasos['atraso'][aterrizo].mean():.2f} min")
+
+    # gráfico comparativo de distribución de aterrizajes por hora
     print("Ejecutando comparación de distribución de aterrizajes por hora entre políticas...")
-    comparar_landing_times_mc(lambda_prob=0.16355, total_minutes=1080, n_mc=500)
+    comparar_landing_times_mc(lambda_prob=0.16355, total_minutes=1080, n_mc=500, seed=42)
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,268 @@
+# modo en vivo: consume arribos reales (un archivo que se va escribiendo, como tail -f, o un socket local,
+# en lugar del radar) y mantiene el estado de la cola en una main.Simulacion que avanza un minuto por cada
+# minuto de reloj. Al final de cada minuto toma una instantanea del estado y lanza en paralelo un lote de
+# pronosticos Monte Carlo de corto plazo (por defecto las proximas 2 horas) desde ahi; publica los
+# percentiles de desvios a Montevideo de esa ventana. Los pronosticos tienen un tiempo maximo: lo que no
+# termino a tiempo se descarta y se publica con las replicas que si terminaron.
+#
+# Formato de los eventos, uno por linea:
+#   JSON: {"hora": "14:32", "speed": 280} o {"minuto": 512, "speed_u": 0.4} (sin hora/minuto: el minuto actual)
+#   CSV:  14:32,280  (hora o minuto, y opcionalmente la velocidad en nudos)
+# Los eventos de minutos que ya pasaron se cargan en el minuto actual.
+#
+# Ejemplos:
+#   python en_vivo.py --archivo radar.log
+#   python en_vivo.py --puerto 8765 --replicas 400 --workers 4
+#   python en_vivo.py --demo --segundos-por-minuto 0.5 --minutos 30
+import argparse
+import asyncio
+import json
+import os
+import random
+import sys
+import time
+import numpy as np
+from main import Simulacion, APPROACH_RANGES, minutos_a_hora
+from perfiles import hora_a_minutos
+
+# rango de velocidades de un avion que aparece a 100 mn (el mismo que usa Plane)
+V_MIN_100, V_MAX_100 = next((vmin, vmax) for r_min, r_max, vmin, vmax in APPROACH_RANGES if r_min < 100 <= r_max)
+
+# funcion que interpreta una linea del feed y devuelve (minuto o None, speed_u o None); None si la linea no es un evento
+def parsear_evento(linea):
+    linea = linea.strip()
+    if not linea or linea.startswith('#'):
+        return None
+    if linea.startswith('{'):
+        data = json.loads(linea)
+        cuando = data.get('minuto', data.get('hora'))
+        speed_u = data.get('speed_u')
+        speed = data.get('speed')
+    else:
+        partes = [x.strip() for x in linea.split(',')]
+        cuando = partes[0] or None
+        speed_u = None
+        speed = float(partes[1]) if len(partes) > 1 and partes[1] else None
+    minuto = hora_a_minutos(cuando) if cuando is not None else None
+    if speed_u is None and speed is not None:
+        speed_u = min(max((float(speed) - V_MIN_100) / (V_MAX_100 - V_MIN_100), 0.0), 1.0 - 1e-12)
+    return minuto, speed_u
+
+# funcion que sigue un archivo como tail -f y devuelve sus lineas a medida que se escriben
+async def seguir_archivo(path, intervalo=0.2):
+    while not os.path.exists(path):
+        await asyncio.sleep(intervalo)
+    with open(path, 'r', encoding='utf-8') as f:
+        pendiente = ''
+        while True:
+            linea = f.readline()
+            if not linea:
+                await asyncio.sleep(intervalo)
+                continue
+            pendiente += linea
+            if pendiente.endswith('\n'):
+                yield pendiente
+                pendiente = ''
+
+# funcion que escucha conexiones TCP en host:puerto y devuelve las lineas que llegan por cualquiera de ellas
+async def escuchar_socket(host='127.0.0.1', puerto=8765):
+    cola = asyncio.Queue()
+
+    async def atender(reader, writer):
+        try:
+            async for linea in reader:
+                await cola.put(linea.decode('utf-8', errors='replace'))
+        finally:
+            writer.close()
+
+    server = await asyncio.start_server(atender, host, puerto)
+    async with server:
+        while True:
+            yield await cola.get()
+
+# funcion que corre un lote de pronosticos desde la instantanea (se ejecuta en un proceso del pool);
+# deja de correr replicas al pasar el limite (time.time()), asi ningun lote ocupa un worker despues del
+# tiempo maximo y el pronostico del minuto siguiente no queda esperando detras
+def _pronosticar_lote(tarea):
+    inst, lambda_prob, hasta, semillas, limite = tarea
+    res = []
+    for semilla in semillas:
+        if limite is not None and time.time() > limite:
+            break
+        sim = inst.continuar(lambda_prob=lambda_prob, total_minutes=hasta)
+        random.seed(semilla)
+        sim.correr()
+        aterrizados = sum(1 for p in sim.planes if p.status == 'landed')
+        res.append((len(sim.desviados), aterrizados, sum(len(q) for q in sim.colas) + len(sim.rejoining)))
+    return res
+
+# clase ModoEnVivo: estado actual del aeropuerto alimentado por el feed y pronosticos minuto a minuto
+# - lambda_prior: tasa de arribos supuesta antes de tener datos; la tasa de los pronosticos se estima con los
+#   arribos de la ultima ventana (en minutos) mas lambda_prior con peso de 30 minutos
+# - horizonte: minutos hacia adelante de cada pronostico
+# - replicas: pronosticos Monte Carlo por minuto, repartidos en lotes entre workers procesos (0: sin procesos)
+# - segundos_por_minuto: duracion en segundos de reloj de un minuto de simulacion (60 en vivo)
+# - latencia_max: segundos maximos para publicar el pronostico (por defecto 80% del minuto)
+# - publicar: funcion que recibe el dict de cada pronostico (por defecto lo imprime como JSON)
+class ModoEnVivo:
+    def __init__(self, lambda_prior=0.2, horizonte=120, replicas=200, workers=None, segundos_por_minuto=60.0,
+                 latencia_max=None, publicar=None, inicio=0, total_minutes=1080, ventana=60, seed=None,
+                 pistas=1, politica='round_robin'):
+        self.sim = Simulacion(lambda_prior, total_minutes, arribos=[], pistas=pistas, politica=politica)
+        self.sim.t = hora_a_minutos(inicio)
+        self.lambda_prior = lambda_prior
+        self.horizonte = horizonte
+        self.replicas = replicas
+        self.workers = (os.cpu_count() or 1) if workers is None else workers
+        self.segundos_por_minuto = segundos_por_minuto
+        self.latencia_max = 0.8 * segundos_por_minuto if latencia_max is None else latencia_max
+        self.publicar = publicar if publicar is not None else (lambda r: print(json.dumps(r), flush=True))
+        self.ventana = ventana
+        self.rng = random.Random(seed)
+        self.llegadas = []  # minutos de los arribos recibidos
+
+    # agrega un arribo del feed a la simulacion
+    def recibir(self, linea):
+        evento = parsear_evento(linea)
+        if evento is None:
+            return
+        minuto, speed_u = evento
+        minuto = self.sim.t if minuto is None else max(minuto, self.sim.t)
+        self.sim.programar_arribo(minuto, speed_u)
+        self.llegadas.append(minuto)
+
+    # tasa de arribos estimada para los pronosticos
+    def lambda_estimada(self):
+        t = self.sim.t
+        desde = max(t - self.ventana, 0)
+        n = sum(1 for m in self.llegadas if desde <= m < t)
+        return (n + 30 * self.lambda_prior) / ((t - desde) + 30)
+
+    # instantanea compacta: solo los aviones en vuelo (los terminados no cambian el pronostico)
+    def _instantanea(self):
+        inst = self.sim.instantanea()
+        inst.sim.planes = [p for q in inst.sim.colas for p in q] + inst.sim.rejoining
+        inst.sim.desviados = []
+        return inst
+
+    # lanza los pronosticos desde el estado actual y devuelve el resumen con las replicas que terminaron a tiempo
+    async def pronosticar(self, pool=None):
+        inicio = time.perf_counter()
+        inst = self._instantanea()
+        lam = self.lambda_estimada()
+        hasta = self.sim.t + self.horizonte
+        semillas = [self.rng.getrandbits(64) for _ in range(self.replicas)]
+        limite = time.time() + self.latencia_max
+        n_lotes = self.workers if pool is not None else 1
+        tareas = [(inst, lam, hasta, semillas[k::n_lotes], limite) for k in range(n_lotes) if semillas[k::n_lotes]]
+        if pool is None:
+            resultados = [_pronosticar_lote(t) for t in tareas]
+        else:
+            loop = asyncio.get_running_loop()
+            futuros = [loop.run_in_executor(pool, _pronosticar_lote, t) for t in tareas]
+            # margen para la replica en curso al pasar el limite y para devolver el resultado
+            hechos, pendientes = await asyncio.wait(futuros, timeout=self.latencia_max + 0.5)
+            for f in pendientes:
+                f.cancel()
+            resultados = [f.result() for f in hechos]
+        res = np.array([r for lote in resultados for r in lote], dtype=float).reshape(-1, 3)
+        desvios, aterrizados, en_vuelo = res[:, 0], res[:, 1], res[:, 2]
+        terminados = np.maximum(desvios + aterrizados, 1)
+        p5, p50, p95 = np.percentile(desvios, (5, 50, 95)) if len(res) else (np.nan,) * 3
+        return {
+            'minuto': self.sim.t,
+            'hora': minutos_a_hora(self.sim.t),
+            'hasta': minutos_a_hora(min(hasta, self.sim.total_minutes)),
+            'en_cola': sum(len(q) for q in self.sim.colas),
+            'en_rejoin': len(self.sim.rejoining),
+            'lambda_estimada': round(lam, 4),
+            'replicas': len(res),
+            'desvios_p5': float(p5),
+            'desvios_p50': float(p50),
+            'desvios_p95': float(p95),
+            'prob_algun_desvio': float((desvios > 0).mean()) if len(res) else float('nan'),
+            'pct_desvios_medio': float(100 * (desvios / terminados).mean()) if len(res) else float('nan'),
+            'en_vuelo_al_final_p50': float(np.median(en_vuelo)) if len(res) else float('nan'),
+            'latencia_s': round(time.perf_counter() - inicio, 3),
+        }
+
+    # consume el feed y avanza el reloj hasta minutos minutos (o hasta el final del dia)
+    async def correr(self, fuente, minutos=None):
+        from concurrent.futures import ProcessPoolExecutor
+
+        async def consumir():
+            async for linea in fuente:
+                try:
+                    self.recibir(linea)
+                except (ValueError, KeyError) as e:
+                    print(f"[ADVERTENCIA] Evento inválido ({e}): {linea.strip()}", file=sys.stderr)
+
+        fin = self.sim.total_minutes if minutos is None else min(self.sim.t + minutos, self.sim.total_minutes)
+        pool = ProcessPoolExecutor(max_workers=self.workers) if self.workers > 0 else None
+        consumidor = asyncio.ensure_future(consumir())
+        loop = asyncio.get_running_loop()
+        proximo = loop.time()
+        try:
+            while self.sim.t < fin:
+                proximo += self.segundos_por_minuto
+                await asyncio.sleep(max(proximo - loop.time(), 0))
+                # los arribos recibidos durante el minuto ya estan programados: se simula el minuto
+                self.sim.paso()
+                self.publicar(await self.pronosticar(pool))
+        finally:
+            consumidor.cancel()
+            if pool is not None:
+                pool.shutdown(wait=False, cancel_futures=True)
+
+# funcion que escribe en path un feed de arribos sinteticos (para probar el modo en vivo sin radar)
+async def simular_radar(path, lambda_prob=0.2, segundos_por_minuto=60.0, inicio=0, seed=None):
+    rng = random.Random(seed)
+    t = hora_a_minutos(inicio)
+    with open(path, 'a', encoding='utf-8') as f:
+        while True:
+            if rng.random() < lambda_prob:
+                f.write(json.dumps({'hora': minutos_a_hora(t), 'speed': round(rng.uniform(V_MIN_100, V_MAX_100), 1)}) + '\n')
+                f.flush()
+            t += 1
+            await asyncio.sleep(segundos_por_minuto)
+
+# funcion principal: modo en vivo desde un archivo, un socket o un feed sintetico
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Pronósticos de desvíos en vivo a partir de un feed de arribos')
+    fuente = parser.add_mutually_exclusive_group(required=True)
+    fuente.add_argument('--archivo', help='archivo del feed (se sigue como tail -f)')
+    fuente.add_argument('--puerto', type=int, help='puerto TCP local donde escuchar el feed')
+    fuente.add_argument('--demo', action='store_true', help='feed sintético escrito en un archivo temporal')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--inicio', default='06:00', help='hora de reloj del primer minuto')
+    parser.add_argument('--minutos', type=int, default=None, help='minutos a simular (por defecto, hasta el final del día)')
+    parser.add_argument('--lambda', dest='lambda_prior', type=float, default=0.2, help='tasa de arribos a priori')
+    parser.add_argument('--horizonte', type=int, default=120, help='minutos de cada pronóstico')
+    parser.add_argument('--replicas', type=int, default=200)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--segundos-por-minuto', type=float, default=60.0)
+    parser.add_argument('--latencia-max', type=float, default=None, help='segundos máximos por pronóstico')
+    parser.add_argument('--seed', type=int, default=None)
+    args = parser.parse_args(argv)
+
+    vivo = ModoEnVivo(args.lambda_prior, args.horizonte, args.replicas, args.workers, args.segundos_por_minuto,
+                      args.latencia_max, inicio=args.inicio, seed=args.seed)
+
+    async def correr():
+        if args.puerto is not None:
+            await vivo.correr(escuchar_socket(args.host, args.puerto), args.minutos)
+        elif args.archivo is not None:
+            await vivo.correr(seguir_archivo(args.archivo), args.minutos)
+        else:
+            import tempfile
+            path = os.path.join(tempfile.mkdtemp(), 'radar.log')
+            radar = asyncio.ensure_future(simular_radar(path, args.lambda_prior, args.segundos_por_minuto, args.inicio, args.seed))
+            try:
+                await vivo.correr(seguir_archivo(path, intervalo=min(0.2, args.segundos_por_minuto / 4)), args.minutos)
+            finally:
+                radar.cancel()
+
+    asyncio.run(correr())
+
+if __name__ == "__main__":
+    main()
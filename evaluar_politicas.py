@@ -0,0 +1,117 @@
+# comparacion de politicas de secuenciacion (main.POLITICAS_SECUENCIACION) con numeros aleatorios comunes.
+# En cada replica se sortean los arribos una sola vez (minuto y velocidad inicial de cada avion, como en
+# barrido_lambda.py) y se simula el mismo dia con cada politica: con arribos pre-sorteados el motor no usa
+# random, asi la diferencia entre politicas en una replica es solo efecto de la politica y se estima con
+# mucha menos varianza que comparando replicas independientes.
+# Cada replica tiene su propia semilla (SeedSequence.spawn), asi el resultado no depende de en cuantos
+# procesos se repartan las replicas, y las politicas se ordenan por aterrizajes por hora y, a igualdad, por desvios a Montevideo.
+#
+# Ejemplo:
+#   python evaluar_politicas.py --lambda 0.2 --replicas 2000 --workers 4 --seed 42
+import argparse
+import os
+import numpy as np
+from main import POLITICAS_SECUENCIACION, simulate_planes, descomponer_atrasos
+from barrido_lambda import generar_superstream, adelgazar
+from cache_resultados import memoizar
+
+METRICAS = ('aterrizajes_hora', 'pct_desvios', 'atraso_medio')
+
+# funcion que calcula las metricas de una replica: aterrizajes por hora, % de desvios sobre los aviones que
+# terminaron y atraso medio de los aterrizados contra el tiempo base
+def metricas_politica(planes, total_minutes):
+    aterrizados = sum(1 for p in planes if p.status == 'landed')
+    desviados = sum(1 for p in planes if p.status == 'montevideo')
+    atraso = descomponer_atrasos(planes)['atraso']
+    return (60 * aterrizados / total_minutes,
+            100 * desviados / max(aterrizados + desviados, 1),
+            float(np.nanmean(atraso)) if aterrizados else 0.0)
+
+# funcion que evalua todas las politicas sobre un lote de replicas, una semilla por replica (se ejecuta en un
+# proceso del pool)
+def _evaluar_lote(tarea):
+    politicas, lambda_prob, total_minutes, semillas = tarea
+    res = np.zeros((len(semillas), len(politicas), len(METRICAS)))
+    for rep, seed in enumerate(semillas):
+        rng = np.random.default_rng(seed)
+        arribos = adelgazar(generar_superstream(lambda_prob, total_minutes, rng), lambda_prob)
+        for k, politica in enumerate(politicas):
+            planes, _ = simulate_planes(lambda_prob, total_minutes, arribos=arribos, secuenciacion=politica)
+            res[rep, k] = metricas_politica(planes, total_minutes)
+    return res
+
+# funcion que evalua las politicas con numeros aleatorios comunes y las ordena
+def evaluar_politicas(politicas=None, lambda_prob=0.2, total_minutes=1080, n_mc=1000, workers=None, seed=None,
+                      cache=None):
+    """
+    Args:
+        politicas: nombres de POLITICAS_SECUENCIACION (o funciones definidas a nivel de módulo, para poder
+                   mandarlas a otros procesos); por defecto todas. La primera es la referencia de las diferencias
+        workers: procesos en paralelo (por defecto, uno por CPU)
+        seed: semilla (con semilla el resultado se guarda en el cache)
+
+    Returns:
+        dict con 'politicas', 'metricas', 'media' y 'std' (políticas x métricas), 'diferencia' y 'diferencia_se'
+        (diferencia pareada contra la primera política y su error estándar) y 'ranking' (índices de las
+        políticas de la mejor a la peor)
+    """
+    politicas = list(POLITICAS_SECUENCIACION) if politicas is None else list(politicas)
+    nombres = [p if isinstance(p, str) else f"{p.__module__}.{p.__qualname__}" for p in politicas]
+    workers = max(1, min(workers or os.cpu_count() or 1, n_mc))
+    params = {'politicas': nombres, 'lambda_prob': lambda_prob, 'total_minutes': total_minutes, 'n_mc': n_mc,
+              'seed': seed}
+    calcular = lambda: _evaluar_politicas(politicas, nombres, lambda_prob, total_minutes, n_mc, workers, seed)
+    return memoizar('evaluar_politicas', params, calcular, archivos=(__file__,), cache=cache)
+
+def _evaluar_politicas(politicas, nombres, lambda_prob, total_minutes, n_mc, workers, seed):
+    semillas = np.random.SeedSequence(seed).spawn(n_mc)
+    cortes = np.cumsum([0] + [n_mc // workers + (1 if k < n_mc % workers else 0) for k in range(workers)])
+    tareas = [(politicas, lambda_prob, total_minutes, semillas[a:b]) for a, b in zip(cortes[:-1], cortes[1:])]
+    if workers == 1:
+        partes = [_evaluar_lote(tareas[0])]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as ejecutor:
+            partes = list(ejecutor.map(_evaluar_lote, tareas))
+    res = np.concatenate(partes)
+    ddof = 1 if n_mc > 1 else 0
+    diferencia = res - res[:, :1]
+    media = res.mean(axis=0)
+    ranking = sorted(range(len(politicas)), key=lambda k: (-media[k, 0], media[k, 1]))
+    return {
+        'politicas': nombres,
+        'metricas': list(METRICAS),
+        'media': media,
+        'std': res.std(axis=0, ddof=ddof),
+        'diferencia': diferencia.mean(axis=0),
+        'diferencia_se': diferencia.std(axis=0, ddof=ddof) / np.sqrt(n_mc),
+        'ranking': ranking,
+        'n_mc': n_mc,
+    }
+
+# funcion principal: ranking de las politicas
+def main(argv=None):
+    import time
+    parser = argparse.ArgumentParser(description='Comparación de políticas de secuenciación')
+    parser.add_argument('--politicas', nargs='+', choices=list(POLITICAS_SECUENCIACION), default=None)
+    parser.add_argument('--lambda', dest='lambda_prob', type=float, default=0.2)
+    parser.add_argument('--horizonte', type=int, default=1080)
+    parser.add_argument('--replicas', type=int, default=1000)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--sin-cache', action='store_true', help='no leer ni escribir el cache')
+    args = parser.parse_args(argv)
+    t0 = time.perf_counter()
+    res = evaluar_politicas(args.politicas, args.lambda_prob, args.horizonte, args.replicas, args.workers, args.seed,
+                            cache=False if args.sin_cache else None)
+    print(f"{res['n_mc']} réplicas con números aleatorios comunes, λ={args.lambda_prob}, "
+          f"{time.perf_counter() - t0:.1f} s")
+    referencia = res['politicas'][0]
+    print(f"{'política':<14}{'aterr./hora':>14}{'desvíos %':>12}{'atraso min':>12}   diferencia contra {referencia} (± 1.96 EE)")
+    for k in res['ranking']:
+        media, dif, se = res['media'][k], res['diferencia'][k], 1.96 * res['diferencia_se'][k]
+        print(f"{res['politicas'][k]:<14}{media[0]:>14.2f}{media[1]:>12.1f}{media[2]:>12.2f}   "
+              f"{dif[0]:+.2f} ± {se[0]:.2f} aterr./hora, {dif[1]:+.1f} ± {se[1]:.1f} pp desvíos")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+# exportacion columnar de los resultados por avion (una fila por avion) para analizarlos con numpy/pandas
+# sin recorrer listas de objetos Plane. Columnas: replica, id, appear_time, landed_time, montevideo_time,
+# rejoins, wait_time, interrupciones y estado (codigo entero, ver ESTADOS). Los tiempos que no aplican
+# (por ejemplo landed_time de un avion desviado) quedan como NaN.
+#
+# Las filas se acumulan en lotes de tamano_lote y cada lote se escribe a disco de una vez, asi un
+# Monte Carlo con millones de aviones nunca tiene todos los registros en memoria:
+# - csv: se agregan filas al archivo
+# - npz: cada columna se escribe cruda a un archivo temporal y al cerrar se arma el .npz copiando
+#   por bloques (np.load lo lee como cualquier npz)
+# - arrow: Arrow IPC (formato archivo) con un record batch por lote; necesita pyarrow
+import csv
+import math
+import os
+import random
+import shutil
+import tempfile
+import zipfile
+
+ESTADOS = ('approaching', 'rejoin', 'landed', 'montevideo')
+_CODIGO_ESTADO = {e: k for k, e in enumerate(ESTADOS)}
+
+# columnas y su tipo de numpy
+COLUMNAS = (
+    ('replica', 'int32'),
+    ('id', 'int32'),
+    ('appear_time', 'float64'),
+    ('landed_time', 'float64'),
+    ('montevideo_time', 'float64'),
+    ('rejoins', 'int32'),
+    ('wait_time', 'int32'),
+    ('interrupciones', 'int32'),
+    ('estado', 'int8'),
+)
+
+def _tiempo(x):
+    return math.nan if x is None else x
+
+# funcion que arma las columnas (dict nombre -> ndarray) de una lista de aviones
+def columnas(planes, replica=0):
+    import numpy as np
+    n = len(planes)
+    return {
+        'replica': np.full(n, replica, dtype='int32'),
+        'id': np.fromiter((p.id for p in planes), 'int32', n),
+        'appear_time': np.fromiter((p.appear_time for p in planes), 'float64', n),
+        'landed_time': np.fromiter((_tiempo(p.landed_time) for p in planes), 'float64', n),
+        'montevideo_time': np.fromiter((_tiempo(p.montevideo_time) for p in planes), 'float64', n),
+        'rejoins': np.fromiter((getattr(p, 'rejoins', 0) for p in planes), 'int32', n),
+        'wait_time': np.fromiter((getattr(p, 'wait_time', 0) for p in planes), 'int32', n),
+        'interrupciones': np.fromiter((getattr(p, 'interrupciones', 0) for p in planes), 'int32', n),
+        'estado': np.fromiter((_CODIGO_ESTADO.get(p.status, -1) for p in planes), 'int8', n),
+    }
+
+def _formato_por_extension(path):
+    ext = os.path.splitext(path)[1].lower()
+    formatos = {'.csv': 'csv', '.npz': 'npz', '.arrow': 'arrow', '.feather': 'arrow'}
+    if ext not in formatos:
+        raise ValueError(f"No se puede deducir el formato de {path}; usar formato='csv', 'npz' o 'arrow'")
+    return formatos[ext]
+
+# clase ExportadorColumnar que escribe registros por avion en lotes a un archivo columnar.
+# Uso:
+#   with ExportadorColumnar('resultados.npz') as exp:
+#       for r in range(n_mc):
+#           planes, _ = simulate_planes(0.2, 1080)
+#           exp.agregar(planes, replica=r)
+class ExportadorColumnar:
+    def __init__(self, path, formato=None, tamano_lote=100_000):
+        self.path = path
+        self.formato = formato or _formato_por_extension(path)
+        if self.formato not in ('csv', 'npz', 'arrow'):
+            raise ValueError(f"Formato desconocido: {self.formato}")
+        self.tamano_lote = tamano_lote
+        self.filas = 0
+        self._pendientes = []
+        self._n_pendientes = 0
+        self._cerrado = False
+        if self.formato == 'csv':
+            self._archivo = open(path, 'w', encoding='utf-8', newline='')
+            self._csv = csv.writer(self._archivo)
+            self._csv.writerow([nombre for nombre, _ in COLUMNAS])
+        elif self.formato == 'npz':
+            self._dir_tmp = tempfile.mkdtemp(prefix='exportar_', dir=os.path.dirname(os.path.abspath(path)))
+            self._crudos = {nombre: open(os.path.join(self._dir_tmp, nombre), 'wb') for nombre, _ in COLUMNAS}
+        else:
+            try:
+                import pyarrow as pa
+            except ImportError as e:
+                raise ImportError("El formato arrow necesita pyarrow (pip install pyarrow)") from e
+            self._pa = pa
+            self._esquema = pa.schema([(nombre, pa.from_numpy_dtype(tipo)) for nombre, tipo in COLUMNAS])
+            self._arrow = pa.ipc.new_file(path, self._esquema)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.cerrar()
+
+    # agrega los aviones de una simulacion (se escriben cuando se completa un lote)
+    def agregar(self, planes, replica=0):
+        cols = columnas(planes, replica)
+        self._pendientes.append(cols)
+        self._n_pendientes += len(planes)
+        if self._n_pendientes >= self.tamano_lote:
+            self.vaciar()
+
+    # escribe a disco las filas pendientes
+    def vaciar(self):
+        import numpy as np
+        if not self._pendientes:
+            return
+        lote = {nombre: np.concatenate([c[nombre] for c in self._pendientes]) for nombre, _ in COLUMNAS}
+        self._pendientes = []
+        self._n_pendientes = 0
+        n = len(lote['id'])
+        if self.formato == 'csv':
+            # los NaN se escriben como celdas vacias
+            filas = zip(*(lote[nombre].tolist() for nombre, _ in COLUMNAS))
+            self._csv.writerows([['' if isinstance(x, float) and x != x else x for x in fila] for fila in filas])
+        elif self.formato == 'npz':
+            for nombre, _ in COLUMNAS:
+                lote[nombre].tofile(self._crudos[nombre])
+        else:
+            pa = self._pa
+            self._arrow.write_batch(pa.record_batch([pa.array(lote[nombre]) for nombre, _ in COLUMNAS], schema=self._esquema))
+        self.filas += n
+
+    # vacia lo pendiente y cierra el archivo
+    def cerrar(self):
+        import numpy as np
+        if self._cerrado:
+            return
+        self.vaciar()
+        self._cerrado = True
+        if self.formato == 'csv':
+            self._archivo.close()
+        elif self.formato == 'npz':
+            for f in self._crudos.values():
+                f.close()
+            try:
+                with zipfile.ZipFile(self.path, 'w', zipfile.ZIP_STORED, allowZip64=True) as zf:
+                    for nombre, tipo in COLUMNAS:
+                        header = {'descr': np.lib.format.dtype_to_descr(np.dtype(tipo)),
+                                  'fortran_order': False, 'shape': (self.filas,)}
+                        with zf.open(nombre + '.npy', 'w', force_zip64=True) as destino:
+                            np.lib.format.write_array_header_2_0(destino, header)
+                            with open(os.path.join(self._dir_tmp, nombre), 'rb') as origen:
+                                shutil.copyfileobj(origen, destino, 1 << 20)
+            finally:
+                shutil.rmtree(self._dir_tmp, ignore_errors=True)
+        else:
+            self._arrow.close()
+
+# funcion que exporta los aviones de una sola simulacion
+def exportar_planes(planes, path, formato=None):
+    with ExportadorColumnar(path, formato) as exp:
+        exp.agregar(planes)
+    return exp.filas
+
+# funcion que corre un Monte Carlo y exporta todos los aviones de todas las replicas
+def exportar_montecarlo(path, escenario='normal', lambda_prob=0.2, total_minutes=1080, n_mc=100, seed=None,
+                        formato=None, tamano_lote=100_000, **opciones):
+    """
+    Corre n_mc simulaciones del escenario y escribe una fila por avión en path.
+
+    Args:
+        escenario: 'normal', 'tormenta' o 'ventoso' (ver simular.py)
+        opciones: parámetros del escenario (storm_start, storm_duration, prob_interrupcion)
+
+    Returns:
+        cantidad de filas escritas
+    """
+    from simular import simulador
+    sim = simulador(escenario, **opciones)
+    if seed is not None:
+        random.seed(seed)
+    with ExportadorColumnar(path, formato, tamano_lote) as exp:
+        for r in range(n_mc):
+            exp.agregar(sim(lambda_prob, total_minutes)[0], replica=r)
+    return exp.filas
+
+# funcion principal: exporta un Monte Carlo de ejemplo y muestra un resumen leido del npz
+def main():
+    import numpy as np
+    path = 'aviones_mc.npz'
+    filas = exportar_montecarlo(path, 'normal', lambda_prob=0.2, n_mc=100, seed=42)
+    d = np.load(path)
+    desviados = d['estado'] == ESTADOS.index('montevideo')
+    print(f"{filas} aviones exportados a {path}")
+    print(f"Desvíos a Montevideo: {desviados.mean()*100:.1f}%")
+    print(f"Rejoins por avión: {d['rejoins'].mean():.2f}, espera media en rejoin: {d['wait_time'].mean():.2f} min")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+# histogramas por hora de muchas replicas a la vez. En vez de calcular 6 + landed_time // 60 avion por
+# avion y juntar todo en una lista para np.histogram, cada replica aporta un array de tiempos
+# (main.tiempos_planes) y el histograma replica x hora sale de un solo np.bincount: al indice de hora
+# de cada avion se le suma replica * horas, asi cada replica cae en su propia fila.
+# Con la matriz replica x hora, la media y las bandas de percentiles por hora son una reduccion por eje.
+import random
+import numpy as np
+from main import simulate_planes, tiempos_planes
+
+# funcion que arma el histograma replica x hora de una lista de arrays de tiempos (minutos de simulacion)
+def histograma_horas(tiempos, total_minutes=1080):
+    """
+    Args:
+        tiempos: lista (una entrada por réplica) de arrays de minutos; los NaN se ignoran
+        total_minutes: duración de la simulación (define la cantidad de horas)
+
+    Returns:
+        np.array de enteros de forma (réplicas, horas); la columna k es la hora 6 + k.
+        Los tiempos iguales a total_minutes (aterrizajes en el último minuto) cuentan en la última hora.
+    """
+    horas = -(-total_minutes // 60)
+    n = len(tiempos)
+    if n == 0:
+        return np.zeros((0, horas), dtype=np.int64)
+    largos = np.fromiter((len(t) for t in tiempos), np.int64, n)
+    todos = np.concatenate([np.asarray(t, dtype=float) for t in tiempos]) if largos.sum() else np.zeros(0)
+    fila = np.repeat(np.arange(n), largos)
+    validos = ~np.isnan(todos)
+    hora = np.minimum(todos[validos].astype(np.int64) // 60, horas - 1)
+    return np.bincount(fila[validos] * horas + hora, minlength=n * horas).reshape(n, horas)
+
+# funcion que resume un histograma replica x hora en media y percentiles por hora
+def bandas_por_hora(hist, percentiles=(5, 50, 95)):
+    """
+    Returns:
+        dict con 'horas' (hora de reloj), 'media', 'desvio' y una entrada 'p<q>' por percentil
+    """
+    hist = np.asarray(hist, dtype=float)
+    res = {
+        'horas': np.arange(6, 6 + hist.shape[1]),
+        'media': hist.mean(axis=0),
+        'desvio': hist.std(axis=0, ddof=1) if hist.shape[0] > 1 else np.zeros(hist.shape[1]),
+    }
+    for q, valores in zip(percentiles, np.percentile(hist, percentiles, axis=0)):
+        res[f'p{q:g}'] = valores
+    return res
+
+# funcion que corre n_mc replicas y devuelve los histogramas replica x hora de arribos, aterrizajes y desvios
+def histogramas_mc(lambda_prob=0.2, total_minutes=1080, n_mc=1000, seed=None, sim_func=simulate_planes):
+    """
+    De cada réplica solo se guardan los arrays de tiempos (no los aviones).
+
+    Returns:
+        dict con 'arribos', 'aterrizajes' y 'desvios', cada uno de forma (n_mc, horas)
+    """
+    if seed is not None:
+        random.seed(seed)
+    arribos, aterrizajes, desvios = [], [], []
+    for _ in range(n_mc):
+        t = tiempos_planes(sim_func(lambda_prob, total_minutes)[0])
+        arribos.append(t['appear_time'])
+        aterrizajes.append(t['landed_time'])
+        desvios.append(t['montevideo_time'])
+    return {
+        'arribos': histograma_horas(arribos, total_minutes),
+        'aterrizajes': histograma_horas(aterrizajes, total_minutes),
+        'desvios': histograma_horas(desvios, total_minutes),
+    }
+
+# funcion que grafica la media y la banda de percentiles de aterrizajes por hora
+def graficar_bandas(hist, titulo='Aterrizajes por hora (Monte Carlo)', percentiles=(5, 95), archivo=None):
+    import matplotlib.pyplot as plt
+    b = bandas_por_hora(hist, (percentiles[0], 50, percentiles[1]))
+    lo, hi = b[f'p{percentiles[0]:g}'], b[f'p{percentiles[1]:g}']
+    plt.figure(figsize=(12, 6))
+    plt.bar(b['horas'], b['media'], color='skyblue', edgecolor='black', alpha=0.7, label='Media')
+    plt.fill_between(b['horas'], lo, hi, step='mid', color='orange', alpha=0.3,
+                     label=f'Percentiles {percentiles[0]}-{percentiles[1]}')
+    plt.plot(b['horas'], b['p50'], 'k_', markersize=20, label='Mediana')
+    plt.xlabel('Hora', fontsize=12)
+    plt.ylabel('Aviones por hora', fontsize=12)
+    plt.title(titulo, fontsize=14)
+    plt.xticks(b['horas'])
+    plt.grid(True, alpha=0.3)
+    plt.legend()
+    plt.tight_layout()
+    if archivo is not None:
+        plt.savefig(archivo, dpi=150)
+    else:
+        plt.show()
+
+# funcion principal: bandas por hora de aterrizajes y desvios
+def main():
+    res = histogramas_mc(0.16355, 1080, n_mc=500, seed=42)
+    for nombre in ('arribos', 'aterrizajes', 'desvios'):
+        b = bandas_por_hora(res[nombre])
+        print(f"{nombre}: " + ' '.join(f"{h:02d}h {m:.1f} [{lo:.0f}-{hi:.0f}]"
+                                       for h, m, lo, hi in zip(b['horas'], b['media'], b['p5'], b['p95'])))
+
+if __name__ == "__main__":
+    main()
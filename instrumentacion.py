@@ -0,0 +1,109 @@
+# instrumentacion opcional del bucle de simulacion (main.Simulacion).
+# Mide el tiempo acumulado de cada fase del minuto (arribos, secuenciacion, rejoin, posiciones),
+# cuenta eventos (rejoins disparados, pasadas de secuenciacion, comparaciones en la busqueda de gap,
+# reingresos, desvios), arma un histograma del largo de la cola y registra el balance de bloques de
+# memoria asignados por Python en cada fase (sys.getallocatedblocks).
+# Con instrumentacion=None (el default) el simulador no paga practicamente nada.
+import json
+import random
+import sys
+import time
+from collections import Counter
+
+FASES = ('arribos', 'secuenciacion', 'rejoin', 'posiciones')
+
+# clase Instrumentacion que acumula tiempos y contadores de una o varias simulaciones
+class Instrumentacion:
+    def __init__(self):
+        self.tiempos = {fase: 0.0 for fase in FASES}
+        self.bloques = {fase: 0 for fase in FASES}
+        self.contadores = Counter()
+        self.hist_cola = Counter()
+        self.minutos = 0
+
+    # ejecuta las fases del minuto t de sim midiendo cada una
+    def medir_paso(self, sim, t):
+        reloj = time.perf_counter
+        bloques = sys.getallocatedblocks
+        self.hist_cola[sum(len(queue) for queue in sim.colas)] += 1
+        self.minutos += 1
+        n_planes = len(sim.planes)
+        for fase, metodo in (('arribos', sim.fase_arribos), ('secuenciacion', sim.fase_secuenciacion),
+                             ('rejoin', sim.fase_rejoin), ('posiciones', sim.fase_posiciones)):
+            b0 = bloques()
+            t0 = reloj()
+            metodo(t)
+            self.tiempos[fase] += reloj() - t0
+            self.bloques[fase] += bloques() - b0
+        self.contadores['arribos'] += len(sim.planes) - n_planes
+
+    # devuelve el perfil como diccionario serializable
+    def reporte(self):
+        total = sum(self.tiempos.values())
+        return {
+            'minutos_simulados': self.minutos,
+            'tiempo_total_s': total,
+            'tiempos_s': dict(self.tiempos),
+            'porcentaje_tiempo': {f: (100 * v / total if total > 0 else 0.0) for f, v in self.tiempos.items()},
+            'bloques_netos': dict(self.bloques),
+            'contadores': dict(self.contadores),
+            'hist_cola': {str(k): v for k, v in sorted(self.hist_cola.items())},
+        }
+
+    # imprime el perfil en forma de tabla
+    def imprimir(self):
+        rep = self.reporte()
+        print(f"Perfil de {rep['minutos_simulados']} minutos simulados ({rep['tiempo_total_s']*1000:.1f} ms en fases)")
+        print(f"{'fase':<15}{'tiempo (ms)':>12}{'%':>8}{'bloques netos':>15}")
+        for fase in FASES:
+            print(f"{fase:<15}{rep['tiempos_s'][fase]*1000:>12.1f}{rep['porcentaje_tiempo'][fase]:>8.1f}{rep['bloques_netos'][fase]:>15}")
+        print("Contadores:")
+        for nombre, valor in sorted(rep['contadores'].items()):
+            print(f"  {nombre}: {valor}")
+        largo_medio = sum(k * v for k, v in self.hist_cola.items()) / max(self.minutos, 1)
+        print(f"Largo medio de la cola: {largo_medio:.2f} (máximo {max(self.hist_cola, default=0)})")
+
+    # exporta el perfil (y opcionalmente los resultados Monte Carlo asociados) a JSON
+    def exportar(self, path, resultados=None):
+        data = {'perfil': self.reporte()}
+        if resultados is not None:
+            data['resultados'] = resultados
+        with open(path, 'w', encoding='utf-8') as f:
+            json.dump(data, f, indent=2)
+
+# funcion que corre un Monte Carlo instrumentado de simulate_planes
+def perfilar_montecarlo(lambda_prob=0.2, total_minutes=1080, n_mc=30, seed=None, salida=None):
+    """
+    Corre n_mc simulaciones acumulando el perfil en una sola Instrumentacion.
+
+    Returns:
+        (resultados, instrumentacion): resultados tiene la media de la tasa de desvíos y de aterrizajes
+    """
+    from main import simulate_planes
+    if seed is not None:
+        random.seed(seed)
+    instr = Instrumentacion()
+    desvios = []
+    aterrizajes = []
+    for _ in range(n_mc):
+        planes, _ = simulate_planes(lambda_prob, total_minutes, instrumentacion=instr)
+        if planes:
+            desvios.append(len([p for p in planes if p.status == 'montevideo']) / len(planes))
+            aterrizajes.append(len([p for p in planes if p.status == 'landed']) / len(planes))
+    resultados = {
+        'lambda_prob': lambda_prob, 'total_minutes': total_minutes, 'n_mc': n_mc, 'seed': seed,
+        'prob_desvio': sum(desvios) / len(desvios) if desvios else 0.0,
+        'prob_aterrizaje': sum(aterrizajes) / len(aterrizajes) if aterrizajes else 0.0,
+    }
+    if salida is not None:
+        instr.exportar(salida, resultados)
+    return resultados, instr
+
+# funcion principal: perfil de un Monte Carlo de ejemplo
+def main():
+    resultados, instr = perfilar_montecarlo(lambda_prob=0.2, total_minutes=1080, n_mc=20, seed=42)
+    print(f"Prob. desvío = {resultados['prob_desvio']*100:.1f}%")
+    instr.imprimir()
+
+if __name__ == "__main__":
+    main()
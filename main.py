@@ -1,7 +1,6 @@
 # Simulación de llegada y aproximación de aviones a AEP, y otras funciones relevantes para esta simulacion.
-import numpy as np
+import copy
 import random
-from tqdm import tqdm
 
 # funcion que convierte una velocidad en nudos a una  velocidad en millas náuticas por minuto. 
 def knots_to_nm_per_min(knots: float) -> float:
@@ -32,6 +31,87 @@ MIN_SEPARATION_MIN = 4 # tiempo minimo de separacion
 BUFFER_MIN = 5 # buffer minimo de seguridad 
 REJOIN_GAP_MIN = 10 # tiempo minimo de gap para reingresar
 
+# funcion que precalcula el modelo de tiempos por tramo de APPROACH_RANGES dentro de dist_max mn:
+# - tramos: lista de (r_min, r_max, t_min, t_max), minutos para cruzar el tramo a velocidad maxima y minima
+# - limites: distancias de los limites de los tramos (0, 5, 15, 50, 100)
+# - base, maximo: tiempo minimo (a velocidad maxima) y maximo (a velocidad minima) desde cada limite hasta la pista
+def modelo_tramos(ranges=APPROACH_RANGES, dist_max=100.0):
+	tramos = []
+	for r_min, r_max, v_min, v_max in sorted(ranges):
+		if r_min >= dist_max:
+			continue
+		r_max = min(r_max, dist_max)
+		tramos.append((r_min, r_max, eta_minutes(r_max - r_min, v_max), eta_minutes(r_max - r_min, v_min)))
+	limites, base, maximo = [0.0], [0.0], [0.0]
+	for r_min, r_max, t_min, t_max in tramos:
+		limites.append(float(r_max))
+		base.append(base[-1] + t_min)
+		maximo.append(maximo[-1] + t_max)
+	return tramos, limites, base, maximo
+
+TRAMOS, LIMITES_TRAMOS, BASE_ACUMULADA, MAXIMO_ACUMULADO = modelo_tramos()
+TIEMPO_BASE_100NM = BASE_ACUMULADA[-1] # tiempo minimo desde 100 mn hasta la pista (23.4 minutos)
+
+# funcion que devuelve el tiempo minimo (volando cada tramo a la velocidad maxima) desde dist mn hasta la pista;
+# dentro de cada tramo el tiempo es lineal en la distancia. modelo: resultado de modelo_tramos (por defecto,
+# el de APPROACH_RANGES)
+def tiempo_base(dist=100.0, modelo=None):
+	tramos, limites, base, _ = (TRAMOS, LIMITES_TRAMOS, BASE_ACUMULADA, MAXIMO_ACUMULADO) if modelo is None else modelo
+	dist = min(max(dist, 0.0), limites[-1])
+	for k in range(1, len(limites)):
+		if dist <= limites[k]:
+			r_min, r_max, t_min, _ = tramos[k - 1]
+			return base[k - 1] + t_min * (dist - r_min) / (r_max - r_min)
+	return base[-1]
+
+# clase ParametrosAproximacion: constantes de separacion y bandas de velocidad que usa el motor, para poder
+# cambiarlas por simulacion (ver sensibilidad.py) sin tocar los valores del modulo, que son los de por defecto:
+# - min_separacion, buffer, gap_reingreso: MIN_SEPARATION_MIN, BUFFER_MIN y REJOIN_GAP_MIN (minutos)
+# - rangos: bandas de velocidad por distancia, en el formato de APPROACH_RANGES
+# - reduccion_velocidad: nudos que baja el avion que queda demasiado cerca del anterior (politica fcfs)
+# - velocidad_rejoin: nudos a los que vuela hacia atras el avion en rejoin
+class ParametrosAproximacion:
+	def __init__(self, min_separacion=MIN_SEPARATION_MIN, buffer=BUFFER_MIN, gap_reingreso=REJOIN_GAP_MIN,
+				 rangos=APPROACH_RANGES, reduccion_velocidad=20, velocidad_rejoin=200):
+		if min_separacion <= 0 or buffer <= 0 or gap_reingreso <= 0:
+			raise ValueError("Las separaciones deben ser positivas")
+		if velocidad_rejoin <= 0:
+			raise ValueError(f"La velocidad de rejoin debe ser positiva, no {velocidad_rejoin}")
+		for r_min, r_max, v_min, v_max in rangos:
+			if not 0 < v_min <= v_max:
+				raise ValueError(f"Banda de velocidad inválida: {(r_min, r_max, v_min, v_max)}")
+		self.min_separacion = min_separacion
+		self.buffer = buffer
+		self.gap_reingreso = gap_reingreso
+		self.rangos = [tuple(r) for r in rangos]
+		self.reduccion_velocidad = reduccion_velocidad
+		self.velocidad_rejoin = velocidad_rejoin
+		self.modelo = modelo_tramos(self.rangos)
+		self.tiempo_base_100nm = self.modelo[2][-1]
+
+	def __repr__(self):
+		return f"ParametrosAproximacion({', '.join(f'{k}={v!r}' for k, v in self.como_dict().items())})"
+
+	# tiempo minimo desde dist mn hasta la pista con estas bandas de velocidad
+	def tiempo_base(self, dist=100.0):
+		return tiempo_base(dist, self.modelo)
+
+	# copia con las bandas de velocidad escaladas: velocidad multiplica las velocidades maximas y ancho el ancho
+	# de cada banda (v_max - v_min), que se mantiene colgando de la maxima
+	def con_bandas(self, velocidad=1.0, ancho=1.0):
+		rangos = [(r_min, r_max, velocidad * (v_max - ancho * (v_max - v_min)), velocidad * v_max)
+				  for r_min, r_max, v_min, v_max in self.rangos]
+		return ParametrosAproximacion(self.min_separacion, self.buffer, self.gap_reingreso, rangos,
+									  self.reduccion_velocidad, self.velocidad_rejoin)
+
+	# diccionario serializable (para el cache)
+	def como_dict(self):
+		return {'min_separacion': self.min_separacion, 'buffer': self.buffer, 'gap_reingreso': self.gap_reingreso,
+				'rangos': [list(r) for r in self.rangos], 'reduccion_velocidad': self.reduccion_velocidad,
+				'velocidad_rejoin': self.velocidad_rejoin}
+
+PARAMETROS = ParametrosAproximacion()
+
 # clase Plane que representa un avion en la simulacion con : 
 # - id: identificador unico del avion
 # - appear_time: minuto de aparicion del avion en la simulacion
@@ -40,34 +120,64 @@ REJOIN_GAP_MIN = 10 # tiempo minimo de gap para reingresar
 # - speed: velocidad actual del avion en nudos, maxima permtitida por default 
 # - positions: lista de tuplas (tiempo, distancia) que registra la posicion del avion a lo largo del tiempo
 # - waiting: booleano que indica si el avion esta esperando para reingresar
-# - wait_time: tiempo total que el avion ha estado esperando para reingresar
+# - wait_time: tiempo total que el avion ha estado esperando para reingresar (minutos volando hacia atras en rejoin)
+# - rejoins: cantidad de veces que el avion fue enviado a rejoin por falta de separacion
+# - interrupciones: aterrizajes interrumpidos por viento (go-around, ver ModeloGoAround)
+# - en_interrupcion: True mientras el avion vuelve a buscar un gap despues de un go-around
+# - demora_holding: minutos perdidos en rejoin por falta de separacion (ver descomponer_atrasos)
+# - demora_goaround: minutos perdidos por interrupciones de aterrizaje (go-around): los minutos en rejoin
+#   despues de la interrupcion mas el tiempo base para volver a volar desde la distancia de reingreso
+# - en_arco: True mientras el avion espera en el arco de secuenciacion (politica point_merge)
+# - minutos_arco: minutos que el avion paso en el arco de secuenciacion
+# - en_espera: True mientras el avion espera en el fijo de un cierre de pista (ver ProgramaCierres)
+# - demora_cierre: minutos esperando en el fijo por un cierre o una reduccion de capacidad de la pista
+# - reingreso_time: ultimo minuto en que el avion volvio de rejoin a la cola (ese minuto ya se conto en rejoin)
+# - pista: indice de la pista asignada (0 si hay una sola)
 # - landed_time: minuto en que el avion aterrizo (si es que aterrizo)
 # - montevideo_time: minuto en que el avion se fue a Montevideo (si se tuvo que ir a Montevideo)
+# - rangos: bandas de velocidad por distancia (APPROACH_RANGES salvo que la simulacion use otros parametros)
+# si se pasa speed_u (uniforme en [0, 1)) la velocidad inicial se obtiene de ahi en vez de sortearla,
+# lo que permite reutilizar los mismos numeros aleatorios entre corridas (ver barrido_lambda.py)
 class Plane:
-	def __init__(self, id, appear_time):
+	def __init__(self, id, appear_time, speed_u=None, rangos=None):
 		self.id = id
 		self.appear_time = appear_time
+		self.rangos = APPROACH_RANGES if rangos is None else rangos
 		# Distancia inicial fija a 100 mn
 		self.dist = 100.0
 		# Buscar el rango de velocidad permitido según la distancia (100 mn)
 		v_min, v_max = None, None
-		for r_min, r_max, vmin, vmax in APPROACH_RANGES:
+		for r_min, r_max, vmin, vmax in self.rangos:
 			if r_min < self.dist <= r_max:
 				v_min, v_max = vmin, vmax
 				break
 		if v_min is None or v_max is None:
 			raise ValueError(f"No se encontró rango de velocidad para distancia {self.dist}")
 		self.status = 'approaching'  # 'approaching', 'montevideo', 'landed'
-		self.speed = random.uniform(v_min, v_max)
+		if speed_u is None:
+			self.speed = random.uniform(v_min, v_max)
+		else:
+			self.speed = v_min + (v_max - v_min) * speed_u
 		self.positions = [(appear_time, self.dist)]
 		self.waiting = False
 		self.wait_time = 0
+		self.rejoins = 0
+		self.interrupciones = 0
+		self.en_interrupcion = False
+		self.demora_holding = 0
+		self.demora_goaround = 0.0
+		self.en_arco = False
+		self.minutos_arco = 0
+		self.en_espera = False
+		self.demora_cierre = 0
+		self.reingreso_time = None
+		self.pista = 0
 		self.landed_time = None
 		self.montevideo_time = None
 
 	# determina el rango de velocidad segun la distancia actual del avion a AEP
 	def get_range(self):
-		for r_min, r_max, v_min, v_max in APPROACH_RANGES:
+		for r_min, r_max, v_min, v_max in self.rangos:
 			if r_min < self.dist <= r_max:
 				return v_min, v_max
 		return None, None
@@ -92,72 +202,427 @@ class Plane:
 			self.status = 'landed'
 			self.landed_time = self.positions[-1][0]
 
-# funcion que simula la llegada y aproximacion de aviones a AEP
-def simulate_planes(lambda_prob=0.2, total_minutes=1080):
-	planes = []
-	queue = []
-	rejoining = []
-	next_id = 1
-	
-	# Usar tqdm para mostrar progreso de la simulación solo si no está deshabilitado globalmente
-	use_tqdm = getattr(simulate_planes, "use_tqdm", False)
-	iterator = range(total_minutes)
-	if use_tqdm:
-		iterator = tqdm(iterator, desc="⏱️  Simulando", unit="min", disable=(total_minutes < 100))
-	for t in iterator:
-		# Aparición de nuevos aviones
-		if random.random() < lambda_prob:
-			plane = Plane(next_id, t)
-			# Chequeo de separación temporal con el anterior en la cola
-			if queue:
-				prev_plane = queue[-1]
-				if (plane.appear_time - prev_plane.appear_time) < MIN_SEPARATION_MIN:  #si el tiempo entre aviones es menor al minimo de separacion
-					plane.speed = max(plane.get_min_speed(), prev_plane.speed - 20) #ajusta la velocidad a 20 nudos menos
-			planes.append(plane)
-			queue.append(plane)
-			next_id += 1
-		# Procesar aviones en estado 'approaching'
-		for i, plane in enumerate(queue[:]):
-			if plane.status == 'approaching':
-				to_remove = []
-				for i, plane in enumerate(queue[:]):
-					if plane.status == 'approaching':
-						if i > 0:
-							prev = queue[i-1]
-							prev_time_to_land = t + eta_minutes(prev.dist, prev.speed) if prev.status != 'landed' else prev.landed_time 
-							curr_time_to_land = t + eta_minutes(plane.dist, plane.speed)
-							nueva_speed = max(plane.get_min_speed(), prev.speed - 20)
-							curr_time_to_land_nueva = t + eta_minutes(plane.dist, nueva_speed)
-							if (curr_time_to_land - prev_time_to_land) < MIN_SEPARATION_MIN:
-								required_speed = prev.speed - 20
-								if required_speed < plane.get_min_speed() or (curr_time_to_land_nueva - prev_time_to_land) < BUFFER_MIN:
-									# Debe bajar por debajo del mínimo O no logra buffer, va a rejoin
-									plane.status = 'rejoin'
-									plane.rejoin_start_time = t
-									plane.rejoin_dist = plane.dist
-									rejoining.append(plane)
-									to_remove.append(plane)
-									continue
-								else:
-									plane.speed = nueva_speed
+# politicas de asignacion de pista: reciben la simulacion, el avion nuevo y el minuto, y devuelven el indice de pista
+
+# asigna las pistas en forma ciclica
+def pista_round_robin(sim, plane, t):
+	pista = sim.proxima_pista
+	sim.proxima_pista = (pista + 1) % sim.pistas
+	return pista
+
+# asigna la pista donde el ultimo avion de la cola aterriza antes (o una pista con la cola vacia)
+def pista_primer_eta(sim, plane, t):
+	mejor, mejor_eta = 0, None
+	for k, queue in enumerate(sim.colas):
+		if not queue:
+			return k
+		ultimo = queue[-1]
+		eta = t + eta_minutes(ultimo.dist, ultimo.speed)
+		if mejor_eta is None or eta < mejor_eta:
+			mejor, mejor_eta = k, eta
+	return mejor
+
+# asigna la pista con menos aviones en aproximacion
+def pista_menor_cola(sim, plane, t):
+	largos = [len(queue) for queue in sim.colas]
+	return largos.index(min(largos))
+
+POLITICAS_PISTA = {
+	'round_robin': pista_round_robin,
+	'primer_eta': pista_primer_eta,
+	'menor_cola': pista_menor_cola,
+}
+
+# politicas de secuenciacion: reciben la simulacion, la cola de una pista (en orden de aterrizaje) y el minuto,
+# ajustan la velocidad de cada avion y sacan de la cola a los que mandan a rejoin (sim.enviar_a_rejoin)
+
+# FCFS con control de velocidad: el avion que queda a menos de min_separacion del anterior baja a
+# prev.speed - reduccion_velocidad nudos; si eso esta por debajo de su minima o no alcanza el buffer, va a rejoin
+# (constantes de sim.parametros, por defecto MIN_SEPARATION_MIN, 20 nudos y BUFFER_MIN)
+def secuenciar_fcfs(sim, queue, t):
+	instr = sim.instrumentacion
+	parametros = sim.parametros
+	min_separacion, buffer, reduccion = parametros.min_separacion, parametros.buffer, parametros.reduccion_velocidad
+	for i, plane in enumerate(queue[:]):
+		if plane.status == 'approaching':
+			to_remove = []
+			for i, plane in enumerate(queue[:]):
+				if plane.status == 'approaching':
+					if i > 0:
+						prev = queue[i-1]
+						prev_time_to_land = t + eta_minutes(prev.dist, prev.speed) if prev.status != 'landed' else prev.landed_time 
+						curr_time_to_land = t + eta_minutes(plane.dist, plane.speed)
+						vmin, vmax = plane.get_range()
+						nueva_speed = min(max(vmin, prev.speed - reduccion), vmax)
+						curr_time_to_land_nueva = t + eta_minutes(plane.dist, nueva_speed)
+						if (curr_time_to_land - prev_time_to_land) < min_separacion:
+							required_speed = prev.speed - reduccion
+							if required_speed < plane.get_min_speed() or (curr_time_to_land_nueva - prev_time_to_land) < buffer:
+								# Debe bajar por debajo del mínimo O no logra buffer, va a rejoin
+								sim.enviar_a_rejoin(plane, t)
+								to_remove.append(plane)
+								continue
 							else:
-								plane.speed = plane.get_max_speed()
+								plane.speed = nueva_speed
 						else:
-							# Primer avión, no tiene anterior
 							plane.speed = plane.get_max_speed()
-						# Chequeo: ¿la velocidad está dentro del rango permitido?
-						vmin, vmax = plane.get_range()
-						if plane.speed < vmin or plane.speed > vmax:
-							print(f"[ADVERTENCIA] Avión {plane.id} en t={t} mn={plane.dist:.2f} velocidad={plane.speed:.2f} fuera de rango [{vmin}, {vmax}]")
-				# Remover aviones marcados fuera del bucle principal
-				for plane in to_remove:
-					if plane in queue:
-						queue.remove(plane)
-		
-		# Procesar aviones en rejoining (buscan gap o van a Montevideo)
+					else:
+						# Primer avión, no tiene anterior
+						plane.speed = plane.get_max_speed()
+					# Chequeo: ¿la velocidad está dentro del rango permitido?
+					vmin, vmax = plane.get_range()
+					if plane.speed < vmin or plane.speed > vmax:
+						print(f"[ADVERTENCIA] Avión {plane.id} en t={t} mn={plane.dist:.2f} velocidad={plane.speed:.2f} fuera de rango [{vmin}, {vmax}]")
+			# Remover aviones marcados fuera del bucle principal
+			for plane in to_remove:
+				if plane in queue:
+					queue.remove(plane)
+			if instr is not None:
+				instr.contadores['pasadas_secuenciacion'] += 1
+
+# espaciado por tiempo: cada avion toma la velocidad (dentro de su rango) con la que llega justo
+# min_separacion despues del anterior; solo va a rejoin si ni a su velocidad minima logra la separacion
+def secuenciar_espaciado(sim, queue, t):
+	to_remove = []
+	prev = None
+	for plane in queue:
+		if plane.status != 'approaching':
+			continue
+		if not _espaciar(plane, prev, sim.parametros.min_separacion):
+			sim.enviar_a_rejoin(plane, t)
+			to_remove.append(plane)
+			continue
+		prev = plane
+	for plane in to_remove:
+		queue.remove(plane)
+
+# velocidad para llegar min_separacion minutos despues de prev; devuelve False si no se puede (y no la cambia)
+def _espaciar(plane, prev, min_separacion):
+	vmin, vmax = plane.get_range()
+	if prev is None:
+		plane.speed = vmax
+		return True
+	disponible = eta_minutes(prev.dist, prev.speed) + min_separacion
+	necesaria = plane.dist / disponible * 60
+	if necesaria < vmin:
+		return False
+	plane.speed = min(necesaria, vmax)
+	return True
+
+# point merge: la cola se ordena por la hora estimada de llegada al punto de fusion (la pista, volando a
+# velocidad maxima) y se espacia por tiempo como secuenciar_espaciado; el avion que no logra la separacion
+# ni a su velocidad minima espera en el arco de secuenciacion (estira la trayectoria sin acercarse, ver
+# fase_posiciones) hasta MAX_MINUTOS_ARCO minutos, y recien despues va a rejoin
+MAX_MINUTOS_ARCO = 10
+
+def secuenciar_point_merge(sim, queue, t):
+	queue.sort(key=lambda p: eta_minutes(p.dist, p.get_max_speed()))
+	to_remove = []
+	prev = None
+	for plane in queue:
+		if plane.status != 'approaching':
+			continue
+		if _espaciar(plane, prev, sim.parametros.min_separacion):
+			plane.en_arco = False
+		elif plane.minutos_arco < MAX_MINUTOS_ARCO:
+			plane.en_arco = True
+			plane.speed = plane.get_min_speed()
+		else:
+			sim.enviar_a_rejoin(plane, t)
+			to_remove.append(plane)
+			continue
+		prev = plane
+	for plane in to_remove:
+		queue.remove(plane)
+
+POLITICAS_SECUENCIACION = {
+	'fcfs': secuenciar_fcfs,
+	'espaciado': secuenciar_espaciado,
+	'point_merge': secuenciar_point_merge,
+}
+
+# niveles de viento y su probabilidad de interrumpir un aterrizaje
+NIVELES_VIENTO = {'calmo': 0.0, 'leve': 0.05, 'moderado': 0.1, 'fuerte': 0.2, 'severo': 0.35}
+
+# clase ModeloGoAround: interrupciones de aterrizaje por viento (go-around)
+# - prob: probabilidad de interrumpir cada intento de aterrizaje. Un numero, un nivel de NIVELES_VIENTO, una lista
+#   de (hora "HH:MM" o minuto, prob) constante a tramos (como perfiles.PerfilLlegadas) o una funcion t -> prob
+# - dist_reingreso: distancia (mn) desde la que el avion interrumpido vuelve hacia atras buscando un gap en rejoin
+# - max_intentos: intentos de aterrizaje por avion; si se interrumpe el ultimo el avion se desvia a Montevideo
+#   (None: sin limite)
+# - semilla: semilla de los uniformes de los intentos (None: se deriva del estado de random y de los arribos
+#   pre-sorteados sin consumir random, ver Simulacion._iniciar_goaround)
+# Los uniformes de los intentos se sortean por bloques de aviones con numpy (ver Simulacion._u_goaround):
+# el intento k del avion i usa siempre el mismo numero, asi una grilla de severidades con la misma semilla
+# usa numeros aleatorios comunes (restaurando el estado de random antes de cada severidad, como hace
+# dia_ventoso.barrido_viento) y la probabilidad solo cambia el umbral.
+class ModeloGoAround:
+	def __init__(self, prob=0.1, dist_reingreso=20.0, max_intentos=None, semilla=None):
+		if isinstance(prob, str):
+			if prob not in NIVELES_VIENTO:
+				raise ValueError(f"Nivel de viento desconocido: {prob} (usar {', '.join(NIVELES_VIENTO)})")
+			prob = NIVELES_VIENTO[prob]
+		self.tramos = None
+		if isinstance(prob, (list, tuple)):
+			from perfiles import hora_a_minutos
+			self.tramos = sorted((hora_a_minutos(t), float(p)) for t, p in prob)
+			self.prob_en = self._prob_tramos
+		elif callable(prob):
+			self.prob_en = prob
+		else:
+			self.prob = float(prob)
+		if not 0 < dist_reingreso <= 100:
+			raise ValueError(f"La distancia de reingreso debe estar entre 0 y 100 mn, no {dist_reingreso}")
+		if max_intentos is not None and max_intentos < 1:
+			raise ValueError(f"max_intentos debe ser al menos 1, no {max_intentos}")
+		self.dist_reingreso = float(dist_reingreso)
+		self.max_intentos = max_intentos
+		self.semilla = semilla
+
+	def __repr__(self):
+		prob = self.tramos if self.tramos is not None else getattr(self, 'prob', self.prob_en)
+		return f"ModeloGoAround({prob!r}, dist_reingreso={self.dist_reingreso!r}, max_intentos={self.max_intentos!r}, semilla={self.semilla!r})"
+
+	# probabilidad de interrupcion en el minuto t
+	def prob_en(self, t):
+		return self.prob
+
+	def _prob_tramos(self, t):
+		prob = 0.0
+		for inicio, valor in self.tramos:
+			if inicio > t:
+				break
+			prob = valor
+		return prob
+
+	# diccionario serializable (para el cache)
+	def como_dict(self):
+		return {'prob': self.tramos if self.tramos is not None else getattr(self, 'prob', repr(self.prob_en)),
+				'dist_reingreso': self.dist_reingreso, 'max_intentos': self.max_intentos}
+
+# clase ProgramaCierres: ventanas en las que la pista se cierra o reduce su capacidad (por ejemplo por tormentas)
+# - ventanas: lista de (inicio, duracion) o (inicio, duracion, capacidad), con inicio en minuto o "HH:MM";
+#   capacidad es la fraccion de la capacidad normal (0: pista cerrada, 0.5: la mitad de los aterrizajes).
+#   Si dos ventanas se superponen vale la menor capacidad
+# - accion: que hace el avion que llega a dist_cierre sin lugar para aterrizar: 'desvio' (se va a Montevideo,
+#   como en Ejercicio6) o 'holding' (espera en el fijo a dist_cierre hasta que haya lugar)
+# - dist_cierre: distancia (mn) a la que se controla el acceso a la pista
+# - max_espera: minutos de holding despues de los cuales el avion se desvia (None: sin limite)
+# Con la pista cerrada no aterriza nadie, ni siquiera los aviones que ya estaban adentro de dist_cierre. Con
+# capacidad parcial c cada pista deja pasar un avion por dist_cierre cada min_separacion / c minutos y los
+# que ya estaban adentro siguen. La capacidad de cada minuto se precalcula en un dict (minuto -> capacidad),
+# asi los minutos sin restriccion no pagan nada aunque el dia tenga muchas ventanas.
+class ProgramaCierres:
+	def __init__(self, ventanas, accion='desvio', dist_cierre=10.0, max_espera=None):
+		from perfiles import hora_a_minutos
+		if accion not in ('desvio', 'holding'):
+			raise ValueError(f"Acción de cierre desconocida: {accion} (usar 'desvio' o 'holding')")
+		if not 0 < dist_cierre < 100:
+			raise ValueError(f"La distancia de cierre debe estar entre 0 y 100 mn, no {dist_cierre}")
+		self.ventanas = []
+		for ventana in ventanas:
+			inicio, duracion = hora_a_minutos(ventana[0]), int(ventana[1])
+			capacidad = float(ventana[2]) if len(ventana) > 2 else 0.0
+			if duracion < 0 or not 0 <= capacidad <= 1:
+				raise ValueError(f"Ventana de cierre inválida: {ventana} (duración >= 0, capacidad entre 0 y 1)")
+			self.ventanas.append((inicio, duracion, capacidad))
+		self.ventanas.sort()
+		self.accion = accion
+		self.dist_cierre = float(dist_cierre)
+		self.max_espera = max_espera
+		self.capacidad = {}
+		for inicio, duracion, capacidad in self.ventanas:
+			if capacidad >= 1:
+				continue
+			for minuto in range(inicio, inicio + duracion):
+				self.capacidad[minuto] = min(capacidad, self.capacidad.get(minuto, 1.0))
+
+	def __repr__(self):
+		return (f"ProgramaCierres({self.ventanas!r}, accion={self.accion!r}, dist_cierre={self.dist_cierre!r}, "
+				f"max_espera={self.max_espera!r})")
+
+	# capacidad de la pista en el minuto t (None: sin restriccion)
+	def capacidad_en(self, t):
+		return self.capacidad.get(t)
+
+	# primer minuto y minuto final (excluido) del conjunto de ventanas
+	def inicio(self):
+		return self.ventanas[0][0] if self.ventanas else None
+
+	def fin(self):
+		return max((inicio + duracion for inicio, duracion, _ in self.ventanas), default=None)
+
+	# diccionario serializable (para el cache)
+	def como_dict(self):
+		return {'ventanas': [list(v) for v in self.ventanas], 'accion': self.accion,
+				'dist_cierre': self.dist_cierre, 'max_espera': self.max_espera}
+
+# clase Simulacion que mantiene el estado de la simulacion de arribos a AEP y la avanza minuto a minuto.
+# Cada minuto se divide en cuatro fases: arribos, secuenciacion de la cola, rejoin (busqueda de gap
+# o desvio a Montevideo) y actualizacion de posiciones. Estado:
+# - planes: todos los aviones aparecidos
+# - colas: una cola de aviones en aproximacion por pista, cada una en orden de llegada a su pista
+# - queue: la cola de la primera pista (la unica si hay una sola pista)
+# - rejoining: aviones volando hacia atras buscando un gap para reingresar (en la cola de su pista)
+# - desviados: aviones desviados a Montevideo, en el orden en que se desviaron
+# - t: proximo minuto a simular
+# lambda_prob: aviones por minuto; si es mayor a 1 llegan int(lambda_prob) aviones por minuto y uno mas con
+#   probabilidad igual a la parte fraccionaria (para lambda_prob <= 1 es el Bernoulli de siempre)
+# arribos: lista opcional de (minuto, speed_u) con los arribos ya sorteados; si se pasa, lambda_prob no se usa
+# instrumentacion: objeto opcional (ver instrumentacion.py) que mide tiempos y contadores por fase
+# pistas: cantidad de pistas, cada una con su propia cola y secuenciacion independiente
+# politica: asignacion de pista a cada avion nuevo, 'round_robin', 'primer_eta', 'menor_cola' (ver POLITICAS_PISTA)
+#   o una funcion (sim, plane, t) -> indice de pista
+# goaround: ModeloGoAround opcional con las interrupciones de aterrizaje por viento (None: sin interrupciones)
+# secuenciacion: politica de secuenciacion de cada cola, 'fcfs', 'espaciado', 'point_merge' (ver
+#   POLITICAS_SECUENCIACION) o una funcion (sim, queue, t)
+# parametros: ParametrosAproximacion con las separaciones y bandas de velocidad (por defecto PARAMETROS, las
+#   constantes del modulo)
+# cierres: ProgramaCierres opcional (o lista de ventanas) con los cierres y reducciones de capacidad de la pista.
+#   Mientras hay restriccion se acumulan:
+#   - espera_cierre: minutos-avion de espera (en holding en el fijo o volando hacia atras en rejoin)
+#   - desvios_cierre: aviones desviados a Montevideo por no tener lugar para aterrizar
+#   - max_cola_cierre: mayor cantidad de aviones en aproximacion
+class Simulacion:
+	def __init__(self, lambda_prob=0.2, total_minutes=1080, arribos=None, instrumentacion=None, pistas=1, politica='round_robin',
+				 goaround=None, cierres=None, secuenciacion='fcfs', parametros=None):
+		if pistas < 1:
+			raise ValueError(f"La cantidad de pistas debe ser al menos 1, no {pistas}")
+		self.lambda_prob = lambda_prob
+		self.total_minutes = total_minutes
+		self.planes = []
+		self.colas = [[] for _ in range(pistas)]
+		self.queue = self.colas[0]
+		self.rejoining = []
+		self.desviados = []
+		self.next_id = 1
+		self.t = 0
+		self.externos = {}
+		self.arribos_por_minuto = None
+		if arribos is not None:
+			self.arribos_por_minuto = {}
+			for minuto, speed_u in arribos:
+				self.arribos_por_minuto.setdefault(minuto, []).append(speed_u)
+		self.instrumentacion = instrumentacion
+		self.pistas = pistas
+		self.politica = POLITICAS_PISTA[politica] if isinstance(politica, str) else politica
+		self.proxima_pista = 0
+		self.secuenciacion = POLITICAS_SECUENCIACION[secuenciacion] if isinstance(secuenciacion, str) else secuenciacion
+		self.parametros = PARAMETROS if parametros is None else parametros
+		self.goaround = None
+		if goaround is not None:
+			self._iniciar_goaround(goaround)
+		self.cierres = None
+		self.espera_cierre = 0
+		self.desvios_cierre = 0
+		self.max_cola_cierre = 0
+		self._ultimo_cruce = [float('-inf')] * pistas
+		if cierres is not None:
+			self.cierres = cierres if isinstance(cierres, ProgramaCierres) else ProgramaCierres(cierres)
+
+	# activa el modelo de go-around. Sin semilla explicita, el generador de los uniformes se siembra con el
+	# estado actual de random y con los arribos pre-sorteados que quedan, sin consumir random: random.seed
+	# alcanza para reproducir la corrida, con prob = 0 el dia es identico al normal y las replicas con
+	# arribos pre-sorteados distintos (que no avanzan random) no repiten los uniformes
+	def _iniciar_goaround(self, goaround):
+		import numpy as np
+		self.goaround = goaround
+		semilla = goaround.semilla
+		if semilla is None:
+			semilla = list(random.getstate()[1])
+			for minuto in sorted(self.arribos_por_minuto or ()):
+				semilla.append(minuto)
+				semilla.extend(int(u * 2 ** 53) if u is not None else 0 for u in self.arribos_por_minuto[minuto])
+		self._rng_goaround = np.random.default_rng(semilla)
+		self._columnas_goaround = goaround.max_intentos or 8
+		self._uniformes_goaround = np.empty((0, self._columnas_goaround))
+
+	# uniforme del intento de aterrizaje actual del avion (filas por id de avion, columnas por intento)
+	def _u_goaround(self, plane):
+		fila, intento = plane.id - 1, plane.interrupciones
+		if intento >= self._columnas_goaround:
+			return self._rng_goaround.random()
+		uniformes = self._uniformes_goaround
+		if fila >= len(uniformes):
+			import numpy as np
+			bloque = self._rng_goaround.random((max(256, fila + 1 - len(uniformes)), self._columnas_goaround))
+			uniformes = self._uniformes_goaround = np.concatenate([uniformes, bloque])
+		return uniformes[fila, intento]
+
+	# fase 1: aparicion de nuevos aviones
+	def fase_arribos(self, t):
+		if self.arribos_por_minuto is None:
+			lam = self.lambda_prob
+			if lam <= 1:
+				if random.random() < lam:
+					self._nuevo_avion(t, None)
+			else:
+				n = int(lam) + (random.random() < lam - int(lam))
+				for _ in range(n):
+					self._nuevo_avion(t, None)
+		else:
+			for speed_u in self.arribos_por_minuto.get(t, ()):
+				self._nuevo_avion(t, speed_u)
+		if self.externos:
+			for speed_u, datos in self.externos.pop(t, ()):
+				plane = self._nuevo_avion(t, speed_u)
+				plane.__dict__.update(datos)
+
+	# agrega un arribo que viene de afuera (por ejemplo un desvio de otro aeropuerto, ver red_aeropuertos.py);
+	# datos se guardan como atributos del avion cuando aparece
+	def programar_arribo(self, minuto, speed_u=None, **datos):
+		self.externos.setdefault(minuto, []).append((speed_u, datos))
+
+	# crea un avion en el minuto t, le asigna pista y lo agrega al final de la cola de esa pista
+	def _nuevo_avion(self, t, speed_u):
+		parametros = self.parametros
+		plane = Plane(self.next_id, t, speed_u, parametros.rangos)
+		if self.pistas > 1:
+			plane.pista = self.politica(self, plane, t)
+		queue = self.colas[plane.pista]
+		# Chequeo de separación temporal con el anterior en la cola
+		if queue:
+			prev_plane = queue[-1]
+			if (plane.appear_time - prev_plane.appear_time) < parametros.min_separacion:  #si el tiempo entre aviones es menor al minimo de separacion
+				plane.speed = max(plane.get_min_speed(), prev_plane.speed - parametros.reduccion_velocidad) #ajusta la velocidad a 20 nudos menos
+		self.planes.append(plane)
+		queue.append(plane)
+		self.next_id += 1
+		return plane
+
+	# fase 2: procesar aviones en estado 'approaching' de cada pista (ajuste de velocidad o envio a rejoin)
+	# con la politica de secuenciacion de la simulacion
+	def fase_secuenciacion(self, t):
+		secuenciar = self.secuenciacion
+		for queue in self.colas:
+			secuenciar(self, queue, t)
+
+	# manda un avion de la cola a rejoin (vuela hacia atras buscando un gap, ver fase_rejoin)
+	def enviar_a_rejoin(self, plane, t):
+		plane.status = 'rejoin'
+		plane.en_arco = False
+		plane.rejoin_start_time = t
+		plane.rejoin_dist = plane.dist
+		plane.rejoins += 1
+		self.rejoining.append(plane)
+		if self.instrumentacion is not None:
+			self.instrumentacion.contadores['rejoins'] += 1
+
+	# fase 3: procesar aviones en rejoining (buscan gap en la cola de su pista o van a Montevideo)
+	def fase_rejoin(self, t):
+		rejoining = self.rejoining
+		instr = self.instrumentacion
+		retroceso = knots_to_nm_per_min(self.parametros.velocidad_rejoin)
+		gap_reingreso = self.parametros.gap_reingreso
 		for plane in rejoining[:]:
-			# Vuela hacia atrás a 200 nudos
-			plane.dist += knots_to_nm_per_min(200)
+			queue = self.colas[plane.pista]
+			# Vuela hacia atrás a 200 nudos (velocidad_rejoin)
+			plane.dist += retroceso
+			plane.wait_time += 1
+			if plane.en_interrupcion:
+				plane.demora_goaround += 1
+			else:
+				plane.demora_holding += 1
 			plane.positions.append((plane.positions[-1][0] + 1, plane.dist))
 			
 			# Si sale de las 100mn sin encontrar gap, se va a Montevideo
@@ -165,36 +630,310 @@ def simulate_planes(lambda_prob=0.2, total_minutes=1080):
 				plane.status = 'montevideo'
 				plane.montevideo_time = t
 				rejoining.remove(plane)
+				self.desviados.append(plane)
+				if instr is not None:
+					instr.contadores['desvios'] += 1
 				continue
 			
 			# Buscar gap de 10 minutos en la cola
 			gap_found = False
+			j = 0
 			for j in range(1, len(queue)):
 				prev2 = queue[j-1]
 				curr2 = queue[j]
 				prev2_time = t + eta_minutes(prev2.dist, prev2.speed) if prev2.status != 'landed' else prev2.landed_time
 				curr2_time = t + eta_minutes(curr2.dist, curr2.speed) if curr2.status != 'landed' else curr2.landed_time
 				
-				if (curr2_time - prev2_time) >= REJOIN_GAP_MIN:
+				if (curr2_time - prev2_time) >= gap_reingreso:
 					# Encontró gap, puede reingresar
 					plane.status = 'approaching'
 					plane.dist = plane.rejoin_dist
+					plane.en_interrupcion = False
+					plane.reingreso_time = t
 					plane.positions.append((plane.positions[-1][0], plane.dist))
 					queue.insert(j, plane)
 					rejoining.remove(plane)
 					gap_found = True
 					break
-		to_remove_landed = []
-		for plane in queue[:]:
-			# Actualizar posición de los aviones en estado 'approaching'
-			if plane.status == 'approaching':
-				plane.update_position(1) # actualiza la posicion con dt=1 minuto
-				if plane.status == 'landed':
-					to_remove_landed.append(plane) # se marca como aterrizado y para eliminarse de "approaching"
-		for plane in to_remove_landed:
-			if plane in queue:
-				queue.remove(plane) # se elimina de "approaching" a los aterrizados
-	return planes, total_minutes
+			if instr is not None:
+				instr.contadores['comparaciones_gap'] += j
+				if gap_found:
+					instr.contadores['reingresos'] += 1
+
+	# fase 4: actualizar posicion de los aviones en aproximacion y retirar los aterrizados
+	# (con go-around, cada aterrizaje se puede interrumpir: ver interrumpir_aterrizaje; con cierres, el avion
+	# que llega al fijo sin lugar espera o se desvia: ver controlar_cierre)
+	def fase_posiciones(self, t):
+		goaround = self.goaround
+		capacidad = self.cierres.capacidad.get(t) if self.cierres is not None else None
+		if capacidad is not None:
+			self.espera_cierre += len(self.rejoining)
+			self.max_cola_cierre = max(self.max_cola_cierre, sum(len(queue) for queue in self.colas))
+		for queue in self.colas:
+			to_remove_landed = []
+			for plane in queue[:]:
+				# Actualizar posición de los aviones en estado 'approaching'
+				if plane.status == 'approaching':
+					if capacidad is not None:
+						if not self.controlar_cierre(plane, t, capacidad):
+							if plane.status == 'montevideo':
+								to_remove_landed.append(plane)
+							continue
+					elif plane.en_espera:
+						plane.en_espera = False
+					if plane.en_arco:
+						# en el arco de secuenciacion: vuela sin acercarse a la pista
+						plane.minutos_arco += 1
+						plane.demora_holding += 1
+						plane.positions.append((plane.positions[-1][0] + 1, plane.dist))
+						continue
+					plane.update_position(1) # actualiza la posicion con dt=1 minuto
+					if plane.status == 'landed':
+						to_remove_landed.append(plane) # se marca como aterrizado y para eliminarse de "approaching"
+						if goaround is not None and self._u_goaround(plane) < goaround.prob_en(t):
+							self.interrumpir_aterrizaje(plane, t)
+			for plane in to_remove_landed:
+				if plane in queue:
+					queue.remove(plane) # se elimina de "approaching" a los aterrizados
+
+	# control de acceso a la pista con restriccion de capacidad: devuelve True si el avion puede avanzar este
+	# minuto; si no, lo deja esperando en el fijo (holding) o lo desvia a Montevideo (ver ProgramaCierres)
+	def controlar_cierre(self, plane, t, capacidad):
+		cierres = self.cierres
+		dist_cierre = cierres.dist_cierre
+		if plane.dist - knots_to_nm_per_min(plane.speed) > dist_cierre:
+			return True # todavia no llega al fijo
+		if capacidad > 0:
+			if plane.dist <= dist_cierre and not plane.en_espera:
+				return True # ya habia pasado el fijo antes de la restriccion
+			if t - self._ultimo_cruce[plane.pista] >= self.parametros.min_separacion / capacidad:
+				self._ultimo_cruce[plane.pista] = t
+				plane.en_espera = False
+				return True
+		if cierres.accion == 'desvio' or (cierres.max_espera is not None and plane.demora_cierre >= cierres.max_espera):
+			plane.status = 'montevideo'
+			plane.montevideo_time = t
+			plane.en_espera = False
+			self.desviados.append(plane)
+			self.desvios_cierre += 1
+			if self.instrumentacion is not None:
+				self.instrumentacion.contadores['desvios'] += 1
+			return False
+		# holding: avanza hasta el fijo (si no llego) y espera ahi. En demora_cierre solo cuenta el tiempo
+		# parado en el fijo: del minuto en que llega, lo que queda despues de volar hasta el fijo, y nada del
+		# minuto en que volvio de rejoin (ya esta en demora_holding o demora_goaround)
+		espera = 1.0
+		if plane.dist > dist_cierre:
+			espera -= (plane.dist - dist_cierre) / knots_to_nm_per_min(plane.speed)
+			plane.dist = dist_cierre
+		plane.en_espera = True
+		plane.positions.append((plane.positions[-1][0] + 1, plane.dist))
+		if plane.reingreso_time != t:
+			plane.demora_cierre += espera
+		self.espera_cierre += espera
+		return False
+
+	# go-around: el avion que estaba aterrizando vuelve a dist_reingreso y busca un gap volando hacia atras
+	# (como un rejoin); si ya agoto max_intentos se desvia a Montevideo
+	def interrumpir_aterrizaje(self, plane, t):
+		goaround = self.goaround
+		plane.interrupciones += 1
+		plane.landed_time = None
+		if self.instrumentacion is not None:
+			self.instrumentacion.contadores['goarounds'] += 1
+		if goaround.max_intentos is not None and plane.interrupciones >= goaround.max_intentos:
+			plane.status = 'montevideo'
+			plane.montevideo_time = t
+			self.desviados.append(plane)
+			if self.instrumentacion is not None:
+				self.instrumentacion.contadores['desvios'] += 1
+			return
+		plane.status = 'rejoin'
+		plane.en_interrupcion = True
+		plane.rejoin_start_time = t
+		plane.rejoin_dist = plane.dist = goaround.dist_reingreso
+		plane.positions.append((plane.positions[-1][0], plane.dist))
+		# la distancia hasta la pista se vuelve a volar desde el reingreso
+		plane.demora_goaround += self.parametros.tiempo_base(plane.dist)
+		self.rejoining.append(plane)
+
+	# simula el minuto self.t y avanza el reloj
+	def paso(self):
+		t = self.t
+		if self.instrumentacion is None:
+			self.fase_arribos(t)
+			self.fase_secuenciacion(t)
+			self.fase_rejoin(t)
+			self.fase_posiciones(t)
+		else:
+			self.instrumentacion.medir_paso(self, t)
+		self.t = t + 1
+
+	# simula hasta el minuto hasta (por defecto, hasta el final)
+	def correr(self, hasta=None):
+		hasta = self.total_minutes if hasta is None else min(hasta, self.total_minutes)
+		while self.t < hasta:
+			self.paso()
+		return self
+
+	# tiempos de aparicion, aterrizaje y desvio de todos los aviones como arrays (ver tiempos_planes)
+	def tiempos(self):
+		return tiempos_planes(self.planes)
+
+	# copia del estado actual que se puede avanzar sin modificar el original. Los aviones que ya aterrizaron
+	# o se desviaron no cambian mas y se comparten; solo se copian los que siguen volando.
+	# cambios: parametros que la copia usa desde el minuto actual (ver Simulacion.cambiar)
+	def bifurcar(self, **cambios):
+		nueva = copy.copy(self)
+		activos = {}
+		for plane in [p for queue in self.colas for p in queue] + self.rejoining:
+			c = copy.copy(plane)
+			c.positions = list(plane.positions)
+			activos[id(plane)] = c
+		nueva.planes = [activos.get(id(p), p) for p in self.planes]
+		nueva.colas = [[activos[id(p)] for p in queue] for queue in self.colas]
+		nueva.queue = nueva.colas[0]
+		nueva.rejoining = [activos[id(p)] for p in self.rejoining]
+		nueva.desviados = list(self.desviados)
+		nueva.externos = {minuto: list(lista) for minuto, lista in self.externos.items()}
+		nueva._ultimo_cruce = list(self._ultimo_cruce)
+		if self.goaround is not None:
+			# cada copia avanza su propio generador de uniformes (los bloques ya sorteados se comparten)
+			nueva._rng_goaround = copy.deepcopy(self._rng_goaround)
+		nueva.instrumentacion = None
+		nueva.cambiar(**cambios)
+		return nueva
+
+	# cambia parametros de la simulacion a partir del minuto actual:
+	# - lambda_prob: nueva tasa de arribos (deja de usar los arribos ya sorteados, si los habia)
+	# - arribos: lista de (minuto, speed_u) que reemplaza a los arribos desde el minuto actual
+	# - politica: politica de asignacion de pista para los aviones nuevos
+	# - secuenciacion: politica de secuenciacion de las colas
+	# - total_minutes: nuevo final de la simulacion
+	# - instrumentacion: objeto que mide el resto de la corrida
+	# - goaround: ModeloGoAround (viento desde el minuto actual) o None
+	# - cierres: ProgramaCierres (o lista de ventanas) o None; solo importan las ventanas desde el minuto actual
+	def cambiar(self, **cambios):
+		for nombre, valor in cambios.items():
+			if nombre == 'lambda_prob':
+				self.lambda_prob = valor
+				self.arribos_por_minuto = None
+			elif nombre == 'arribos':
+				self.arribos_por_minuto = {}
+				for minuto, speed_u in valor:
+					if minuto >= self.t:
+						self.arribos_por_minuto.setdefault(minuto, []).append(speed_u)
+			elif nombre == 'politica':
+				self.politica = POLITICAS_PISTA[valor] if isinstance(valor, str) else valor
+			elif nombre == 'goaround':
+				if valor is None:
+					self.goaround = None
+				elif self.goaround is None:
+					self._iniciar_goaround(valor)
+				else:
+					# mismos uniformes: solo cambian la probabilidad y la geometria
+					self.goaround = valor
+			elif nombre == 'secuenciacion':
+				self.secuenciacion = POLITICAS_SECUENCIACION[valor] if isinstance(valor, str) else valor
+			elif nombre == 'cierres':
+				self.cierres = valor if valor is None or isinstance(valor, ProgramaCierres) else ProgramaCierres(valor)
+			elif nombre in ('total_minutes', 'instrumentacion'):
+				setattr(self, nombre, valor)
+			else:
+				raise ValueError(f"No se puede cambiar '{nombre}' en una simulación en curso")
+		return self
+
+	# instantanea del estado actual, incluido el estado de random (ver Instantanea)
+	def instantanea(self):
+		return Instantanea(self)
+
+# clase Instantanea: estado congelado de una Simulacion en el minuto t junto con random.getstate() y el estado
+# del generador de go-around. Cada llamada a continuar devuelve una simulacion nueva que arranca desde ese
+# minuto con los mismos numeros aleatorios (restaura ambos estados), asi N escenarios desde las 14:00 cuestan N veces los minutos
+# que faltan y no N dias completos, y las diferencias entre escenarios no son ruido del sorteo.
+# Se puede guardar con pickle (por ejemplo con checkpoint.guardar_checkpoint) si la politica es una de POLITICAS_PISTA.
+class Instantanea:
+	def __init__(self, sim):
+		self.sim = sim.bifurcar()
+		self.estado_random = random.getstate()
+		self.estado_goaround = self.sim._rng_goaround.bit_generator.state if self.sim.goaround is not None else None
+
+	@property
+	def t(self):
+		return self.sim.t
+
+	# simulacion que sigue desde la instantanea con los cambios dados (ver Simulacion.cambiar)
+	def continuar(self, **cambios):
+		random.setstate(self.estado_random)
+		if self.estado_goaround is not None:
+			self.sim._rng_goaround.bit_generator.state = self.estado_goaround
+		return self.sim.bifurcar(**cambios)
+
+# funcion que simula la llegada y aproximacion de aviones a AEP
+# arribos: lista opcional de (minuto, speed_u) con los arribos ya sorteados; si se pasa, lambda_prob no se usa
+# instrumentacion: objeto opcional (ver instrumentacion.py) que acumula tiempos y contadores por fase
+# pistas, politica: cantidad de pistas y politica de asignacion de pista (ver Simulacion)
+# goaround: ModeloGoAround opcional (interrupciones de aterrizaje por viento)
+# cierres: ProgramaCierres opcional (cierres y reducciones de capacidad de la pista)
+# secuenciacion: politica de secuenciacion (ver POLITICAS_SECUENCIACION)
+# parametros: ParametrosAproximacion opcional (separaciones y bandas de velocidad)
+def simulate_planes(lambda_prob=0.2, total_minutes=1080, arribos=None, instrumentacion=None, pistas=1, politica='round_robin',
+					goaround=None, cierres=None, secuenciacion='fcfs', parametros=None):
+	sim = Simulacion(lambda_prob, total_minutes, arribos, instrumentacion, pistas, politica, goaround, cierres, secuenciacion,
+					 parametros)
+	
+	# Usar tqdm para mostrar progreso de la simulación solo si no está deshabilitado globalmente
+	use_tqdm = getattr(simulate_planes, "use_tqdm", False)
+	iterator = range(total_minutes)
+	if use_tqdm:
+		from tqdm import tqdm
+		iterator = tqdm(iterator, desc="⏱️  Simulando", unit="min", disable=(total_minutes < 100))
+	for _ in iterator:
+		sim.paso()
+	return sim.planes, total_minutes
+
+# funcion que devuelve los tiempos de aparicion, aterrizaje y desvio de los aviones como arrays de numpy
+# (NaN si el avion no aterrizo o no se desvio)
+def tiempos_planes(planes):
+	import numpy as np
+	n = len(planes)
+	nan = float('nan')
+	return {
+		'appear_time': np.fromiter((p.appear_time for p in planes), float, n),
+		'landed_time': np.fromiter((p.landed_time if p.status == 'landed' and p.landed_time is not None else nan for p in planes), float, n),
+		'montevideo_time': np.fromiter((p.montevideo_time if p.montevideo_time is not None else nan for p in planes), float, n),
+	}
+
+# funcion que descompone el atraso de cada avion contra TIEMPO_BASE_100NM (o el tiempo base de parametros, si
+# la simulacion uso otras bandas de velocidad), vectorizado sobre los aviones
+# a partir de lo que acumula el motor en cada avion (demora_holding, demora_goaround):
+# - atraso: landed_time - appear_time - TIEMPO_BASE_100NM
+# - holding: minutos perdidos en rejoin por falta de separacion (o en el arco de secuenciacion de point_merge)
+# - goaround: minutos perdidos por interrupciones de aterrizaje
+# - cierre: minutos esperando en el fijo por cierres de pista (ver ProgramaCierres)
+# - congestion: el resto, las reducciones de velocidad para mantener la separacion (incluye el redondeo
+#   del aterrizaje al minuto)
+# devuelve un dict de arrays, con NaN en los aviones que no aterrizaron
+def descomponer_atrasos(planes, parametros=None):
+	import numpy as np
+	n = len(planes)
+	t = tiempos_planes(planes)
+	aterrizo = ~np.isnan(t['landed_time'])
+	holding = np.fromiter((getattr(p, 'demora_holding', 0) for p in planes), float, n)
+	goaround = np.fromiter((getattr(p, 'demora_goaround', 0.0) for p in planes), float, n)
+	cierre = np.fromiter((getattr(p, 'demora_cierre', 0) for p in planes), float, n)
+	base = TIEMPO_BASE_100NM if parametros is None else parametros.tiempo_base_100nm
+	atraso = t['landed_time'] - t['appear_time'] - base
+	holding = np.where(aterrizo, holding, np.nan)
+	goaround = np.where(aterrizo, goaround, np.nan)
+	cierre = np.where(aterrizo, cierre, np.nan)
+	return {
+		'atraso': atraso,
+		'holding': holding,
+		'goaround': goaround,
+		'cierre': cierre,
+		'congestion': atraso - holding - goaround - cierre,
+	}
 
 # funcion que imprime un resumen estadistico de la simulacion
 def print_summary(planes):
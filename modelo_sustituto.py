@@ -0,0 +1,248 @@
+# modelo sustituto (surrogate) de la probabilidad de desvio y de congestion.
+# Cada punto de la curva desvios-vs-lambda cuesta decenas o miles de simulaciones. Este modulo ajusta
+# un proceso gaussiano (o un polinomio de grado 2) sobre resultados Monte Carlo ya calculados
+# (y cacheados en disco con cache_resultados) y predice media e incertidumbre en microsegundos.
+# Tambien sugiere el proximo punto a simular (aprendizaje activo: donde la incertidumbre es maxima).
+#
+# Escenarios y variables de entrada:
+#   'tormenta': lambda_prob, storm_start, storm_duration  (simulate_storm_closure de Ejercicio6)
+#   'ventoso':  lambda_prob, prob_interrupcion            (simulate_dia_ventoso de Ejercicio5)
+import os
+import sys
+import random
+import numpy as np
+from cache_resultados import memoizar
+
+_RAIZ = os.path.dirname(os.path.abspath(__file__))
+sys.path.append(os.path.join(_RAIZ, 'Ejercicio5'))
+sys.path.append(os.path.join(_RAIZ, 'Ejercicio6'))
+
+# variables de cada escenario con sus rangos por defecto
+ESCENARIOS = {
+    'tormenta': {
+        'lambda_prob': (0.02, 0.5),
+        'storm_start': (0, 1050),
+        'storm_duration': (0, 120),
+    },
+    'ventoso': {
+        'lambda_prob': (0.02, 0.5),
+        'prob_interrupcion': (0.0, 0.5),
+    },
+}
+
+# funcion que corre una replica del escenario en el punto dado y devuelve (prob_desvio, prob_congestion)
+def _simular_replica(escenario, punto, total_minutes):
+    from ejercicio4 import metricas_replica
+    if escenario == 'tormenta':
+        from ejercicio6 import simulate_storm_closure
+        duracion = int(round(punto['storm_duration']))
+        inicio = int(round(min(punto['storm_start'], total_minutes - duracion)))
+        res = simulate_storm_closure(punto['lambda_prob'], total_minutes, storm_start=inicio, storm_duration=duracion)
+    elif escenario == 'ventoso':
+        from dia_ventoso import simulate_dia_ventoso
+        res = simulate_dia_ventoso(punto['lambda_prob'], total_minutes, prob_interrupcion=punto['prob_interrupcion'])
+    else:
+        raise ValueError(f"Escenario desconocido: {escenario}")
+    return metricas_replica(res[0])
+
+# funcion que estima por Monte Carlo las probabilidades de desvio y congestion en un punto (cacheado en disco)
+def evaluar_punto(escenario, punto, n_mc=30, total_minutes=1080, seed=0, cache=None):
+    """
+    Devuelve un dict con media y desvío estándar de la probabilidad de desvío y de congestión en el punto.
+
+    Args:
+        escenario: 'tormenta' o 'ventoso'
+        punto: dict variable -> valor (ver ESCENARIOS)
+        n_mc: réplicas Monte Carlo
+        seed: semilla (con semilla el resultado queda en el cache y no se vuelve a simular)
+    """
+    punto = {k: float(punto[k]) for k in ESCENARIOS[escenario]}
+    params = {'punto': punto, 'n_mc': n_mc, 'total_minutes': total_minutes, 'seed': seed}
+
+    def calcular():
+        if seed is not None:
+            random.seed(seed)
+        filas = np.array([_simular_replica(escenario, punto, total_minutes) for _ in range(n_mc)], dtype=float)
+        return {
+            'prob_desvio': float(filas[:, 0].mean()), 'prob_desvio_std': float(filas[:, 0].std(ddof=1)),
+            'prob_congestion': float(filas[:, 1].mean()), 'prob_congestion_std': float(filas[:, 1].std(ddof=1)),
+            'n_mc': n_mc,
+        }
+
+    archivos = (os.path.join(_RAIZ, 'Ejercicio6', 'ejercicio6.py'), os.path.join(_RAIZ, 'Ejercicio5', 'dia_ventoso.py'),
+                os.path.join(_RAIZ, 'ejercicio4.py'))
+    return memoizar(f'modelo_sustituto.{escenario}', params, calcular, archivos=archivos, cache=cache)
+
+# clase ProcesoGaussiano: regresion con kernel RBF de escalas por variable (ARD) y ruido conocido por punto
+class ProcesoGaussiano:
+    def __init__(self, escalas=None):
+        self.escalas = escalas  # None: se eligen maximizando la verosimilitud marginal
+
+    def _kernel(self, A, B, escalas):
+        d = (A[:, None, :] - B[None, :, :]) / escalas
+        return self.varianza * np.exp(-0.5 * np.sum(d * d, axis=-1))
+
+    def _log_verosimilitud(self, escalas):
+        K = self._kernel(self.X, self.X, escalas) + np.diag(self.ruido)
+        try:
+            L = np.linalg.cholesky(K)
+        except np.linalg.LinAlgError:
+            return -np.inf
+        alpha = np.linalg.solve(L.T, np.linalg.solve(L, self.y))
+        return -0.5 * self.y @ alpha - np.sum(np.log(np.diag(L)))
+
+    # ajusta el modelo a X (n x d, ya normalizado a [0, 1]) con medias y y varianzas de ruido conocidas
+    def ajustar(self, X, y, ruido):
+        self.X = np.asarray(X, dtype=float)
+        y = np.asarray(y, dtype=float)
+        self.media_y = y.mean()
+        self.y = y - self.media_y
+        self.varianza = max(self.y.var(), 1e-6)
+        self.ruido = np.asarray(ruido, dtype=float) + 1e-8
+        d = self.X.shape[1]
+        if self.escalas is None:
+            # busqueda por coordenadas en una grilla logaritmica de escalas (d es chico)
+            grilla = np.geomspace(0.05, 5.0, 15)
+            escalas = np.full(d, 0.5)
+            mejor = self._log_verosimilitud(escalas)
+            for _ in range(3):
+                for k in range(d):
+                    for e in grilla:
+                        prueba = escalas.copy()
+                        prueba[k] = e
+                        lv = self._log_verosimilitud(prueba)
+                        if lv > mejor:
+                            mejor, escalas = lv, prueba
+            self.escalas_ = escalas
+        else:
+            self.escalas_ = np.broadcast_to(np.asarray(self.escalas, dtype=float), (d,)).copy()
+        K = self._kernel(self.X, self.X, self.escalas_) + np.diag(self.ruido)
+        self.L = np.linalg.cholesky(K)
+        self.alpha = np.linalg.solve(self.L.T, np.linalg.solve(self.L, self.y))
+        return self
+
+    # devuelve media y desvio estandar predichos en los puntos X (m x d, normalizados)
+    def predecir(self, X):
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        Ks = self._kernel(X, self.X, self.escalas_)
+        media = Ks @ self.alpha + self.media_y
+        v = np.linalg.solve(self.L, Ks.T)
+        var = np.maximum(self.varianza - np.sum(v * v, axis=0), 0.0)
+        return media, np.sqrt(var)
+
+# clase Polinomio2: regresion cuadratica por minimos cuadrados ponderados, con incertidumbre de la media ajustada
+class Polinomio2:
+    def _features(self, X):
+        X = np.atleast_2d(X)
+        n, d = X.shape
+        cols = [np.ones(n)] + [X[:, i] for i in range(d)]
+        cols += [X[:, i] * X[:, j] for i in range(d) for j in range(i, d)]
+        return np.column_stack(cols)
+
+    def ajustar(self, X, y, ruido):
+        F = self._features(np.asarray(X, dtype=float))
+        w = 1.0 / (np.asarray(ruido, dtype=float) + 1e-8)
+        A = F.T @ (F * w[:, None])
+        self.cov = np.linalg.pinv(A)
+        self.coef = self.cov @ (F.T @ (w * np.asarray(y, dtype=float)))
+        return self
+
+    def predecir(self, X):
+        F = self._features(np.asarray(X, dtype=float))
+        var = np.einsum('ij,jk,ik->i', F, self.cov, F)
+        return F @ self.coef, np.sqrt(np.maximum(var, 0.0))
+
+# clase ModeloSustituto: datos Monte Carlo + un modelo por salida (desvio y congestion) para un escenario
+class ModeloSustituto:
+    def __init__(self, escenario='tormenta', rangos=None, tipo='gp', n_mc=30, total_minutes=1080, seed=0, cache=None):
+        if escenario not in ESCENARIOS:
+            raise ValueError(f"Escenario desconocido: {escenario}")
+        if tipo not in ('gp', 'polinomio'):
+            raise ValueError(f"Tipo de modelo desconocido: {tipo}")
+        self.escenario = escenario
+        self.variables = list(ESCENARIOS[escenario])
+        self.rangos = dict(ESCENARIOS[escenario], **(rangos or {}))
+        self.tipo = tipo
+        self.n_mc = n_mc
+        self.total_minutes = total_minutes
+        self.seed = seed
+        self.cache = cache
+        self.puntos = []
+        self.resultados = []
+        self.modelos = {}
+        self._lo = np.array([self.rangos[v][0] for v in self.variables], dtype=float)
+        self._ancho = np.array([self.rangos[v][1] - self.rangos[v][0] for v in self.variables], dtype=float)
+        self._ancho[self._ancho == 0] = 1.0
+
+    def _normalizar(self, puntos):
+        X = np.array([[p[v] for v in self.variables] for p in puntos], dtype=float)
+        return (X - self._lo) / self._ancho
+
+    # simula (o recupera del cache) un punto y lo agrega a los datos de entrenamiento
+    def agregar_punto(self, punto):
+        # semilla distinta por punto para que los errores Monte Carlo sean independientes
+        seed = None if self.seed is None else self.seed + len(self.puntos)
+        res = evaluar_punto(self.escenario, punto, self.n_mc, self.total_minutes, seed=seed, cache=self.cache)
+        self.puntos.append({v: float(punto[v]) for v in self.variables})
+        self.resultados.append(res)
+        return res
+
+    # ajusta un modelo por salida con los puntos disponibles
+    def ajustar(self):
+        if len(self.puntos) < 2:
+            raise ValueError("Se necesitan al menos 2 puntos para ajustar el modelo sustituto")
+        X = self._normalizar(self.puntos)
+        for salida in ('prob_desvio', 'prob_congestion'):
+            y = [r[salida] for r in self.resultados]
+            # varianza del estimador Monte Carlo de la media en cada punto
+            ruido = [r[f'{salida}_std'] ** 2 / r['n_mc'] for r in self.resultados]
+            modelo = ProcesoGaussiano() if self.tipo == 'gp' else Polinomio2()
+            self.modelos[salida] = modelo.ajustar(X, y, ruido)
+        return self
+
+    # predice media y desvio estandar de una salida en uno o varios puntos (dicts variable -> valor)
+    def predecir(self, puntos, salida='prob_desvio'):
+        if isinstance(puntos, dict):
+            puntos = [puntos]
+        media, std = self.modelos[salida].predecir(self._normalizar(puntos))
+        return np.clip(media, 0.0, 1.0), std
+
+    # sortea puntos uniformes en los rangos del escenario
+    def muestrear(self, n, rng):
+        U = rng.random((n, len(self.variables)))
+        X = self._lo + U * self._ancho
+        return [dict(zip(self.variables, fila)) for fila in X]
+
+    # elige, entre n_candidatos al azar, el punto donde la prediccion es mas incierta
+    def siguiente_punto(self, n_candidatos=2000, salida='prob_desvio', rng=None):
+        rng = rng if rng is not None else np.random.default_rng()
+        candidatos = self.muestrear(n_candidatos, rng)
+        _, std = self.predecir(candidatos, salida)
+        return candidatos[int(np.argmax(std))]
+
+    # entrena con n_iniciales puntos al azar y luego n_activos puntos elegidos por aprendizaje activo
+    def entrenar(self, n_iniciales=10, n_activos=10, salida='prob_desvio', seed=None):
+        rng = np.random.default_rng(seed)
+        for punto in self.muestrear(n_iniciales, rng):
+            self.agregar_punto(punto)
+        self.ajustar()
+        for _ in range(n_activos):
+            self.agregar_punto(self.siguiente_punto(salida=salida, rng=rng))
+            self.ajustar()
+        return self
+
+# funcion principal: entrena un modelo sustituto de ejemplo y muestra predicciones
+def main():
+    import time
+    modelo = ModeloSustituto('ventoso', n_mc=20, seed=0)
+    modelo.entrenar(n_iniciales=8, n_activos=8, seed=0)
+    print(f"Modelo sustituto ({modelo.escenario}) entrenado con {len(modelo.puntos)} puntos")
+    for lam in [0.05, 0.1, 0.2, 0.3]:
+        for p_int in [0.0, 0.1, 0.3]:
+            t0 = time.perf_counter()
+            media, std = modelo.predecir({'lambda_prob': lam, 'prob_interrupcion': p_int})
+            dt = (time.perf_counter() - t0) * 1e6
+            print(f"  λ={lam:.2f} p_int={p_int:.1f}: desvíos = {media[0]*100:.1f}% ± {std[0]*100:.1f}% ({dt:.0f} µs)")
+
+if __name__ == "__main__":
+    main()
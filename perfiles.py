@@ -0,0 +1,143 @@
+# perfiles de llegada no homogeneos: lambda(t) constante a tramos a lo largo del dia (06:00 a 24:00),
+# por ejemplo con picos a la mañana y a la tarde, en lugar de una lambda_prob fija.
+#
+# Un perfil se carga de un archivo CSV (columnas hora,lambda) o JSON ({"tramos": [["06:00", 0.1], ...]}):
+# cada fila indica desde que hora rige esa lambda (hasta la fila siguiente). La hora puede ser "HH:MM"
+# (reloj, 06:00 es el minuto 0 como en main.minutos_a_hora) o un minuto de simulacion.
+#
+# El sorteo del dia completo es vectorizado: para cada minuto t hay arribo si u_t < lambda(t)
+# (thinning de un stream a tasa maxima, la misma ley que random.random() < lambda_prob minuto a minuto;
+# para lambda(t) > 1 se usan varios lugares por minuto como en barrido_lambda.py) y devuelve la lista
+# de (minuto, speed_u) que aceptan los simuladores con arribos=...
+# Un perfil se puede escalar: con escala s la intensidad es s * lambda(t); asi las herramientas que
+# reciben una lambda (Monte Carlo, find_capacity, simular.py) la usan como factor de escala del perfil.
+import csv
+import json
+import os
+import random
+
+# funcion que convierte una hora de reloj "HH:MM" (o un minuto) a minutos de simulacion
+def hora_a_minutos(hora):
+    if isinstance(hora, (int, float)):
+        return int(hora)
+    hora = hora.strip()
+    if ':' not in hora:
+        return int(hora)
+    hh, mm = hora.split(':')
+    return (int(hh) - 6) * 60 + int(mm)
+
+# clase PerfilLlegadas: lambda(t) constante a tramos
+# - tramos: lista de (minuto_inicio, lambda) ordenada; el primer tramo empieza en el minuto 0
+class PerfilLlegadas:
+    def __init__(self, tramos, nombre=None):
+        tramos = sorted((hora_a_minutos(t), float(lam)) for t, lam in tramos)
+        if not tramos:
+            raise ValueError("El perfil necesita al menos un tramo")
+        if tramos[0][0] > 0:
+            raise ValueError(f"El primer tramo del perfil debe empezar a las 06:00 (minuto 0), no en el minuto {tramos[0][0]}")
+        if any(lam < 0 for _, lam in tramos):
+            raise ValueError("Las lambdas del perfil no pueden ser negativas")
+        self.tramos = tramos
+        self.nombre = nombre
+
+    def __repr__(self):
+        return f"PerfilLlegadas({self.tramos!r}, nombre={self.nombre!r})"
+
+    # lambda vigente en el minuto t
+    def lambda_en(self, t):
+        lam = self.tramos[0][1]
+        for inicio, valor in self.tramos:
+            if inicio > t:
+                break
+            lam = valor
+        return lam
+
+    # vector con la lambda de cada minuto de 0 a total_minutes - 1
+    def vector(self, total_minutes):
+        import numpy as np
+        v = np.empty(total_minutes)
+        for k, (inicio, lam) in enumerate(self.tramos):
+            fin = self.tramos[k + 1][0] if k + 1 < len(self.tramos) else total_minutes
+            v[min(inicio, total_minutes):min(fin, total_minutes)] = lam
+        return v
+
+    # cantidad esperada de arribos por minuto en promedio sobre el dia
+    def media(self, total_minutes=1080):
+        return float(self.vector(total_minutes).mean())
+
+    # perfil con la intensidad multiplicada por escala
+    def escalar(self, escala):
+        return PerfilLlegadas([(t, lam * escala) for t, lam in self.tramos], self.nombre)
+
+    # diccionario serializable (para el cache y los checkpoints)
+    def como_dict(self):
+        return {'nombre': self.nombre, 'tramos': [list(t) for t in self.tramos]}
+
+    # sortea los arribos de un dia: lista de (minuto, speed_u)
+    def sortear(self, total_minutes=1080, escala=1.0, rng=None):
+        """
+        Args:
+            escala: factor que multiplica la intensidad del perfil
+            rng: np.random.Generator (None: se crea uno a partir del estado de random,
+                 asi random.seed(...) alcanza para reproducir los arribos)
+        """
+        import numpy as np
+        if rng is None:
+            rng = np.random.default_rng(random.getrandbits(64))
+        intensidad = escala * self.vector(total_minutes)
+        lugares = max(1, int(np.ceil(intensidad.max()))) if total_minutes > 0 else 1
+        marcas = rng.random((total_minutes, lugares)) + np.arange(lugares)
+        minutos, _ = np.nonzero(marcas < intensidad[:, None])
+        return list(zip(minutos.tolist(), rng.random(len(minutos)).tolist()))
+
+# funcion que carga un perfil de un archivo CSV (hora,lambda) o JSON
+def cargar_perfil(path):
+    nombre = os.path.splitext(os.path.basename(path))[0]
+    if path.lower().endswith('.json'):
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if isinstance(data, dict):
+            return PerfilLlegadas(data['tramos'], data.get('nombre', nombre))
+        return PerfilLlegadas(data, nombre)
+    tramos = []
+    with open(path, 'r', encoding='utf-8', newline='') as f:
+        for fila in csv.reader(f):
+            if not fila or fila[0].strip().startswith('#'):
+                continue
+            try:
+                lam = float(fila[1])
+            except ValueError:
+                continue  # encabezado
+            tramos.append((fila[0], lam))
+    return PerfilLlegadas(tramos, nombre)
+
+# funcion que adapta un simulador (lambda_prob, total_minutes, arribos=None) para que sortee sus arribos
+# del perfil; el lambda_prob que recibe se usa como escala del perfil
+def con_perfil(sim_func, perfil):
+    def sim(escala, total_minutes, arribos=None):
+        if arribos is None:
+            arribos = perfil.sortear(total_minutes, escala)
+        return sim_func(escala, total_minutes, arribos=arribos)
+    sim.__name__ = f"{getattr(sim_func, '__name__', 'sim')}[{perfil.nombre or 'perfil'}]"
+    return sim
+
+# funcion principal: compara un dia con picos contra un dia con la misma lambda media
+def main():
+    from main import simulate_planes, minutos_a_hora
+    perfil = cargar_perfil(os.path.join(os.path.dirname(os.path.abspath(__file__)), 'perfil_dia_tipico.csv'))
+    media = perfil.media(1080)
+    print(f"Perfil {perfil.nombre}: λ media = {media:.4f} aviones/min")
+    for inicio, lam in perfil.tramos:
+        print(f"  desde {minutos_a_hora(inicio)}: λ = {lam:.3f}")
+    random.seed(42)
+    n_mc = 50
+    desvios_perfil, desvios_plano = [], []
+    for _ in range(n_mc):
+        planes, _ = simulate_planes(1.0, 1080, arribos=perfil.sortear(1080))
+        desvios_perfil.append(len([p for p in planes if p.status == 'montevideo']) / max(len(planes), 1))
+        planes, _ = simulate_planes(media, 1080)
+        desvios_plano.append(len([p for p in planes if p.status == 'montevideo']) / max(len(planes), 1))
+    print(f"Desvíos con perfil: {100*sum(desvios_perfil)/n_mc:.1f}% | con λ constante = {media:.4f}: {100*sum(desvios_plano)/n_mc:.1f}%")
+
+if __name__ == "__main__":
+    main()
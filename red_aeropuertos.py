@@ -0,0 +1,210 @@
+# simulacion de una red de aeropuertos: cada aeropuerto corre su propia main.Simulacion y los aviones
+# que se desvian llegan como arribos a su aeropuerto alternativo despues de una demora de traslado,
+# asi se modela la capacidad de Montevideo (y de los alternativos de Montevideo) en vez de solo contar
+# desvios.
+#
+# Sincronizacion: un desvio en el minuto t llega al alternativo en t + demora >= t + ventana, donde
+# ventana es la menor demora de la red. Entonces todos los aeropuertos pueden avanzar una ventana
+# completa sin esperar a los demas y recien en la barrera (fin de la ventana) se intercambian los
+# desvios. Los aeropuertos se reparten entre procesos (workers) que se comunican con el coordinador
+# por pipes; cada aeropuerto tiene su propio estado de random, asi los resultados con semilla no
+# dependen de cuantos procesos se usen.
+import multiprocessing
+import os
+import random
+from main import Simulacion
+
+# clase Aeropuerto con la configuracion de un nodo de la red:
+# - nombre: identificador del aeropuerto
+# - lambda_prob: arribos propios por minuto
+# - alterno: nombre del aeropuerto al que se desvian sus aviones (None: salen de la red)
+# - demora: minutos de traslado hasta el alterno
+# - pistas, politica: ver main.Simulacion
+class Aeropuerto:
+    def __init__(self, nombre, lambda_prob=0.2, alterno=None, demora=30, pistas=1, politica='round_robin'):
+        if alterno is not None and demora < 1:
+            raise ValueError(f"La demora de {nombre} a {alterno} debe ser de al menos 1 minuto")
+        self.nombre = nombre
+        self.lambda_prob = lambda_prob
+        self.alterno = alterno
+        self.demora = demora
+        self.pistas = pistas
+        self.politica = politica
+
+# estado de un aeropuerto dentro de un worker
+class _Nodo:
+    def __init__(self, config, total_minutes, estado_rng):
+        self.config = config
+        self.sim = Simulacion(config.lambda_prob, total_minutes, pistas=config.pistas, politica=config.politica)
+        self.estado_rng = estado_rng
+        self.n_desviados = 0
+
+    # avanza hasta el minuto hasta y devuelve los desvios nuevos como mensajes (destino, minuto, datos)
+    def avanzar(self, hasta, max_saltos):
+        random.setstate(self.estado_rng)
+        self.sim.correr(hasta)
+        self.estado_rng = random.getstate()
+        c = self.config
+        salida = []
+        for plane in self.sim.desviados[self.n_desviados:]:
+            saltos = getattr(plane, 'saltos', 0) + 1
+            destino = c.alterno if saltos <= max_saltos else None
+            datos = {'origen': getattr(plane, 'origen', c.nombre), 'saltos': saltos}
+            salida.append((destino, plane.montevideo_time + c.demora, datos))
+        self.n_desviados = len(self.sim.desviados)
+        return salida
+
+    def resumen(self):
+        planes = self.sim.planes
+        recibidos = [p for p in planes if getattr(p, 'saltos', 0) > 0]
+        return {
+            'aviones': len(planes),
+            'propios': len(planes) - len(recibidos),
+            'recibidos': len(recibidos),
+            'aterrizados': len([p for p in planes if p.status == 'landed']),
+            'recibidos_aterrizados': len([p for p in recibidos if p.status == 'landed']),
+            'desviados': len(self.sim.desviados),
+        }
+
+# funcion que atiende un grupo de aeropuertos: avanza ventana por ventana segun los mensajes del coordinador
+def _worker(conexion, configs, estados_rng, total_minutes, max_saltos):
+    nodos = {c.nombre: _Nodo(c, total_minutes, e) for c, e in zip(configs, estados_rng)}
+    while True:
+        msg = conexion.recv()
+        if msg is None:
+            conexion.send({nombre: nodo.resumen() for nombre, nodo in nodos.items()})
+            break
+        hasta, entrantes = msg
+        for nombre, minuto, datos in entrantes:
+            nodos[nombre].sim.programar_arribo(minuto, **datos)
+        salida = []
+        for nombre, nodo in nodos.items():
+            salida.extend((nombre, destino, minuto, datos) for destino, minuto, datos in nodo.avanzar(hasta, max_saltos))
+        conexion.send(salida)
+
+# grupo de aeropuertos atendido en el mismo proceso del coordinador (procesos=0)
+class _Local:
+    def __init__(self, configs, estados_rng, total_minutes, max_saltos):
+        self.nodos = {c.nombre: _Nodo(c, total_minutes, e) for c, e in zip(configs, estados_rng)}
+        self.max_saltos = max_saltos
+        self.respuesta = None
+
+    def send(self, msg):
+        if msg is None:
+            self.respuesta = {nombre: nodo.resumen() for nombre, nodo in self.nodos.items()}
+            return
+        hasta, entrantes = msg
+        for nombre, minuto, datos in entrantes:
+            self.nodos[nombre].sim.programar_arribo(minuto, **datos)
+        self.respuesta = []
+        for nombre, nodo in self.nodos.items():
+            self.respuesta.extend((nombre, destino, minuto, datos) for destino, minuto, datos in nodo.avanzar(hasta, self.max_saltos))
+
+    def recv(self):
+        return self.respuesta
+
+# funcion que simula la red de aeropuertos
+def simular_red(aeropuertos, total_minutes=1080, seed=None, procesos=None, max_saltos=3):
+    """
+    Simula todos los aeropuertos en paralelo intercambiando los desvíos en barreras de tiempo.
+
+    Args:
+        aeropuertos: lista de Aeropuerto (los alternos tienen que estar en la lista o ser None)
+        seed: semilla (None para no fijarla)
+        procesos: cantidad de procesos (None: uno por núcleo, 0: todo en el proceso actual)
+        max_saltos: desvíos encadenados máximos de un avión antes de salir de la red
+
+    Returns:
+        dict con 'aeropuertos' (resumen por aeropuerto), 'flujos' ({(origen, destino): desvíos}),
+        'fuera_de_red' (desvíos sin alterno o que superaron max_saltos) y 'sin_llegar'
+        (desvíos que llegarían después de total_minutes)
+    """
+    nombres = [a.nombre for a in aeropuertos]
+    if len(set(nombres)) != len(nombres):
+        raise ValueError("Los nombres de los aeropuertos deben ser únicos")
+    for a in aeropuertos:
+        if a.alterno is not None and a.alterno not in nombres:
+            raise ValueError(f"El alterno {a.alterno} de {a.nombre} no está en la red")
+    demoras = [a.demora for a in aeropuertos if a.alterno is not None]
+    ventana = min(demoras) if demoras else total_minutes
+
+    # un estado de random independiente por aeropuerto
+    maestro = random.Random(seed)
+    estados = []
+    for _ in aeropuertos:
+        rng = random.Random(maestro.getrandbits(64))
+        estados.append(rng.getstate())
+
+    if procesos is None:
+        procesos = os.cpu_count() or 1
+    procesos = min(procesos, len(aeropuertos))
+    grupos = [list(range(k, len(aeropuertos), max(procesos, 1))) for k in range(max(procesos, 1))]
+    donde = {aeropuertos[i].nombre: g for g, idx in enumerate(grupos) for i in idx}
+
+    workers = []
+    conexiones = []
+    if procesos == 0:
+        conexiones = [_Local(aeropuertos, estados, total_minutes, max_saltos)]
+        donde = {n: 0 for n in nombres}
+    else:
+        for idx in grupos:
+            padre, hijo = multiprocessing.Pipe()
+            p = multiprocessing.Process(target=_worker, args=(hijo, [aeropuertos[i] for i in idx],
+                                                              [estados[i] for i in idx], total_minutes, max_saltos))
+            p.start()
+            workers.append(p)
+            conexiones.append(padre)
+
+    flujos = {}
+    fuera_de_red = 0
+    sin_llegar = 0
+    entrantes = [[] for _ in conexiones]
+    try:
+        t = 0
+        while t < total_minutes:
+            t = min(t + ventana, total_minutes)
+            for con, ent in zip(conexiones, entrantes):
+                con.send((t, ent))
+            entrantes = [[] for _ in conexiones]
+            # barrera: se espera a que todos los grupos terminen la ventana
+            for con in conexiones:
+                for origen, destino, minuto, datos in con.recv():
+                    if destino is None:
+                        fuera_de_red += 1
+                        continue
+                    flujos[(origen, destino)] = flujos.get((origen, destino), 0) + 1
+                    if minuto >= total_minutes:
+                        sin_llegar += 1
+                        continue
+                    entrantes[donde[destino]].append((destino, minuto, datos))
+        resumenes = {}
+        for con in conexiones:
+            con.send(None)
+            resumenes.update(con.recv())
+    finally:
+        for p in workers:
+            p.join()
+    return {
+        'aeropuertos': {n: resumenes[n] for n in nombres},
+        'flujos': flujos,
+        'fuera_de_red': fuera_de_red,
+        'sin_llegar': sin_llegar,
+    }
+
+# funcion principal: AEP desvía a Montevideo y Montevideo a Porto Alegre
+def main():
+    red = [
+        Aeropuerto('AEP', lambda_prob=0.2, alterno='MVD', demora=25),
+        Aeropuerto('MVD', lambda_prob=0.05, alterno='POA', demora=60),
+        Aeropuerto('POA', lambda_prob=0.08),
+    ]
+    res = simular_red(red, total_minutes=1080, seed=42)
+    print(f"{'aeropuerto':<12}{'aviones':>9}{'propios':>9}{'recibidos':>11}{'aterrizados':>13}{'desviados':>11}")
+    for nombre, r in res['aeropuertos'].items():
+        print(f"{nombre:<12}{r['aviones']:>9}{r['propios']:>9}{r['recibidos']:>11}{r['aterrizados']:>13}{r['desviados']:>11}")
+    for (origen, destino), n in res['flujos'].items():
+        print(f"Desvíos {origen} -> {destino}: {n}")
+    print(f"Fuera de la red: {res['fuera_de_red']}, sin llegar antes del cierre: {res['sin_llegar']}")
+
+if __name__ == "__main__":
+    main()
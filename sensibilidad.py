@@ -0,0 +1,209 @@
+# analisis de sensibilidad global de las constantes de aproximacion (main.ParametrosAproximacion): separaciones,
+# gap de reingreso, reduccion de velocidad, velocidad de rejoin y bandas de velocidad.
+# - morris: efectos elementales sobre trayectorias que cambian un factor por vez; mu* (media del efecto en valor
+#   absoluto) ordena los factores por importancia y sigma indica no linealidad o interacciones
+# - sobol: indices de primer orden y totales (estimadores de Saltelli y Jansen) sobre las matrices A, B y AB_i
+# Cada combinacion de factores es una fila de una unica tanda: las filas se reparten en bloques entre procesos y
+# todas se simulan con los mismos arribos (mismas semillas por replica, como en evaluar_politicas.py), asi la
+# diferencia entre filas es efecto de los parametros y no del sorteo de arribos.
+# Los factores se muestrean en [0, 1] y se llevan a su rango con FACTORES.
+#
+# Ejemplo:
+#   python sensibilidad.py --metodo morris --n 20 --replicas 4 --workers 4 --seed 42
+#   python sensibilidad.py --metodo sobol --n 128 --replicas 2 --workers 4 --seed 42
+import argparse
+import os
+import numpy as np
+from main import ParametrosAproximacion, simulate_planes, descomponer_atrasos
+from barrido_lambda import generar_superstream, adelgazar
+from cache_resultados import memoizar
+
+# rango de cada factor; escala_velocidad y ancho_banda escalan las bandas de APPROACH_RANGES
+# (ver ParametrosAproximacion.con_bandas)
+FACTORES = {
+    'min_separacion': (2.0, 6.0),
+    'buffer': (3.0, 8.0),
+    'gap_reingreso': (5.0, 15.0),
+    'reduccion_velocidad': (10.0, 40.0),
+    'velocidad_rejoin': (150.0, 250.0),
+    'escala_velocidad': (0.85, 1.15),
+    'ancho_banda': (0.5, 1.5),
+}
+SALIDAS = ('pct_desvios', 'atraso_medio')
+
+# funcion que arma los parametros de una fila (valores en las unidades de cada factor)
+def parametros_de_fila(valores):
+    valores = dict(valores)
+    escala = valores.pop('escala_velocidad', 1.0)
+    ancho = valores.pop('ancho_banda', 1.0)
+    return ParametrosAproximacion(**valores).con_bandas(escala, ancho)
+
+# funcion que lleva filas en [0, 1] al rango de cada factor
+def escalar(X, factores):
+    bajo = np.array([FACTORES[f][0] for f in factores])
+    alto = np.array([FACTORES[f][1] for f in factores])
+    return bajo + X * (alto - bajo)
+
+# funcion que simula un bloque de filas (se ejecuta en un proceso del pool); todas las filas usan los arribos
+# de las mismas semillas
+def _evaluar_bloque(tarea):
+    filas, factores, lambda_prob, total_minutes, semillas = tarea
+    arribos = [adelgazar(generar_superstream(lambda_prob, total_minutes, np.random.default_rng(s)), lambda_prob)
+               for s in semillas]
+    Y = np.zeros((len(filas), len(SALIDAS)))
+    for i, fila in enumerate(filas):
+        parametros = parametros_de_fila(zip(factores, fila))
+        for arr in arribos:
+            planes, _ = simulate_planes(lambda_prob, total_minutes, arribos=arr, parametros=parametros)
+            aterrizados = sum(1 for p in planes if p.status == 'landed')
+            desviados = sum(1 for p in planes if p.status == 'montevideo')
+            atraso = descomponer_atrasos(planes, parametros)['atraso']
+            Y[i, 0] += 100 * desviados / max(aterrizados + desviados, 1)
+            Y[i, 1] += float(np.nanmean(atraso)) if aterrizados else 0.0
+    return Y / len(arribos)
+
+# funcion que evalua filas de parametros (en las unidades de cada factor) en paralelo
+def evaluar_filas(filas, factores, lambda_prob=0.2, total_minutes=1080, replicas=4, workers=None, seed=None):
+    """
+    Returns:
+        array (filas x SALIDAS) con el promedio sobre las réplicas de cada salida
+    """
+    semillas = [int(s.generate_state(1)[0]) for s in np.random.SeedSequence(seed).spawn(replicas)]
+    workers = max(1, min(workers or os.cpu_count() or 1, len(filas)))
+    # varios bloques por proceso para repartir bien la carga (las filas no cuestan todas lo mismo)
+    bloques = np.array_split(np.asarray(filas, dtype=float), min(len(filas), 4 * workers))
+    tareas = [(b.tolist(), list(factores), lambda_prob, total_minutes, semillas) for b in bloques]
+    if workers == 1:
+        partes = [_evaluar_bloque(t) for t in tareas]
+    else:
+        from concurrent.futures import ProcessPoolExecutor
+        with ProcessPoolExecutor(max_workers=workers) as ejecutor:
+            partes = list(ejecutor.map(_evaluar_bloque, tareas))
+    return np.concatenate(partes)
+
+# funcion que genera las trayectorias de Morris en [0, 1]: r trayectorias de k + 1 filas sobre una grilla de niveles
+def muestras_morris(k, r, niveles=4, rng=None):
+    rng = np.random.default_rng(rng)
+    delta = niveles / (2 * (niveles - 1))
+    grilla = np.arange(niveles) / (niveles - 1)
+    X = np.zeros((r * (k + 1), k))
+    for j in range(r):
+        x = rng.choice(grilla, k)
+        X[j * (k + 1)] = x
+        for paso, i in enumerate(rng.permutation(k), start=1):
+            x[i] += delta if x[i] + delta <= 1 + 1e-12 else -delta
+            X[j * (k + 1) + paso] = x
+    return X
+
+# funcion que calcula mu* y sigma de los efectos elementales de cada factor
+def efectos_morris(X, Y, k):
+    efectos = [[] for _ in range(k)]
+    for j in range(len(X) // (k + 1)):
+        filas = slice(j * (k + 1), (j + 1) * (k + 1))
+        dx, dy = np.diff(X[filas], axis=0), np.diff(Y[filas], axis=0)
+        for paso in range(k):
+            i = int(np.flatnonzero(dx[paso])[0])
+            efectos[i].append(dy[paso] / dx[paso, i])
+    efectos = np.array(efectos)  # factores x trayectorias x salidas
+    return np.abs(efectos).mean(axis=1), efectos.std(axis=1, ddof=1 if efectos.shape[1] > 1 else 0)
+
+# funcion que genera las filas de Sobol en [0, 1]: A, B y las k matrices AB_i (A con la columna i de B)
+def muestras_sobol(k, n, rng=None):
+    rng = np.random.default_rng(rng)
+    A, B = rng.random((n, k)), rng.random((n, k))
+    AB = []
+    for i in range(k):
+        ABi = A.copy()
+        ABi[:, i] = B[:, i]
+        AB.append(ABi)
+    return np.concatenate([A, B] + AB)
+
+# funcion que calcula los indices de Sobol de primer orden y totales, con intervalos bootstrap del 95%
+def indices_sobol(Y, k, n, bootstrap=200, rng=None):
+    rng = np.random.default_rng(rng)
+    fA, fB = Y[:n], Y[n:2 * n]
+    fAB = Y[2 * n:].reshape(k, n, -1)
+
+    def estimar(idx):
+        var = np.var(np.concatenate([fA[idx], fB[idx]]), axis=0)
+        var = np.where(var > 0, var, np.nan)
+        s1 = np.array([np.mean(fB[idx] * (fAB[i][idx] - fA[idx]), axis=0) for i in range(k)]) / var
+        st = np.array([0.5 * np.mean((fA[idx] - fAB[i][idx]) ** 2, axis=0) for i in range(k)]) / var
+        return s1, st
+
+    s1, st = estimar(np.arange(n))
+    muestras = [estimar(rng.integers(0, n, n)) for _ in range(bootstrap)]
+    s1_ic = 1.96 * np.std([m[0] for m in muestras], axis=0)
+    st_ic = 1.96 * np.std([m[1] for m in muestras], axis=0)
+    return s1, st, s1_ic, st_ic
+
+# funcion que corre el analisis de sensibilidad
+def sensibilidad(metodo='morris', n=20, lambda_prob=0.2, total_minutes=1080, replicas=4, workers=None, seed=None,
+                 factores=None, cache=None):
+    """
+    Args:
+        metodo: 'morris' (n trayectorias) o 'sobol' (n filas base; se simulan n * (k + 2) filas)
+        replicas: días simulados por fila (los mismos arribos en todas las filas)
+        factores: nombres de FACTORES a variar (por defecto todos); el resto queda en su valor por defecto
+        seed: semilla (con semilla el resultado se guarda en el cache)
+
+    Returns:
+        dict con 'factores', 'salidas', 'filas' (cantidad simulada) y, según el método, 'mu_star' y 'sigma' o
+        'S1', 'ST', 'S1_ic' y 'ST_ic' (arrays factores x salidas)
+    """
+    if metodo not in ('morris', 'sobol'):
+        raise ValueError(f"Método desconocido: {metodo} (usar 'morris' o 'sobol')")
+    factores = list(FACTORES) if factores is None else list(factores)
+    desconocidos = set(factores) - set(FACTORES)
+    if desconocidos:
+        raise ValueError(f"Factores desconocidos: {', '.join(sorted(desconocidos))}")
+    params = {'metodo': metodo, 'n': n, 'lambda_prob': lambda_prob, 'total_minutes': total_minutes,
+              'replicas': replicas, 'seed': seed, 'factores': {f: FACTORES[f] for f in factores}}
+    calcular = lambda: _sensibilidad(metodo, n, lambda_prob, total_minutes, replicas, workers, seed, factores)
+    return memoizar('sensibilidad', params, calcular, archivos=(__file__,), cache=cache)
+
+def _sensibilidad(metodo, n, lambda_prob, total_minutes, replicas, workers, seed, factores):
+    k = len(factores)
+    semilla_muestras, semilla_sim = np.random.SeedSequence(seed).spawn(2)
+    rng = np.random.default_rng(semilla_muestras)
+    X = muestras_morris(k, n, rng=rng) if metodo == 'morris' else muestras_sobol(k, n, rng=rng)
+    Y = evaluar_filas(escalar(X, factores), factores, lambda_prob, total_minutes, replicas, workers,
+                      int(semilla_sim.generate_state(1)[0]))
+    res = {'metodo': metodo, 'factores': factores, 'salidas': list(SALIDAS), 'filas': len(X)}
+    if metodo == 'morris':
+        res['mu_star'], res['sigma'] = efectos_morris(X, Y, k)
+    else:
+        res['S1'], res['ST'], res['S1_ic'], res['ST_ic'] = indices_sobol(Y, k, n, rng=rng)
+    return res
+
+# funcion principal: tabla de factores ordenados por importancia para cada salida
+def main(argv=None):
+    import time
+    parser = argparse.ArgumentParser(description='Sensibilidad global de las constantes de aproximación')
+    parser.add_argument('--metodo', choices=('morris', 'sobol'), default='morris')
+    parser.add_argument('--n', type=int, default=20, help='trayectorias (morris) o filas base (sobol)')
+    parser.add_argument('--factores', nargs='+', choices=list(FACTORES), default=None)
+    parser.add_argument('--lambda', dest='lambda_prob', type=float, default=0.2)
+    parser.add_argument('--horizonte', type=int, default=1080)
+    parser.add_argument('--replicas', type=int, default=4)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--seed', type=int, default=42)
+    parser.add_argument('--sin-cache', action='store_true', help='no leer ni escribir el cache')
+    args = parser.parse_args(argv)
+    t0 = time.perf_counter()
+    res = sensibilidad(args.metodo, args.n, args.lambda_prob, args.horizonte, args.replicas, args.workers, args.seed,
+                       args.factores, cache=False if args.sin_cache else None)
+    print(f"{args.metodo}: {res['filas']} combinaciones x {args.replicas} réplicas, λ={args.lambda_prob}, "
+          f"{time.perf_counter() - t0:.1f} s")
+    for s, salida in enumerate(res['salidas']):
+        print(f"\n{salida}:")
+        if res['metodo'] == 'morris':
+            for i in np.argsort(-res['mu_star'][:, s]):
+                print(f"  {res['factores'][i]:<22} mu* {res['mu_star'][i, s]:8.2f}   sigma {res['sigma'][i, s]:8.2f}")
+        else:
+            for i in np.argsort(-res['ST'][:, s]):
+                print(f"  {res['factores'][i]:<22} S1 {res['S1'][i, s]:6.2f} ± {res['S1_ic'][i, s]:.2f}   "
+                      f"ST {res['ST'][i, s]:6.2f} ± {res['ST_ic'][i, s]:.2f}")
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,210 @@
+# servicio HTTP local para correr escenarios what-if sin editar ni correr scripts a mano.
+# POST /simular con un JSON como
+#   {"escenario": "tormenta", "lambda": 0.2, "horizonte": 1080, "replicas": 500, "seed": 42,
+#    "storm_start": 300, "storm_duration": 30}
+#   {"escenario": "ventoso", "lambda": [0.1, 0.2, 0.3], "prob_interrupcion": 0.1, "replicas": 200, "seed": 1}
+# devuelve {"meta": ..., "resultados": [...], "origen": ..., "segundos": ...} con las filas de simular.correr.
+# GET /salud devuelve el estado del servicio.
+#
+# - pool caliente: un ProcessPoolExecutor creado al arrancar (y con los modulos ya importados en cada
+#   proceso) que usan todos los pedidos, en vez de crear procesos por pedido. simular.correr siembra cada
+#   replica por separado, asi un pedido con semilla da lo mismo con cualquier cantidad de workers;
+# - cache: con semilla el resultado pasa por el cache en disco de cache_resultados.py (como simular.py) y
+#   ademas queda en memoria, asi una consulta repetida del tablero se responde sin tocar el disco;
+# - pedidos iguales en curso se unifican: el segundo espera el resultado del primero en lugar de simular de nuevo.
+#
+# Ejemplo:
+#   python servicio.py --puerto 8080 --workers 4
+#   curl -s -X POST localhost:8080/simular -d '{"lambda": 0.2, "replicas": 200, "seed": 42}'
+import argparse
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from concurrent.futures import Future, ProcessPoolExecutor
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+import simular
+
+MAX_REPLICAS = 20_000
+MAX_HORIZONTE = 1440
+
+# funcion que importa los simuladores en un proceso del pool (para que el primer pedido no pague los imports)
+def _calentar(_):
+    import ejercicio4, barrido_lambda  # noqa: F401
+    simular.simulador('ventoso')
+    simular.simulador('tormenta', storm_start=0)
+    return os.getpid()
+
+# funcion que valida un pedido y lo convierte en los argumentos de simular.correr
+def parametros_pedido(pedido):
+    if not isinstance(pedido, dict):
+        raise ValueError("El pedido debe ser un objeto JSON")
+    conocidos = {'escenario', 'lambda', 'horizonte', 'replicas', 'seed', 'motor', 'storm_start', 'storm_duration',
+                 'prob_interrupcion', 'pistas', 'politica'}
+    desconocidos = set(pedido) - conocidos
+    if desconocidos:
+        raise ValueError(f"Campos desconocidos: {', '.join(sorted(desconocidos))}")
+    escenario = pedido.get('escenario', 'normal')
+    if escenario not in simular.ESCENARIOS:
+        raise ValueError(f"Escenario desconocido: {escenario}")
+    lambdas = pedido.get('lambda', 0.2)
+    lambdas = [float(l) for l in (lambdas if isinstance(lambdas, list) else [lambdas])]
+    if not lambdas or any(l < 0 for l in lambdas):
+        raise ValueError("lambda debe ser un número (o lista de números) no negativo")
+    horizonte = int(pedido.get('horizonte', 1080))
+    replicas = int(pedido.get('replicas', 100))
+    if not 0 < horizonte <= MAX_HORIZONTE:
+        raise ValueError(f"horizonte debe estar entre 1 y {MAX_HORIZONTE} minutos")
+    if not 0 < replicas <= MAX_REPLICAS:
+        raise ValueError(f"replicas debe estar entre 1 y {MAX_REPLICAS}")
+    seed = pedido.get('seed')
+    kwargs = {
+        'escenario': escenario,
+        'lambdas': lambdas,
+        'total_minutes': horizonte,
+        'n_mc': replicas,
+        'seed': int(seed) if seed is not None else None,
+        'motor': pedido.get('motor', 'auto'),
+    }
+    if escenario == 'tormenta':
+        kwargs['storm_start'] = int(pedido['storm_start']) if pedido.get('storm_start') is not None else None
+        kwargs['storm_duration'] = int(pedido.get('storm_duration', 30))
+    elif escenario == 'ventoso':
+        kwargs['prob_interrupcion'] = float(pedido.get('prob_interrupcion', 0.1))
+    else:
+        kwargs['pistas'] = int(pedido.get('pistas', 1))
+        kwargs['politica'] = pedido.get('politica', 'round_robin')
+    return kwargs
+
+# clase ServicioWhatIf: pool caliente, resultados en memoria y unificacion de pedidos iguales en curso
+class ServicioWhatIf:
+    def __init__(self, workers=None, cache=None, max_memoria=256):
+        self.workers = workers or os.cpu_count() or 1
+        self.pool = ProcessPoolExecutor(max_workers=self.workers)
+        self.cache = cache
+        self.memoria = OrderedDict()
+        self.max_memoria = max_memoria
+        self.en_curso = {}
+        self.lock = threading.Lock()
+        self.pedidos = 0
+        self.calculados = 0
+        self.inicio = time.time()
+
+    # arranca los procesos del pool y les hace importar los simuladores
+    def calentar(self):
+        list(self.pool.map(_calentar, range(self.workers)))
+
+    def cerrar(self):
+        self.pool.shutdown(wait=True, cancel_futures=True)
+
+    # resuelve un pedido: devuelve (resultado, origen) con origen 'memoria' (resultado en memoria), 'unificado'
+    # (esperó a un pedido igual en curso) o 'calculado' (simular.correr, que puede leerlo del cache en disco)
+    def resolver(self, pedido):
+        kwargs = parametros_pedido(pedido)
+        clave = json.dumps(kwargs, sort_keys=True)
+        with self.lock:
+            self.pedidos += 1
+            if clave in self.memoria:
+                self.memoria.move_to_end(clave)
+                return self.memoria[clave], 'memoria'
+            futuro = self.en_curso.get(clave)
+            propio = futuro is None
+            if propio:
+                futuro = Future()
+                self.en_curso[clave] = futuro
+        if not propio:
+            return futuro.result(), 'unificado'
+        try:
+            filas = simular.correr(**kwargs, workers=self.workers, cache=self.cache, pool=self.pool)
+            resultado = {'meta': kwargs, 'resultados': filas}
+            futuro.set_result(resultado)
+        except BaseException as e:
+            futuro.set_exception(e)
+            raise
+        finally:
+            with self.lock:
+                del self.en_curso[clave]
+        with self.lock:
+            self.calculados += 1
+            # sin semilla cada corrida es distinta: solo se guardan las reproducibles
+            if kwargs['seed'] is not None:
+                self.memoria[clave] = resultado
+                while len(self.memoria) > self.max_memoria:
+                    self.memoria.popitem(last=False)
+        return resultado, 'calculado'
+
+    def salud(self):
+        with self.lock:
+            return {'workers': self.workers, 'pedidos': self.pedidos, 'calculados': self.calculados,
+                    'en_memoria': len(self.memoria), 'en_curso': len(self.en_curso),
+                    'segundos_activo': round(time.time() - self.inicio, 1)}
+
+# funcion que arma el handler HTTP para un servicio
+def _handler(servicio):
+    class Handler(BaseHTTPRequestHandler):
+        def _responder(self, codigo, cuerpo):
+            data = json.dumps(cuerpo).encode('utf-8')
+            self.send_response(codigo)
+            self.send_header('Content-Type', 'application/json')
+            self.send_header('Content-Length', str(len(data)))
+            self.end_headers()
+            self.wfile.write(data)
+
+        def do_GET(self):
+            if self.path == '/salud':
+                self._responder(200, servicio.salud())
+            else:
+                self._responder(404, {'error': f"Ruta desconocida: {self.path}"})
+
+        def do_POST(self):
+            if self.path != '/simular':
+                self._responder(404, {'error': f"Ruta desconocida: {self.path}"})
+                return
+            inicio = time.perf_counter()
+            try:
+                largo = int(self.headers.get('Content-Length', 0))
+                pedido = json.loads(self.rfile.read(largo) or b'{}')
+                resultado, origen = servicio.resolver(pedido)
+            except (ValueError, TypeError, KeyError) as e:
+                self._responder(400, {'error': str(e)})
+                return
+            except Exception as e:
+                self._responder(500, {'error': f"{type(e).__name__}: {e}"})
+                return
+            self._responder(200, dict(resultado, origen=origen, segundos=round(time.perf_counter() - inicio, 4)))
+
+        def log_message(self, formato, *args):
+            pass
+
+    return Handler
+
+# funcion que crea el servidor HTTP (sin arrancarlo) con su servicio
+def crear_servidor(host='127.0.0.1', puerto=8080, workers=None, cache=None):
+    servicio = ServicioWhatIf(workers, cache)
+    servicio.calentar()
+    servidor = ThreadingHTTPServer((host, puerto), _handler(servicio))
+    servidor.daemon_threads = True
+    servidor.servicio = servicio
+    return servidor
+
+# funcion principal: arranca el servicio
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Servicio HTTP de escenarios what-if')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--puerto', type=int, default=8080)
+    parser.add_argument('--workers', type=int, default=None)
+    parser.add_argument('--sin-cache', action='store_true', help='no usar el cache en disco')
+    args = parser.parse_args(argv)
+    servidor = crear_servidor(args.host, args.puerto, args.workers, False if args.sin_cache else None)
+    print(f"Servicio what-if en http://{args.host}:{args.puerto} ({servidor.servicio.workers} workers)")
+    try:
+        servidor.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        servidor.servicio.cerrar()
+        servidor.server_close()
+
+if __name__ == "__main__":
+    main()
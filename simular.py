@@ -0,0 +1,238 @@
+# punto de entrada unico por linea de comandos para correr los escenarios sin editar los scripts.
+# Ejemplos:
+#   python simular.py --escenario normal --lambda 0.16355 --replicas 1000 --seed 42
+#   python simular.py --escenario normal --lambda 0.02 0.1 0.2 0.5 1.0 --replicas 30 --workers 4 --formato csv
+#   python simular.py --escenario tormenta --lambda 0.2 --storm-start 300 --storm-duration 30 --replicas 1000
+#   python simular.py --escenario normal --lambda 0.5 1.0 1.5 --pistas 2 --politica primer_eta
+#   python simular.py --escenario normal --perfil perfil_dia_tipico.csv --lambda 0.8 1.0 1.2
+#   python simular.py --escenario ventoso --lambda 0.1 0.2 0.3 --prob-interrupcion 0.1 --formato npz --salida ventoso.npz
+#
+# Motor: con mas de una lambda y un escenario que acepta arribos pre-sorteados (normal, ventoso) se usa
+# el barrido con numeros aleatorios comunes de barrido_lambda.py; si no, replicas independientes.
+# Con --perfil los arribos siguen un perfil lambda(t) (ver perfiles.py) y cada --lambda es una escala del perfil.
+# Cada replica tiene su propia semilla (SeedSequence.spawn) y con --workers > 1 las replicas se reparten en
+# lotes entre procesos, asi el resultado con semilla no depende de la cantidad de procesos.
+import argparse
+import csv
+import io
+import json
+import os
+import random
+import sys
+
+_RAIZ = os.path.dirname(os.path.abspath(__file__))
+# los simuladores de tormenta y viento viven en Ejercicio6 y Ejercicio5 (una sola vez por proceso: los workers
+# del pool de servicio.py llaman a simulador en cada pedido)
+for _carpeta in ('Ejercicio5', 'Ejercicio6'):
+    if os.path.join(_RAIZ, _carpeta) not in sys.path:
+        sys.path.append(os.path.join(_RAIZ, _carpeta))
+
+ESCENARIOS = ('normal', 'tormenta', 'ventoso')
+# escenarios cuyo simulador acepta arribos=... (y por lo tanto el barrido por thinning)
+_ACEPTAN_ARRIBOS = ('normal', 'ventoso')
+
+# funcion que devuelve el simulador del escenario como funcion (lambda_prob, total_minutes, arribos=None)
+def simulador(escenario, storm_start=None, storm_duration=30, prob_interrupcion=0.1, pistas=1, politica='round_robin',
+              perfil=None):
+    if perfil is not None:
+        from perfiles import con_perfil
+        return con_perfil(simulador(escenario, storm_start, storm_duration, prob_interrupcion, pistas, politica), perfil)
+    if escenario == 'normal':
+        from main import simulate_planes
+        if pistas == 1:
+            return simulate_planes
+
+        def sim(lambda_prob, total_minutes, arribos=None):
+            return simulate_planes(lambda_prob, total_minutes, arribos=arribos, pistas=pistas, politica=politica)
+        return sim
+    if escenario == 'ventoso':
+        from dia_ventoso import simulate_dia_ventoso
+
+        def sim(lambda_prob, total_minutes, arribos=None):
+            return simulate_dia_ventoso(lambda_prob, total_minutes, arribos=arribos, prob_interrupcion=prob_interrupcion)
+        return sim
+    if escenario == 'tormenta':
+        from ejercicio6 import simulate_storm_closure
+
+        def sim(lambda_prob, total_minutes, arribos=None):
+            return simulate_storm_closure(lambda_prob, total_minutes, storm_start=storm_start, storm_duration=storm_duration)
+        return sim
+    raise ValueError(f"Escenario desconocido: {escenario}")
+
+def _metrica(res):
+    from ejercicio4 import metricas_replica
+    return metricas_replica(res[0])
+
+# funcion que corre un lote de replicas, una semilla por replica, para todas las lambdas (se ejecuta en un
+# proceso del pool). La semilla de la replica fija random (y los uniformes de go-around) y, con thinning, el
+# superstream de arribos compartido por todas las lambdas
+def _correr_lote(tarea):
+    import numpy as np
+    escenario, lambdas, total_minutes, semillas, motor, opciones = tarea
+    sim = simulador(escenario, **opciones)
+    filas = {lam: [] for lam in lambdas}
+    for seed in semillas:
+        if seed is not None:
+            random.seed(seed)
+        if motor == 'thinning':
+            from barrido_lambda import barrido_lambdas
+            res = barrido_lambdas(lambdas, total_minutes, 1, _metrica, sim, seed=seed, perfil=opciones.get('perfil'))
+            for lam in lambdas:
+                filas[lam].extend(res[lam])
+        else:
+            estado = random.getstate()
+            for lam in lambdas:
+                random.setstate(estado)
+                filas[lam].append(_metrica(sim(lam, total_minutes)))
+    return {lam: np.array(filas[lam], dtype=float).reshape(len(semillas), -1) for lam in lambdas}
+
+# funcion que reparte las semillas de n_mc replicas (una por replica) en lotes contiguos, uno por worker
+def _lotes(n_mc, workers, seed):
+    import numpy as np
+    workers = max(1, min(workers, n_mc))
+    if seed is None:
+        semillas = [None] * n_mc
+    else:
+        semillas = [int(s.generate_state(1)[0]) for s in np.random.SeedSequence(seed).spawn(n_mc)]
+    cortes = np.cumsum([0] + [n_mc // workers + (1 if k < n_mc % workers else 0) for k in range(workers)])
+    return [semillas[a:b] for a, b in zip(cortes[:-1], cortes[1:])]
+
+# funcion que corre el escenario y devuelve un resumen por lambda
+def correr(escenario, lambdas, total_minutes=1080, n_mc=30, workers=1, seed=None, motor='auto',
+           storm_start=None, storm_duration=30, prob_interrupcion=0.1, pistas=1, politica='round_robin', perfil=None,
+           cache=None, pool=None):
+    """
+    Devuelve una lista de dicts (uno por lambda) con media y desvío de la probabilidad de desvío y congestión.
+
+    Args:
+        escenario: 'normal', 'tormenta' o 'ventoso'
+        lambdas: lista de lambdas
+        motor: 'auto', 'thinning' o 'independiente'
+        pistas, politica: cantidad de pistas y política de asignación (solo escenario normal)
+        perfil: PerfilLlegadas opcional; las lambdas pasan a ser escalas del perfil
+        cache: CacheResultados, None (cache por defecto) o False (sin cache)
+        pool: executor ya creado (por ejemplo el pool caliente de servicio.py); si se pasa, todos los lotes
+              corren en el, incluso si hay uno solo
+    """
+    import numpy as np
+    from concurrent.futures import ProcessPoolExecutor
+    from cache_resultados import memoizar
+    if escenario not in ESCENARIOS:
+        raise ValueError(f"Escenario desconocido: {escenario}")
+    lambdas = [float(l) for l in lambdas]
+    if motor == 'auto':
+        motor = 'thinning' if len(lambdas) > 1 and escenario in _ACEPTAN_ARRIBOS else 'independiente'
+    if perfil is not None and escenario not in _ACEPTAN_ARRIBOS:
+        raise ValueError(f"El escenario {escenario} no admite perfiles de llegada")
+    if motor == 'thinning' and escenario not in _ACEPTAN_ARRIBOS:
+        raise ValueError(f"El escenario {escenario} no admite el motor por thinning")
+    if escenario == 'tormenta' and storm_start is None:
+        # tormenta en un horario al azar, pero el mismo para todas las replicas (como en ejercicio6.py)
+        storm_start = random.Random(seed).randint(0, total_minutes - storm_duration)
+    opciones = {}
+    if escenario == 'tormenta':
+        opciones = {'storm_start': storm_start, 'storm_duration': storm_duration}
+    elif escenario == 'ventoso':
+        opciones = {'prob_interrupcion': prob_interrupcion}
+    elif pistas != 1:
+        opciones = {'pistas': pistas, 'politica': politica}
+    params = {'escenario': escenario, 'lambdas': lambdas, 'total_minutes': total_minutes, 'n_mc': n_mc,
+              'seed': seed, 'motor': motor, 'opciones': dict(opciones)}
+    if perfil is not None:
+        opciones['perfil'] = perfil
+        params['opciones']['perfil'] = perfil.como_dict()
+
+    def calcular():
+        tareas = [(escenario, lambdas, total_minutes, semillas, motor, opciones) for semillas in _lotes(n_mc, workers, seed)]
+        if pool is not None:
+            partes = list(pool.map(_correr_lote, tareas))
+        elif len(tareas) == 1:
+            partes = [_correr_lote(tareas[0])]
+        else:
+            with ProcessPoolExecutor(max_workers=len(tareas)) as ejecutor:
+                partes = list(ejecutor.map(_correr_lote, tareas))
+        filas = []
+        for lam in lambdas:
+            m = np.concatenate([p[lam] for p in partes])
+            ddof = 1 if len(m) > 1 else 0
+            filas.append({
+                'lambda': lam,
+                'prob_desvio': float(m[:, 0].mean()), 'prob_desvio_std': float(m[:, 0].std(ddof=ddof)),
+                'prob_congestion': float(m[:, 1].mean()), 'prob_congestion_std': float(m[:, 1].std(ddof=ddof)),
+                'n_mc': int(len(m)),
+            })
+        return filas
+
+    archivos = (__file__, os.path.join(_RAIZ, 'barrido_lambda.py'), os.path.join(_RAIZ, 'ejercicio4.py'),
+                os.path.join(_RAIZ, 'Ejercicio5', 'dia_ventoso.py'), os.path.join(_RAIZ, 'Ejercicio6', 'ejercicio6.py'))
+    return memoizar(f'simular.{escenario}', params, calcular, archivos=archivos, cache=cache)
+
+# funcion que escribe los resultados en el formato pedido (a archivo o a stdout)
+def escribir(filas, formato, salida=None, meta=None):
+    if formato == 'npz':
+        import numpy as np
+        if salida is None:
+            raise ValueError("El formato npz necesita --salida")
+        np.savez(salida, **{k: np.array([f[k] for f in filas]) for k in filas[0]})
+        return
+    buf = io.StringIO()
+    if formato == 'json':
+        json.dump({'meta': meta or {}, 'resultados': filas}, buf, indent=2)
+        buf.write('\n')
+    elif formato == 'csv':
+        w = csv.DictWriter(buf, fieldnames=list(filas[0]))
+        w.writeheader()
+        w.writerows(filas)
+    else:
+        raise ValueError(f"Formato desconocido: {formato}")
+    if salida is None:
+        sys.stdout.write(buf.getvalue())
+    else:
+        with open(salida, 'w', encoding='utf-8', newline='') as f:
+            f.write(buf.getvalue())
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Simulación Monte Carlo de arribos a AEP")
+    parser.add_argument('--escenario', choices=ESCENARIOS, default='normal')
+    parser.add_argument('--lambda', dest='lambdas', type=float, nargs='+', default=None,
+                        help="una lambda o una grilla de lambdas (aviones por minuto; con --perfil, escalas del perfil)")
+    parser.add_argument('--perfil', default=None, help="archivo CSV/JSON con un perfil de llegadas lambda(t)")
+    parser.add_argument('--horizonte', type=int, default=1080, help="minutos simulados (1080 = 6:00 a 24:00)")
+    parser.add_argument('--replicas', type=int, default=30, help="replicas Monte Carlo por lambda")
+    parser.add_argument('--workers', type=int, default=1, help="procesos en paralelo")
+    parser.add_argument('--seed', type=int, default=None, help="semilla (con semilla los resultados se cachean)")
+    parser.add_argument('--motor', choices=('auto', 'thinning', 'independiente'), default='auto')
+    parser.add_argument('--storm-start', type=int, default=None, help="minuto de inicio de la tormenta")
+    parser.add_argument('--storm-duration', type=int, default=30, help="duración de la tormenta en minutos")
+    parser.add_argument('--prob-interrupcion', type=float, default=0.1, help="probabilidad de interrupción por viento")
+    parser.add_argument('--pistas', type=int, default=1, help="cantidad de pistas (escenario normal)")
+    parser.add_argument('--politica', choices=('round_robin', 'primer_eta', 'menor_cola'), default='round_robin',
+                        help="asignación de pista a cada avión nuevo")
+    parser.add_argument('--cache-dir', default=None, help="directorio del cache de resultados")
+    parser.add_argument('--sin-cache', action='store_true', help="no leer ni escribir el cache")
+    parser.add_argument('--formato', choices=('json', 'csv', 'npz'), default='json')
+    parser.add_argument('--salida', default=None, help="archivo de salida (por defecto stdout)")
+    args = parser.parse_args(argv)
+
+    perfil = None
+    if args.perfil is not None:
+        from perfiles import cargar_perfil
+        perfil = cargar_perfil(args.perfil)
+    if args.lambdas is None:
+        args.lambdas = [1.0] if perfil is not None else [0.16355]
+    cache = None
+    if args.sin_cache:
+        cache = False
+    elif args.cache_dir is not None:
+        from cache_resultados import CacheResultados
+        cache = CacheResultados(args.cache_dir)
+    filas = correr(args.escenario, args.lambdas, args.horizonte, args.replicas, args.workers, args.seed, args.motor,
+                   args.storm_start, args.storm_duration, args.prob_interrupcion, args.pistas, args.politica, perfil, cache=cache)
+    meta = {k: v for k, v in vars(args).items() if k not in ('salida', 'formato', 'cache_dir', 'sin_cache')}
+    if perfil is not None:
+        meta['perfil'] = perfil.como_dict()
+    escribir(filas, args.formato, args.salida, meta)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,34 @@
+# invariantes de agregador_mc.py: los acumulados coinciden con las cuentas sobre las listas de aviones
+import random
+import numpy as np
+from agregador_mc import AgregadorMC
+from main import TIEMPO_BASE_100NM, simulate_planes
+
+def test_agregador_coincide_con_las_listas():
+    random.seed(6)
+    replicas = [simulate_planes(0.3, 300)[0] for _ in range(4)]
+    agregador = AgregadorMC(300)
+    for planes in replicas:
+        agregador.agregar(planes)
+    aterrizados = [p for planes in replicas for p in planes if p.status == 'landed']
+    atrasos = np.array([p.landed_time - p.appear_time - TIEMPO_BASE_100NM for p in aterrizados])
+    media, desvio = agregador.atraso_medio()
+    assert agregador.aterrizados == len(aterrizados)
+    assert np.isclose(media, atrasos.mean()) and np.isclose(desvio, atrasos.std())
+    por_hora = np.array([np.bincount([min(p.landed_time // 60, 4) for p in planes if p.status == 'landed'],
+                                     minlength=5) for planes in replicas])
+    media_hora, desvio_hora = agregador.aterrizajes_por_hora()
+    assert np.allclose(media_hora, por_hora.mean(axis=0))
+    assert np.allclose(desvio_hora, por_hora.std(axis=0, ddof=1))
+
+def test_combinar_es_agregar_todo_junto():
+    random.seed(7)
+    replicas = [simulate_planes(0.3, 300)[0] for _ in range(4)]
+    todo, a, b = AgregadorMC(300), AgregadorMC(300), AgregadorMC(300)
+    for k, planes in enumerate(replicas):
+        todo.agregar(planes)
+        (a if k < 2 else b).agregar(planes)
+    a.combinar(b)
+    assert np.array_equal(a.duraciones, todo.duraciones)
+    assert np.allclose(a.aterrizajes_por_hora(), todo.aterrizajes_por_hora())
+    assert a.eficiencia() == todo.eficiencia()
@@ -0,0 +1,21 @@
+# invariantes de barrido_lambda.py: el thinning acoplado anida los arribos de las lambdas del barrido
+import numpy as np
+import pytest
+from barrido_lambda import generar_superstream, adelgazar
+
+@pytest.mark.parametrize('lambda_max', [0.5, 2.5])
+def test_arribos_de_lambda_chica_son_subconjunto_de_los_de_lambda_grande(lambda_max):
+    stream = generar_superstream(lambda_max, 600, np.random.default_rng(1))
+    anterior = set()
+    for lam in np.linspace(0.05, lambda_max, 8):
+        arribos = set(adelgazar(stream, lam))
+        assert anterior <= arribos
+        anterior = arribos
+    assert len(anterior) == len(stream['minutos'])
+
+def test_cada_minuto_recibe_la_parte_entera_mas_uno_con_la_fraccionaria():
+    lam = 2.3
+    stream = generar_superstream(lam, 2000, np.random.default_rng(2))
+    por_minuto = np.bincount([m for m, _ in adelgazar(stream, lam)], minlength=2000)
+    assert set(por_minuto) <= {2, 3}
+    assert abs((por_minuto == 3).mean() - 0.3) < 0.05
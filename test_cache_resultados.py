@@ -0,0 +1,43 @@
+# invariantes de cache_resultados.py: lo que sale del cache es igual (tipos incluidos) a lo que se calculo
+import numpy as np
+import pytest
+from cache_resultados import CacheResultados, memoizar
+
+# funcion que compara dos resultados recursivamente, incluidos tipo, dtype y forma de los arrays
+def iguales(a, b):
+    if isinstance(a, np.ndarray):
+        return isinstance(b, np.ndarray) and a.dtype == b.dtype and a.shape == b.shape and np.array_equal(a, b)
+    if isinstance(a, dict):
+        return isinstance(b, dict) and a.keys() == b.keys() and all(iguales(a[k], b[k]) for k in a)
+    if isinstance(a, (list, tuple)):
+        return len(a) == len(b) and all(iguales(x, y) for x, y in zip(a, b))
+    return a == b
+
+RESULTADOS = {
+    'mixto': {'mu_star': np.arange(6.0).reshape(3, 2), 'factores': ['a', 'b', 'c'], 'filas': 12,
+              'vacio': np.empty((0, 2)), 'escalar': np.array(1.5), 'enteros': np.arange(4, dtype=np.int32)},
+    'claves_numericas': {0.1: {'prob_desvio': 0.25}, 0.2: {'prob_desvio': 0.5}},
+    'solo_arrays': {'desvios': np.ones((2, 3)), 'probs': np.array([0.0, 0.1])},
+    'lista': [{'lambda': 0.1, 'n_mc': 3}],
+}
+
+@pytest.mark.parametrize('nombre', list(RESULTADOS))
+def test_ida_y_vuelta_por_el_cache(tmp_path, nombre):
+    cache = CacheResultados(str(tmp_path))
+    calculos = []
+
+    def calcular():
+        calculos.append(1)
+        return RESULTADOS[nombre]
+    primero = memoizar('prueba', {'seed': 1}, calcular, cache=cache)
+    segundo = memoizar('prueba', {'seed': 1}, calcular, cache=cache)
+    assert len(calculos) == 1
+    assert iguales(RESULTADOS[nombre], primero)
+    assert iguales(RESULTADOS[nombre], segundo)
+
+def test_sin_semilla_no_se_cachea(tmp_path):
+    cache = CacheResultados(str(tmp_path))
+    calculos = []
+    for _ in range(2):
+        memoizar('prueba', {'seed': None}, lambda: calculos.append(1) or {'x': 1}, cache=cache)
+    assert len(calculos) == 2
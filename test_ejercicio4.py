@@ -0,0 +1,32 @@
+# invariantes de ejercicio4.py: un barrido interrumpido y reanudado desde el checkpoint da lo mismo que sin cortar
+import pytest
+import ejercicio4
+
+LAMBDAS = [0.1, 0.3]
+
+# funcion que corre el barrido cortandolo (con una excepcion) despues de cortar_en replicas y lo reanuda
+def reanudado(monkeypatch, path, modo, cortar_en):
+    original = ejercicio4.metricas_replica
+    llamadas = []
+
+    def con_corte(planes):
+        llamadas.append(1)
+        if len(llamadas) > cortar_en:
+            raise KeyboardInterrupt
+        return original(planes)
+    with monkeypatch.context() as m:
+        m.setattr(ejercicio4, 'metricas_replica', con_corte)
+        with pytest.raises(KeyboardInterrupt):
+            ejercicio4.montecarlo_desvios(LAMBDAS, 240, n_mc=4, seed=5, cache=False, checkpoint=path,
+                                          checkpoint_cada=2, modo=modo)
+    assert path.exists()
+    return ejercicio4.montecarlo_desvios(LAMBDAS, 240, n_mc=4, seed=5, cache=False, checkpoint=path,
+                                         checkpoint_cada=2, modo=modo)
+
+@pytest.mark.parametrize('modo, cortar_en', [('independiente', 3), ('independiente', 4), ('independiente', 7),
+                                              ('thinning', 5)])
+def test_reanudar_da_lo_mismo_que_sin_cortar(monkeypatch, tmp_path, modo, cortar_en):
+    completo = ejercicio4.montecarlo_desvios(LAMBDAS, 240, n_mc=4, seed=5, cache=False, modo=modo)
+    path = tmp_path / 'barrido.ckpt'
+    assert reanudado(monkeypatch, path, modo, cortar_en) == completo
+    assert not path.exists()
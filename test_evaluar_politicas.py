@@ -0,0 +1,14 @@
+# invariantes de evaluar_politicas.py: resultado con semilla independiente de la cantidad de procesos
+import numpy as np
+from evaluar_politicas import evaluar_politicas
+
+def test_resultado_no_depende_de_workers():
+    corridas = [evaluar_politicas(lambda_prob=0.3, total_minutes=240, n_mc=5, workers=w, seed=7, cache=False)
+                for w in (1, 3)]
+    for clave in ('media', 'std', 'diferencia', 'diferencia_se'):
+        assert np.array_equal(corridas[0][clave], corridas[1][clave])
+    assert corridas[0]['ranking'] == corridas[1]['ranking']
+
+def test_la_referencia_no_tiene_diferencia_contra_si_misma():
+    res = evaluar_politicas(lambda_prob=0.3, total_minutes=240, n_mc=3, workers=1, seed=1, cache=False)
+    assert np.all(res['diferencia'][0] == 0) and np.all(res['diferencia_se'][0] == 0)
@@ -0,0 +1,14 @@
+# invariantes de instrumentacion.py: medir una corrida no cambia la corrida
+import random
+from instrumentacion import Instrumentacion
+from main import simulate_planes
+
+def test_corrida_instrumentada_es_igual_a_la_normal():
+    random.seed(2)
+    normal, _ = simulate_planes(0.4, 600)
+    random.seed(2)
+    instr = Instrumentacion()
+    medida, _ = simulate_planes(0.4, 600, instrumentacion=instr)
+    assert [(p.id, p.status, p.landed_time, p.positions) for p in normal] == \
+           [(p.id, p.status, p.landed_time, p.positions) for p in medida]
+    assert instr.contadores['desvios'] == sum(p.status == 'montevideo' for p in medida)
@@ -0,0 +1,80 @@
+# invariantes del motor de main.py: bifurcaciones, instantaneas y go-around
+import random
+import numpy as np
+from main import Simulacion, ModeloGoAround, simulate_planes
+
+# funcion que resume una corrida en una tupla comparable (un elemento por avion)
+def resumen(planes):
+    return [(p.id, p.appear_time, p.status, p.landed_time, p.montevideo_time, p.interrupciones, tuple(p.positions))
+            for p in planes]
+
+def test_instantanea_continuar_es_la_corrida_sin_cortar():
+    random.seed(3)
+    sim = Simulacion(0.5, 600, goaround=ModeloGoAround(0.3))
+    sim.correr(300)
+    inst = sim.instantanea()
+    primera = resumen(inst.continuar().correr().planes)
+    segunda = resumen(inst.continuar().correr().planes)
+    random.seed(3)
+    completa = resumen(Simulacion(0.5, 600, goaround=ModeloGoAround(0.3)).correr().planes)
+    assert primera == segunda == completa
+
+def test_bifurcar_no_modifica_el_original():
+    random.seed(5)
+    sim = Simulacion(0.5, 600, goaround=ModeloGoAround(0.3))
+    sim.correr(200)
+    estado = random.getstate()
+    copia = resumen(sim.bifurcar().correr().planes)
+    random.setstate(estado)
+    assert resumen(sim.correr().planes) == copia
+
+def test_goaround_con_prob_cero_es_el_dia_normal():
+    random.seed(9)
+    normal = resumen(simulate_planes(0.2, 600)[0])
+    random.seed(9)
+    ventoso = resumen(simulate_planes(0.2, 600, goaround=ModeloGoAround(0.0))[0])
+    assert normal == ventoso
+
+def test_goaround_no_repite_uniformes_con_arribos_pre_sorteados():
+    from barrido_lambda import generar_superstream, adelgazar
+    random.seed(1)
+    rng = np.random.default_rng(0)
+    interrupciones = []
+    for _ in range(4):
+        arribos = adelgazar(generar_superstream(0.3, 600, rng), 0.3)
+        planes, _ = simulate_planes(0.3, 600, arribos=arribos, goaround=ModeloGoAround(0.3))
+        interrupciones.append([p.interrupciones for p in planes[:20]])
+    assert len({tuple(i) for i in interrupciones}) > 1
+
+def test_goaround_con_semilla_explicita_es_reproducible():
+    arribos = [(t, 0.5) for t in range(0, 600, 6)]
+    corridas = [resumen(simulate_planes(0.2, 600, arribos=arribos, goaround=ModeloGoAround(0.3, semilla=s))[0])
+                for s in (1, 1, 2)]
+    assert corridas[0] == corridas[1] != corridas[2]
+
+def test_holding_en_el_fijo_no_cuenta_dos_veces_el_mismo_minuto():
+    import math
+    from main import ProgramaCierres, descomponer_atrasos, TIEMPO_BASE_100NM
+    # la congestion solo puede ser negativa por el redondeo del aterrizaje al minuto
+    piso = TIEMPO_BASE_100NM - math.ceil(TIEMPO_BASE_100NM) - 1e-9
+    for seed in range(10):
+        for capacidad in (0.0, 0.5):
+            random.seed(seed)
+            cierres = ProgramaCierres([(200, 60, capacidad)], accion='holding')
+            planes, _ = simulate_planes(0.4, 600, cierres=cierres)
+            assert np.nanmin(descomponer_atrasos(planes)['congestion']) >= piso
+
+def test_una_pista_no_depende_de_la_politica_de_asignacion():
+    corridas = []
+    for politica in ('round_robin', 'primer_eta', 'menor_cola'):
+        random.seed(4)
+        corridas.append(resumen(simulate_planes(0.4, 600, pistas=1, politica=politica)[0]))
+    random.seed(4)
+    assert corridas[0] == corridas[1] == corridas[2] == resumen(simulate_planes(0.4, 600)[0])
+
+def test_parametros_por_defecto_son_el_modelo_original():
+    from main import ParametrosAproximacion
+    random.seed(8)
+    original = resumen(simulate_planes(0.4, 600)[0])
+    random.seed(8)
+    assert resumen(simulate_planes(0.4, 600, parametros=ParametrosAproximacion())[0]) == original
@@ -0,0 +1,13 @@
+# invariantes de red_aeropuertos.py: con semilla el resultado no depende de la cantidad de procesos
+from red_aeropuertos import Aeropuerto, simular_red
+
+def red():
+    return [Aeropuerto('AEP', lambda_prob=0.4, alterno='MVD', demora=25),
+            Aeropuerto('MVD', lambda_prob=0.1, alterno='POA', demora=60),
+            Aeropuerto('POA', lambda_prob=0.1)]
+
+def test_resultado_no_depende_de_los_procesos():
+    local = simular_red(red(), total_minutes=300, seed=3, procesos=0)
+    paralelo = simular_red(red(), total_minutes=300, seed=3, procesos=2)
+    assert local == paralelo
+    assert local == simular_red(red(), total_minutes=300, seed=3, procesos=0)
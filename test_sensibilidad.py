@@ -0,0 +1,11 @@
+# invariantes de sensibilidad.py: resultado con semilla independiente de la cantidad de procesos
+import numpy as np
+import pytest
+from sensibilidad import sensibilidad
+
+@pytest.mark.parametrize('metodo, n, claves', [('morris', 2, ('mu_star', 'sigma')), ('sobol', 4, ('S1', 'ST'))])
+def test_resultado_no_depende_de_workers(metodo, n, claves):
+    corridas = [sensibilidad(metodo, n, total_minutes=240, replicas=2, workers=w, seed=3, cache=False)
+                for w in (1, 3)]
+    for clave in claves:
+        assert np.array_equal(corridas[0][clave], corridas[1][clave])
@@ -0,0 +1,47 @@
+# invariantes de servicio.py: respuestas independientes del tamano del pool y workers que no acumulan estado
+import sys
+import simular
+from servicio import ServicioWhatIf
+
+# funcion que corre simulador varias veces en un proceso del pool y devuelve cuanto crecio sys.path
+def _crecimiento_sys_path(_):
+    simular.simulador('ventoso')
+    largo = len(sys.path)
+    for _ in range(5):
+        simular.simulador('ventoso')
+        simular.simulador('tormenta', storm_start=0)
+    return len(sys.path) - largo
+
+def test_pedido_con_semilla_no_depende_del_pool():
+    pedido = {'escenario': 'ventoso', 'lambda': [0.1, 0.3], 'horizonte': 240, 'replicas': 5, 'seed': 3}
+    resultados = []
+    for workers in (1, 3):
+        servicio = ServicioWhatIf(workers, cache=False)
+        try:
+            resultado, origen = servicio.resolver(pedido)
+        finally:
+            servicio.cerrar()
+        assert origen == 'calculado'
+        resultados.append(resultado['resultados'])
+    assert resultados[0] == resultados[1]
+
+def test_workers_calientes_no_agrandan_sys_path():
+    servicio = ServicioWhatIf(2, cache=False)
+    try:
+        servicio.calentar()
+        assert list(servicio.pool.map(_crecimiento_sys_path, range(4))) == [0] * 4
+    finally:
+        servicio.cerrar()
+
+def test_pedidos_iguales_simultaneos_se_calculan_una_vez():
+    from concurrent.futures import ThreadPoolExecutor
+    pedido = {'escenario': 'normal', 'lambda': 0.3, 'horizonte': 240, 'replicas': 4, 'seed': 2}
+    servicio = ServicioWhatIf(1, cache=False)
+    try:
+        with ThreadPoolExecutor(4) as hilos:
+            respuestas = list(hilos.map(lambda _: servicio.resolver(pedido), range(4)))
+    finally:
+        servicio.cerrar()
+    assert servicio.calculados == 1
+    assert all(resultado == respuestas[0][0] for resultado, _ in respuestas)
+    assert sorted(origen for _, origen in respuestas).count('calculado') == 1
@@ -0,0 +1,23 @@
+# invariantes de simular.py: resultados con semilla independientes de la cantidad de procesos
+import sys
+import pytest
+import simular
+
+@pytest.mark.parametrize('escenario, lambdas', [('normal', [0.1, 0.3]), ('ventoso', [0.2, 0.4]), ('tormenta', [0.2])])
+def test_resultado_no_depende_de_workers(escenario, lambdas):
+    corridas = [simular.correr(escenario, lambdas, total_minutes=240, n_mc=5, workers=w, seed=7, cache=False)
+                for w in (1, 3)]
+    assert corridas[0] == corridas[1]
+
+def test_lotes_reparten_una_semilla_por_replica():
+    lotes = simular._lotes(7, 3, seed=1)
+    assert [len(l) for l in lotes] == [3, 2, 2]
+    assert sum(lotes, []) == simular._lotes(7, 1, seed=1)[0]
+
+def test_simulador_no_agranda_sys_path():
+    simular.simulador('ventoso')
+    largo = len(sys.path)
+    for _ in range(5):
+        simular.simulador('ventoso')
+        simular.simulador('tormenta', storm_start=0)
+    assert len(sys.path) == largo
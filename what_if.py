@@ -0,0 +1,78 @@
+# escenarios what-if desde un minuto del dia: se simula el dia una sola vez hasta ese minuto, se toma una
+# instantanea (main.Instantanea, con el estado de random incluido) y cada escenario continua desde ahi con
+# sus cambios (otra lambda, otra politica de pistas, otros arribos). Correr N escenarios desde las 14:00
+# cuesta N veces los minutos que faltan, no N dias completos.
+# Todos los escenarios de una replica usan los mismos numeros aleatorios desde la instantanea, asi la
+# diferencia entre escenarios no es ruido del sorteo.
+import random
+import numpy as np
+from main import Simulacion, minutos_a_hora, descomponer_atrasos
+from perfiles import hora_a_minutos
+
+# funcion que resume una simulacion terminada
+def resumen(sim):
+    aterrizados = sum(1 for p in sim.planes if p.status == 'landed')
+    desviados = sum(1 for p in sim.planes if p.status == 'montevideo')
+    atraso = descomponer_atrasos(sim.planes)['atraso']
+    return {
+        'aviones': len(sim.planes),
+        'aterrizados': aterrizados,
+        'desviados': desviados,
+        'pct_desvios': 100 * desviados / max(aterrizados + desviados, 1),
+        'atraso_medio': float(np.nanmean(atraso)) if aterrizados else 0.0,
+    }
+
+# funcion que simula el dia hasta la hora dada ("HH:MM" o minuto) y devuelve la instantanea en ese minuto
+def instantanea_a_las(hora, lambda_prob=0.2, total_minutes=1080, seed=None, **opciones):
+    """
+    Args:
+        opciones: argumentos de Simulacion (arribos, pistas, politica)
+    """
+    if seed is not None:
+        random.seed(seed)
+    sim = Simulacion(lambda_prob, total_minutes, **opciones)
+    sim.correr(hora_a_minutos(hora))
+    return sim.instantanea()
+
+# funcion que corre cada escenario desde la instantanea hasta el final del dia
+def correr_escenarios(inst, escenarios, replicas=1, metrica=resumen):
+    """
+    Args:
+        inst: main.Instantanea
+        escenarios: dict nombre -> dict de cambios (ver Simulacion.cambiar), por ejemplo {'lambda_prob': 0.3}
+        replicas: continuaciones por escenario; con 1 es la continuación exacta del día de la instantánea,
+                  con más cada réplica sortea el resto del día con su propia semilla (la misma para todos
+                  los escenarios)
+        metrica: función (Simulacion) -> dict de números
+
+    Returns:
+        dict nombre -> dict con la media de cada métrica sobre las réplicas
+    """
+    random.setstate(inst.estado_random)
+    semillas = [random.getrandbits(64) for _ in range(replicas)] if replicas > 1 else [None]
+    resultados = {}
+    for nombre, cambios in escenarios.items():
+        valores = []
+        for semilla in semillas:
+            sim = inst.continuar(**cambios)
+            if semilla is not None:
+                random.seed(semilla)
+            valores.append(metrica(sim.correr()))
+        resultados[nombre] = {k: float(np.mean([v[k] for v in valores])) for k in valores[0]}
+    return resultados
+
+# funcion principal: 100 escenarios de lambda desde las 14:00
+def main():
+    import time
+    inst = instantanea_a_las('14:00', lambda_prob=0.2, seed=42)
+    lambdas = np.linspace(0.05, 0.5, 100)
+    escenarios = {f"λ={lam:.3f}": {'lambda_prob': float(lam)} for lam in lambdas}
+    t0 = time.perf_counter()
+    res = correr_escenarios(inst, escenarios)
+    print(f"{len(escenarios)} escenarios desde {minutos_a_hora(inst.t)} en {time.perf_counter() - t0:.2f} s")
+    for nombre in list(escenarios)[::11]:
+        r = res[nombre]
+        print(f"  {nombre}: {r['aviones']:.0f} aviones, desvíos {r['pct_desvios']:.1f}%, atraso medio {r['atraso_medio']:.2f} min")
+
+if __name__ == "__main__":
+    main()